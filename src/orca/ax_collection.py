@@ -47,6 +47,12 @@ from .ax_object import AXObject
 class AXCollection:
     """Utilities for obtaining objects via the collection interface."""
 
+    # Match rules are immutable once created, so each distinct set of criteria
+    # only needs to be turned into a rule once.
+    MATCH_RULES = {}
+    MATCH_RULES_MAX_SIZE = 500
+    MATCH_RULES_STATS = {"hits": 0, "misses": 0}
+
     # Too many arguments and too many local variables.
     # This function wraps Atspi.MatchRule.new which has all the arguments.
     # pylint: disable=R0913,R0914
@@ -62,6 +68,29 @@ class AXCollection:
                           invert=False):
         """Creates a match rule based on the supplied criteria."""
 
+        key = (tuple(sorted(set(states or []))),
+               state_match_type,
+               tuple(attributes or []),
+               attribute_match_type,
+               tuple(sorted(set(roles or []))),
+               role_match_type,
+               tuple(sorted(set(interfaces or []))),
+               interface_match_type,
+               invert)
+        rule = AXCollection.MATCH_RULES.get(key)
+        if rule is not None:
+            AXCollection.MATCH_RULES_STATS["hits"] += 1
+            return rule
+
+        AXCollection.MATCH_RULES_STATS["misses"] += 1
+        if len(AXCollection.MATCH_RULES) >= AXCollection.MATCH_RULES_MAX_SIZE:
+            msg = (
+                f"AXCollection: Clearing {len(AXCollection.MATCH_RULES)} match rules. "
+                f"{AXCollection.MATCH_RULES_STATS}"
+            )
+            debug.println(debug.LEVEL_INFO, msg, True)
+            AXCollection.MATCH_RULES.clear()
+
         state_set = Atspi.StateSet()
         if states:
             for state in states:
@@ -70,12 +99,12 @@ class AXCollection:
         attributes_dict = {}
         if attributes:
             for attr in attributes:
-                key, value = attr.split(":", 1)
+                name, value = attr.split(":", 1)
                 value = value.replace(":", r"\:")
-                if key in attributes_dict:
-                    attributes_dict[key] = attributes_dict[key] + ":" + value
+                if name in attributes_dict:
+                    attributes_dict[name] = attributes_dict[name] + ":" + value
                 else:
-                    attributes_dict[key] = value
+                    attributes_dict[name] = value
 
         try:
             rule = Atspi.MatchRule.new(state_set,
@@ -92,6 +121,7 @@ class AXCollection:
             debug.println(debug.LEVEL_INFO, msg, True)
             return None
 
+        AXCollection.MATCH_RULES[key] = rule
         return rule
     # pylint: enable=R0913,R0914
 
@@ -48,10 +48,26 @@ from . import debug
 class AXObject:
     """Utilities for obtaining information about accessible objects."""
 
-    KNOWN_DEAD = []
+    # Known-dead objects are kept in two generations. New entries go into the
+    # current generation. Each time the stored data is cleared, or the current
+    # generation reaches KNOWN_DEAD_MAX_SIZE, the previous generation is evicted
+    # and the current one takes its place.
+    KNOWN_DEAD = set()
+    KNOWN_DEAD_PREVIOUS = set()
+    KNOWN_DEAD_MAX_SIZE = 5000
+    KNOWN_DEAD_STATS = {"hits": 0, "inserts": 0, "evictions": 0}
     REAL_APP_FOR_MUTTER_FRAME = {}
     REAL_FRAME_FOR_MUTTER_FRAME = {}
 
+    # Optional cache of frequently-requested properties. Entries are removed by
+    # the event manager when it receives events indicating the property changed.
+    # They are keyed by the object itself rather than by its hash, so that the
+    # object stays alive, and its address cannot be reused, while it is cached.
+    PROPERTY_CACHE_ENABLED = False
+    PROPERTY_CACHE = {}
+    PROPERTY_CACHE_STATS = {"hits": 0, "misses": 0}
+    _NOT_CACHED = object()
+
     _lock = threading.Lock()
 
     @staticmethod
@@ -61,9 +77,12 @@ class AXObject:
         while True:
             time.sleep(60)
             with AXObject._lock:
-                msg = f"AXObject: Clearing {len(AXObject.KNOWN_DEAD)} known-dead objects"
+                msg = (
+                    f"AXObject: Expiring {len(AXObject.KNOWN_DEAD_PREVIOUS)} known-dead objects. "
+                    f"{AXObject.get_known_dead_stats()}"
+                )
                 debug.println(debug.LEVEL_INFO, msg, True)
-                AXObject.KNOWN_DEAD.clear()
+                AXObject._start_new_known_dead_generation()
 
                 msg = (
                     f"AXObject: Clearing {len(AXObject.REAL_APP_FOR_MUTTER_FRAME)} "
@@ -79,6 +98,105 @@ class AXObject:
                 debug.println(debug.LEVEL_INFO, msg, True)
                 AXObject.REAL_FRAME_FOR_MUTTER_FRAME.clear()
 
+                if AXObject.PROPERTY_CACHE_ENABLED:
+                    msg = (
+                        f"AXObject: Clearing properties of {len(AXObject.PROPERTY_CACHE)} "
+                        f"objects. {AXObject.get_property_cache_stats()}"
+                    )
+                    debug.println(debug.LEVEL_INFO, msg, True)
+                    AXObject.PROPERTY_CACHE.clear()
+
+    @staticmethod
+    def _start_new_known_dead_generation():
+        """Evicts the previous generation of known-dead objects. The caller
+        must hold AXObject._lock."""
+
+        AXObject.KNOWN_DEAD_STATS["evictions"] += len(AXObject.KNOWN_DEAD_PREVIOUS)
+        AXObject.KNOWN_DEAD_PREVIOUS = AXObject.KNOWN_DEAD
+        AXObject.KNOWN_DEAD = set()
+
+    @staticmethod
+    def _add_known_dead(obj):
+        """Adds obj to the known-dead objects."""
+
+        with AXObject._lock:
+            if len(AXObject.KNOWN_DEAD) >= AXObject.KNOWN_DEAD_MAX_SIZE:
+                msg = "AXObject: Known-dead objects reached maximum size."
+                debug.println(debug.LEVEL_INFO, msg, True)
+                AXObject._start_new_known_dead_generation()
+
+            AXObject.KNOWN_DEAD.add(hash(obj))
+            AXObject.KNOWN_DEAD_STATS["inserts"] += 1
+
+    @staticmethod
+    def get_known_dead_stats():
+        """Returns a string describing the known-dead object registry."""
+
+        stats = AXObject.KNOWN_DEAD_STATS
+        return (
+            f"Known dead: {len(AXObject.KNOWN_DEAD)} current, "
+            f"{len(AXObject.KNOWN_DEAD_PREVIOUS)} previous. "
+            f"Hits: {stats['hits']}, inserts: {stats['inserts']}, "
+            f"evictions: {stats['evictions']}"
+        )
+
+    @staticmethod
+    def set_property_cache_enabled(enabled):
+        """Turns the caching of properties on or off."""
+
+        msg = f"AXObject: Setting property cache enabled to {enabled}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+        AXObject.PROPERTY_CACHE_ENABLED = enabled
+        AXObject.PROPERTY_CACHE.clear()
+
+    @staticmethod
+    def _get_cached_property(obj, property_name):
+        """Returns the cached value of property_name for obj, or _NOT_CACHED."""
+
+        if not AXObject.PROPERTY_CACHE_ENABLED:
+            return AXObject._NOT_CACHED
+
+        value = AXObject.PROPERTY_CACHE.get(obj, {}).get(
+            property_name, AXObject._NOT_CACHED)
+        if value is AXObject._NOT_CACHED:
+            AXObject.PROPERTY_CACHE_STATS["misses"] += 1
+        else:
+            AXObject.PROPERTY_CACHE_STATS["hits"] += 1
+
+        return value
+
+    @staticmethod
+    def _set_cached_property(obj, property_name, value):
+        """Caches value as the value of property_name for obj."""
+
+        if not AXObject.PROPERTY_CACHE_ENABLED:
+            return
+
+        AXObject.PROPERTY_CACHE.setdefault(obj, {})[property_name] = value
+
+    @staticmethod
+    def invalidate_cached_properties(obj, property_names=None):
+        """Removes the cached values of property_names, or all properties, for obj."""
+
+        if not AXObject.PROPERTY_CACHE_ENABLED:
+            return
+
+        if property_names is None:
+            AXObject.PROPERTY_CACHE.pop(obj, None)
+            return
+
+        cached = AXObject.PROPERTY_CACHE.get(obj)
+        if not cached:
+            return
+
+        for name in property_names:
+            cached.pop(name, None)
+
+    @staticmethod
+    def get_property_cache_stats():
+        """Returns a copy of the hit and miss counts of the property cache."""
+
+        return dict(AXObject.PROPERTY_CACHE_STATS)
 
     @staticmethod
     def start_cache_clearing_thread():
@@ -98,7 +216,12 @@ class AXObject:
     def object_is_known_dead(obj):
         """Returns True if we know for certain this object no longer exists"""
 
-        return hash(obj) in AXObject.KNOWN_DEAD
+        key = hash(obj)
+        if key in AXObject.KNOWN_DEAD or key in AXObject.KNOWN_DEAD_PREVIOUS:
+            AXObject.KNOWN_DEAD_STATS["hits"] += 1
+            return True
+
+        return False
 
     @staticmethod
     def handle_error(obj, error, msg):
@@ -106,10 +229,10 @@ class AXObject:
 
         error = str(error)
         if re.search(r"accessible/\d+ does not exist", error):
-            AXObject.KNOWN_DEAD.append(hash(obj))
+            AXObject._add_known_dead(obj)
             msg = msg.replace(error, "object no longer exists")
         elif re.search(r"The application no longer exists", error):
-            AXObject.KNOWN_DEAD.append(hash(obj))
+            AXObject._add_known_dead(obj)
             msg = msg.replace(error, "app no longer exists")
 
         debug.println(debug.LEVEL_INFO, msg, True)
@@ -398,6 +521,10 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return None
 
+        parent = AXObject._get_cached_property(obj, "parent")
+        if parent is not AXObject._NOT_CACHED:
+            return parent
+
         try:
             parent = Atspi.Accessible.get_parent(obj)
         except Exception as error:
@@ -410,6 +537,7 @@ class AXObject:
             debug.println(debug.LEVEL_INFO, msg, True)
             return None
 
+        AXObject._set_cached_property(obj, "parent", parent)
         return parent
 
     @staticmethod
@@ -580,8 +708,8 @@ class AXObject:
 
         start = time.time()
         result = AXObject._find_descendant(obj, pred)
-        msg = f"AXObject: find_descendant: found {result} in {time.time() - start:.4f}s"
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(debug.LEVEL_INFO, "AXObject: find_descendant: found %s in %.4fs",
+                        result, time.time() - start, timestamp=True)
         return result
 
     @staticmethod
@@ -607,11 +735,9 @@ class AXObject:
         start = time.time()
         matches = []
         AXObject._find_all_descendants(root, include_if, exclude_if, matches)
-        msg = (
-            f"AXObject: find_all_descendants: {len(matches)} "
-            f"matches found in {time.time() - start:.4f}s"
-        )
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(debug.LEVEL_INFO,
+                        "AXObject: find_all_descendants: %i matches found in %.4fs",
+                        len(matches), time.time() - start, timestamp=True)
         return matches
 
     @staticmethod
@@ -621,6 +747,10 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return Atspi.Role.INVALID
 
+        role = AXObject._get_cached_property(obj, "role")
+        if role is not AXObject._NOT_CACHED:
+            return role
+
         try:
             role = Atspi.Accessible.get_role(obj)
         except Exception as error:
@@ -628,6 +758,7 @@ class AXObject:
             AXObject.handle_error(obj, error, msg)
             return Atspi.Role.INVALID
 
+        AXObject._set_cached_property(obj, "role", role)
         return role
 
     @staticmethod
@@ -653,6 +784,10 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return ""
 
+        name = AXObject._get_cached_property(obj, "name")
+        if name is not AXObject._NOT_CACHED:
+            return name
+
         try:
             name = Atspi.Accessible.get_name(obj)
         except Exception as error:
@@ -660,6 +795,7 @@ class AXObject:
             AXObject.handle_error(obj, error, msg)
             return ""
 
+        AXObject._set_cached_property(obj, "name", name)
         return name
 
     @staticmethod
@@ -695,6 +831,10 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return 0
 
+        count = AXObject._get_cached_property(obj, "child_count")
+        if count is not AXObject._NOT_CACHED:
+            return count
+
         try:
             count = Atspi.Accessible.get_child_count(obj)
         except Exception as error:
@@ -702,6 +842,7 @@ class AXObject:
             AXObject.handle_error(obj, error, msg)
             return 0
 
+        AXObject._set_cached_property(obj, "child_count", count)
         return count
 
     @staticmethod
@@ -821,6 +962,10 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return Atspi.StateSet()
 
+        state_set = AXObject._get_cached_property(obj, "state_set")
+        if state_set is not AXObject._NOT_CACHED:
+            return state_set
+
         try:
             state_set = Atspi.Accessible.get_state_set(obj)
         except Exception as error:
@@ -828,6 +973,7 @@ class AXObject:
             AXObject.handle_error(obj, error, msg)
             return Atspi.StateSet()
 
+        AXObject._set_cached_property(obj, "state_set", state_set)
         return state_set
 
     @staticmethod
@@ -1078,6 +1224,11 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return
 
+        if recursive:
+            AXObject.PROPERTY_CACHE.clear()
+        else:
+            AXObject.invalidate_cached_properties(obj)
+
         if not recursive:
             try:
                 Atspi.Accessible.clear_cache_single(obj)
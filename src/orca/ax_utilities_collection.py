@@ -84,15 +84,15 @@ class AXUtilitiesCollection:
             return []
 
         start = time.time()
-        msg = (
-            f"AXUtilitiesCollection: Applying predicate "
-            f"{AXUtilitiesCollection._get_function_string(pred)}"
-        )
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(
+            debug.LEVEL_INFO,
+            lambda: "AXUtilitiesCollection: Applying predicate "
+                    f"{AXUtilitiesCollection._get_function_string(pred)}",
+            timestamp=True)
 
         matches = list(filter(pred, matches))
-        msg = f"AXUtilitiesCollection: {len(matches)} matches found in {time.time() - start:.4f}s"
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(debug.LEVEL_INFO, "AXUtilitiesCollection: %i matches found in %.4fs",
+                        len(matches), time.time() - start, timestamp=True)
         return matches
 
     @staticmethod
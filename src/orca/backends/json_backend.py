@@ -27,12 +27,21 @@ __date__      = "$Date$"
 __copyright__ = "Copyright (c) 2010-2011 Consorcio Fernando de los Rios."
 __license__   = "LGPL"
 
-from json import load, dump
+from json import load, dump, loads, dumps
+import atexit
+import copy
 import os
-from orca import settings, acss
+import stat
+import tempfile
+import threading
+from orca import settings, acss, debug
 
 class Backend:
 
+    # Changes are written this many seconds after the last change, so that
+    # several changes in a row are written together.
+    WRITE_DELAY = 0.5
+
     def __init__(self, prefsDir):
         """ Initialize the JSON Backend.
         """ 
@@ -43,12 +52,137 @@ class Backend:
         self.settingsFile = os.path.join(prefsDir, "user-settings.conf")
         self.appPrefsDir = os.path.join(prefsDir, "app-settings")
 
+        # The parsed contents of each settings file, along with the stamp of
+        # the version of the file they were parsed from. See _load().
+        self._documents = {}
+        self._settingsStamp = None
+        self._writes = 0
+
+        # The general settings of each profile, and the (app, profile)
+        # views built from them, along with the stamps they were built from.
+        self._profileGeneral = {}
+        self._resolved = {}
+
+        # The new contents of the files which have changed but have not been
+        # written yet. The timer and flush() write them.
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
         self._defaultProfiles = {'default': { 'profile':  settings.profile,
                                                           'pronunciations': {},
                                                           'keybindings': {}
                                             }
                                 }
 
+    def _getStamp(self, fileName):
+        """Returns something which changes whenever fileName is rewritten,
+        or None if fileName does not exist."""
+
+        try:
+            info = os.stat(fileName)
+        except FileNotFoundError:
+            return None
+
+        # The modification time may not change if the file is written twice
+        # in quick succession, so our own writes are counted as well.
+        return info.st_mtime_ns, info.st_size, info.st_ino, self._writes
+
+    def _load(self, fileName):
+        """Returns the stamp of fileName and its parsed contents, which are
+        only parsed again if the file has changed since they were last
+        parsed. Changes which have not been written yet are included. The
+        contents are shared, and must not be modified."""
+
+        with self._lock:
+            prefs = self._pending.get(fileName)
+            if prefs is not None:
+                return ('pending', self._writes), prefs
+
+            stamp = self._getStamp(fileName)
+            if stamp is None:
+                self._documents.pop(fileName, None)
+                raise FileNotFoundError(fileName)
+
+            cached = self._documents.get(fileName)
+            if cached is not None and cached[0] == stamp:
+                return cached
+
+            with open(fileName) as settingsFile:
+                prefs = load(settingsFile)
+            self._documents[fileName] = stamp, prefs
+            return stamp, prefs
+
+    def _getDocument(self, fileName):
+        """Returns a copy of the contents of fileName which can be modified
+        and passed to _setDocument()."""
+
+        _stamp, prefs = self._load(fileName)
+        return copy.deepcopy(prefs)
+
+    def _setDocument(self, fileName, prefs):
+        """Replaces the contents of fileName with prefs. The file is written
+        WRITE_DELAY seconds after the last change, or by flush()."""
+
+        # Converting prefs now means that anything which cannot be saved is
+        # reported to the caller, and that readers see what a reread would.
+        prefs = loads(dumps(prefs))
+
+        with self._lock:
+            self._pending[fileName] = prefs
+            self._writes += 1
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.WRITE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @staticmethod
+    def _write(fileName, prefs):
+        """Writes prefs to fileName by writing a temporary file and renaming
+        it, so that fileName is never left partially written."""
+
+        directory, name = os.path.split(fileName)
+        fd, tempName = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as settingsFile:
+                dump(prefs, settingsFile, indent=4)
+                settingsFile.flush()
+                os.fsync(settingsFile.fileno())
+            if os.path.exists(fileName):
+                os.chmod(tempName, stat.S_IMODE(os.stat(fileName).st_mode))
+            os.replace(tempName, fileName)
+        except BaseException:
+            try:
+                os.unlink(tempName)
+            except OSError:
+                pass
+            raise
+
+    def flush(self):
+        """Writes the changes which have not been written yet."""
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            pending, self._pending = self._pending, {}
+            for fileName, prefs in pending.items():
+                try:
+                    self._write(fileName, prefs)
+                except OSError as error:
+                    msg = f"JSON BACKEND: Could not write {fileName}: {error}"
+                    debug.println(debug.LEVEL_SEVERE, msg, True)
+                    self._pending.setdefault(fileName, prefs)
+                    continue
+
+                self._documents.pop(fileName, None)
+                self._writes += 1
+                msg = f"JSON BACKEND: Wrote {fileName}"
+                debug.println(debug.LEVEL_INFO, msg, True)
+
     def saveDefaultSettings(self, general, pronunciations, keybindings):
         """ Save default settings for all the properties from
             orca.settings. """
@@ -62,20 +196,41 @@ class Backend:
         self.pronunciations = pronunciations
         self.keybindings = keybindings
 
-        settingsFile = open(self.settingsFile, 'w')
-        dump(prefs, settingsFile, indent=4)
-        settingsFile.close()
+        self._setDocument(self.settingsFile, prefs)
+
+    def _getAppSettings(self, appName):
+        """Returns the stamp and the shared, parsed contents of the settings
+        file of appName."""
 
-    def getAppSettings(self, appName):
         fileName = os.path.join(self.appPrefsDir, f"{appName}.conf")
-        if os.path.exists(fileName):
-            settingsFile = open(fileName, 'r')
-            prefs = load(settingsFile)
-            settingsFile.close()
-        else:
-            prefs = {}
+        try:
+            return self._load(fileName)
+        except FileNotFoundError:
+            return None, {}
 
-        return prefs
+    def getAppSettings(self, appName):
+        _stamp, prefs = self._getAppSettings(appName)
+        return copy.deepcopy(prefs)
+
+    def getResolvedSettings(self, profile, appName):
+        """Returns a (appGeneral, general) tuple: the general settings of
+        appName in profile, and the general settings of profile. These are
+        built once for each profile and app, and only rebuilt when one of
+        the settings files changes. They are shared, and must not be
+        modified."""
+
+        general = self._getProfileGeneral(profile)
+        appStamp, appPrefs = self._getAppSettings(appName)
+        key = profile, appName
+        stamps = self._settingsStamp, appStamp
+        cached = self._resolved.get(key)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+
+        profilePrefs = appPrefs.get('profiles', {}).get(profile, {})
+        view = profilePrefs.get('general', {}), general
+        self._resolved[key] = stamps, view
+        return view
 
     def saveAppSettings(self, appName, profile, general, pronunciations, keybindings):
         prefs = self.getAppSettings(appName)
@@ -86,9 +241,7 @@ class Backend:
         prefs['profiles'] = profiles
 
         fileName = os.path.join(self.appPrefsDir, f"{appName}.conf")
-        settingsFile = open(fileName, 'w')
-        dump(prefs, settingsFile, indent=4)
-        settingsFile.close()
+        self._setDocument(fileName, prefs)
 
     def saveProfileSettings(self, profile, general,
                                   pronunciations, keybindings):
@@ -99,35 +252,41 @@ class Backend:
         general['pronunciations'] = pronunciations
         general['keybindings'] = keybindings
 
-        with open(self.settingsFile, 'r+') as settingsFile:
-            prefs = load(settingsFile)
-            prefs['profiles'][profile] = general
-            settingsFile.seek(0)
-            settingsFile.truncate()
-            dump(prefs, settingsFile, indent=4)
+        prefs = self._getDocument(self.settingsFile)
+        prefs['profiles'][profile] = general
+        self._setDocument(self.settingsFile, prefs)
 
     def _getSettings(self):
         """ Load from config file all settings """
-        settingsFile = open(self.settingsFile)
         try:
-            prefs = load(settingsFile)
+            stamp, prefs = self._load(self.settingsFile)
         except ValueError:
             return
-        self.general = prefs['general'].copy()
+        if stamp == self._settingsStamp:
+            return
+
+        prefs = copy.deepcopy(prefs)
+        self.general = prefs['general']
         self.pronunciations = prefs['pronunciations']
         self.keybindings = prefs['keybindings']
-        self.profiles = prefs['profiles'].copy()
+        self.profiles = prefs['profiles']
+        self._settingsStamp = stamp
+        self._profileGeneral = {}
 
-    def getGeneral(self, profile=None):
-        """ Get general settings from default settings and
-            override with profile values. """
+    def _getProfileGeneral(self, profile=None):
+        """Returns the general settings of profile, overridden by the values
+        in the profile. These are shared, and must not be modified."""
         self._getSettings()
-        generalSettings = self.general.copy()
-        defaultProfile = generalSettings.get('startingProfile',
-                                             ['Default', 'default'])
+        defaultProfile = self.general.get('startingProfile',
+                                          ['Default', 'default'])
         if profile is None:
             profile = defaultProfile[1]
-        profileSettings = self.profiles[profile].copy()
+        generalSettings = self._profileGeneral.get(profile)
+        if generalSettings is not None:
+            return generalSettings
+
+        generalSettings = self.general.copy()
+        profileSettings = copy.deepcopy(self.profiles[profile])
         for key, value in profileSettings.items():
             if key == 'voices':
                 for voiceType, voiceDef in value.items():
@@ -138,42 +297,46 @@ class Backend:
             generalSettings['activeProfile'] = profileSettings['profile']
         except KeyError:
             generalSettings['activeProfile'] = defaultProfile
+        self._profileGeneral[profile] = generalSettings
         return generalSettings
 
+    def getGeneral(self, profile=None):
+        """ Get general settings from default settings and
+            override with profile values. """
+        return copy.deepcopy(self._getProfileGeneral(profile))
+
     def getPronunciations(self, profile='default'):
         """ Get pronunciation settings from default settings and
             override with profile values. """
         self._getSettings()
-        pronunciations = self.pronunciations.copy()
-        profileSettings = self.profiles[profile].copy()
+        pronunciations = self.pronunciations
+        profileSettings = self.profiles[profile]
         if 'pronunciations' in profileSettings:
             pronunciations = profileSettings['pronunciations']
-        return pronunciations
+        return copy.deepcopy(pronunciations)
 
     def getKeybindings(self, profile='default'):
         """ Get keybindings settings from default settings and
             override with profile values. """
         self._getSettings()
-        keybindings = self.keybindings.copy()
-        profileSettings = self.profiles[profile].copy()
+        keybindings = self.keybindings
+        profileSettings = self.profiles[profile]
         if 'keybindings' in profileSettings:
             keybindings = profileSettings['keybindings']
-        return keybindings
+        return copy.deepcopy(keybindings)
 
     def isFirstStart(self):
         """ Check if we're in first start. """
  
-        return not os.path.exists(self.settingsFile)
+        return self.settingsFile not in self._pending \
+            and not os.path.exists(self.settingsFile)
 
     def _setProfileKey(self, key, value):
         self.general[key] = value
 
-        with open(self.settingsFile, 'r+') as settingsFile:
-            prefs = load(settingsFile)
-            prefs['general'][key] = value
-            settingsFile.seek(0)
-            settingsFile.truncate()
-            dump(prefs, settingsFile, indent=4)
+        prefs = self._getDocument(self.settingsFile)
+        prefs['general'][key] = value
+        self._setDocument(self.settingsFile, prefs)
 
     def setFirstStart(self, value=False):
         """Set firstStart. This user-configurable setting is primarily
@@ -205,10 +368,7 @@ class Backend:
         if profile in self.profiles:
             removeProfileFrom(self.profiles)
 
-        with open(self.settingsFile, 'r+') as settingsFile:
-            prefs = load(settingsFile)
-            if profile in prefs['profiles']:
-                removeProfileFrom(prefs['profiles'])
-                settingsFile.seek(0)
-                settingsFile.truncate()
-                dump(prefs, settingsFile, indent=4)
+        prefs = self._getDocument(self.settingsFile)
+        if profile in prefs['profiles']:
+            removeProfileFrom(prefs['profiles'])
+            self._setDocument(self.settingsFile, prefs)
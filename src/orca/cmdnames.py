@@ -522,6 +522,11 @@ CYCLE_KEY_ECHO = _("Cycle to the next key echo level")
 # information that Orca generates at run time.
 CYCLE_DEBUG_LEVEL = _("Cycle the debug level at run time")
 
+# Translators: this is a debug message that Orca users will not normally see. It
+# describes a debug routine that saves statistics about how long Orca took to
+# process the accessibility events it received to a file.
+DUMP_EVENT_STATISTICS = _("Save event processing statistics")
+
 # Translators: this command announces information regarding the relationship of
 # the given bookmark to the current position. Note that in this context, the
 # "bookmark" is storing the location of an accessible object, typically on a web
@@ -64,6 +64,9 @@ keymap = (
     ("", defaultModifierMask, NO_MODIFIER_MASK,
     "cycleDebugLevelHandler"),
 
+    ("", defaultModifierMask, NO_MODIFIER_MASK,
+    "dumpEventStatisticsHandler"),
+
     ("", defaultModifierMask, NO_MODIFIER_MASK,
     "panBrailleLeftHandler"),
 
@@ -28,7 +28,11 @@ __date__      = "$Date$"
 __copyright__ = "Copyright (c) 2005-2008 Sun Microsystems Inc."
 __license__   = "LGPL"
 
+import atexit
 import inspect
+import queue
+import threading
+import time
 import traceback
 import os
 import subprocess
@@ -126,6 +130,20 @@ eventDebugFilter = None
 #
 debugEventQueue = False
 
+# If True, output destined for debugFile is handed off to a background
+# thread so that slow disks do not block the main loop. Text is still
+# formatted (and timestamped) by the caller, so line order and times
+# are preserved. debugQueueSize bounds the number of pending lines. If
+# debugQueueBlockWhenFull is True, callers wait for room when the queue
+# is full; otherwise the line is dropped and the number of dropped lines
+# is reported in the log. Pending output is flushed to disk at least
+# every debugFlushInterval seconds.
+#
+debugFileAsync = True
+debugQueueSize = 10000
+debugQueueBlockWhenFull = True
+debugFlushInterval = 1.0
+
 # What module(s) should be traced if traceit is being used. By default
 # we'll just attend to ourself. (And by default, we will not enable
 # traceit.) Note that enabling this functionality will drag your system
@@ -173,6 +191,112 @@ TRACE_ONLY_PROCESSING_EVENTS = True
 
 objEvent = None
 
+class _DebugFileWriter(threading.Thread):
+    """Writes queued debug output to its file from a background thread."""
+
+    def __init__(self):
+        super().__init__(name="orca-debug-writer", daemon=True)
+        self._queue = queue.Queue(maxsize=max(0, debugQueueSize))
+        self._dropped = 0
+        self._droppedLock = threading.Lock()
+
+    def put(self, file, text):
+        """Queues text to be written to file, applying the queue-full policy."""
+
+        with self._droppedLock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            text = f"DEBUG: {dropped} debug message(s) dropped; queue was full.\n{text}"
+
+        try:
+            self._queue.put((file, text), block=debugQueueBlockWhenFull)
+        except queue.Full:
+            with self._droppedLock:
+                self._dropped += dropped + 1
+
+    def flush(self, timeout=5.0):
+        """Waits up to timeout seconds for pending output to be written."""
+
+        if not self.is_alive():
+            return
+
+        done = threading.Event()
+        try:
+            self._queue.put((None, done), timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def run(self):
+        files = set()
+        lastFlush = time.monotonic()
+        while True:
+            try:
+                file, text = self._queue.get(timeout=debugFlushInterval)
+            except queue.Empty:
+                file, text = None, None
+
+            if file is not None:
+                files.add(file)
+                try:
+                    file.write(text)
+                except Exception:
+                    pass
+
+            if text is None or isinstance(text, threading.Event) \
+               or time.monotonic() - lastFlush >= debugFlushInterval:
+                for f in files:
+                    try:
+                        f.flush()
+                    except Exception:
+                        pass
+                files.clear()
+                lastFlush = time.monotonic()
+
+            if isinstance(text, threading.Event):
+                text.set()
+
+_writer = None
+_writerLock = threading.Lock()
+
+def _getWriter():
+    global _writer
+
+    if _writer is None:
+        with _writerLock:
+            if _writer is None:
+                _writer = _DebugFileWriter()
+                _writer.start()
+                atexit.register(flush)
+
+    return _writer
+
+def _write(text):
+    """Writes text, which should include any trailing newline, to the
+    debug output."""
+
+    if not debugFile:
+        sys.stderr.write(text)
+        return
+
+    if debugFileAsync:
+        _getWriter().put(debugFile, text)
+        return
+
+    debugFile.write(text)
+
+def flush(timeout=5.0):
+    """Blocks until pending debug output has been written to debugFile,
+    or until timeout seconds have passed."""
+
+    if _writer is not None:
+        _writer.flush(timeout)
+    elif debugFile:
+        try:
+            debugFile.flush()
+        except Exception:
+            pass
+
 def printException(level):
     """Prints out information regarding the current exception.
 
@@ -181,9 +305,7 @@ def printException(level):
     """
 
     if level >= debugLevel:
-        println(level)
-        traceback.print_exc(100, debugFile)
-        println(level)
+        _write(f"\n{traceback.format_exc(100)}\n")
 
 def printStack(level):
     """Prints out the current stack.
@@ -193,9 +315,7 @@ def printStack(level):
     """
 
     if level >= debugLevel:
-        println(level)
-        traceback.print_stack(None, 100, debugFile)
-        println(level)
+        _write(f"\n{''.join(traceback.format_stack(None, 100))}\n")
 
 def println(level, text="", timestamp=False):
     """Prints the text to stderr unless debug is enabled.
@@ -213,24 +333,33 @@ def println(level, text="", timestamp=False):
         if timestamp:
             text = text.replace("\n", f"\n{' ' * 18}")
             text = f"{datetime.now().strftime('%H:%M:%S.%f')} - {text}"
-        if debugFile:
-            try:
-                debugFile.writelines([text, "\n"])
-            except TypeError:
-                text = "TypeError when trying to write text"
-                debugFile.writelines([text, "\n"])
-            except Exception:
-                text = "Exception when trying to write text"
-                debugFile.writelines([text, "\n"])
-        else:
-            try:
-                sys.stderr.writelines([text, "\n"])
-            except TypeError:
-                text = "TypeError when trying to write text"
-                sys.stderr.writelines([text, "\n"])
-            except Exception:
-                text = "Exception when trying to write text"
-                sys.stderr.writelines([text, "\n"])
+        try:
+            _write(f"{text}\n")
+        except TypeError:
+            _write("TypeError when trying to write text\n")
+        except Exception:
+            _write("Exception when trying to write text\n")
+
+def printLazy(level, text, *args, timestamp=False):
+    """Like println, but the message is only built if level is enabled.
+
+    Arguments:
+    - level: the accepted debug level
+    - text: a %-style format string to be combined with args, or a
+      callable returning the text to print
+    - args: the arguments for the format string
+    - timestamp: if True, prefix the text with the current time
+    """
+
+    if level < debugLevel:
+        return
+
+    if callable(text):
+        text = text()
+    elif args:
+        text = text % args
+
+    println(level, text, timestamp)
 
 def printResult(level, result=None):
     """Prints the return result, along with information about the
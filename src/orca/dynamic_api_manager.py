@@ -1,8 +1,16 @@
 import gi
+import importlib
 from gi.repository import GObject
 
 from orca import resource_manager
 
+class DeferredModule():
+    """An API which is a module, imported the first time it is requested."""
+    def __init__(self, name):
+        self.name = name
+    def load(self):
+        return importlib.import_module(self.name)
+
 class DynamicApiManager():
     def __init__(self, app):
         self.app = app
@@ -38,17 +46,27 @@ class DynamicApiManager():
         if resourceContext:
             resourceContext.removeAPI(application, key)
         return ok
+    def registerModuleAPI(self, key, moduleName, application = ''):
+        # the module is not imported until the API is requested
+        self.registerAPI(key, DeferredModule(moduleName), application)
+    def _resolveAPI(self, application, key, api):
+        # imports a deferred module; an ImportError is not a missing key,
+        # so it is left to the caller
+        if isinstance(api, DeferredModule):
+            api = self.api[application][key] = api.load()
+        return api
     def getAPI(self, key, application = '', fallback = True):
         # get dynamic API
         api = None
         
         try:
             api = self.api[application][key]
-            return api
         except:
             if not fallback:
                 print('API Key: "{}/{}" not found,'.format(application, key))
                 return None
+        else:
+            return self._resolveAPI(application, key, api)
 
         # we already tried this
         if application == '':
@@ -58,5 +76,6 @@ class DynamicApiManager():
             api = self.api[application]['']
         except:
             print('API Key: "{}/{}" not found,'.format(application, key))
-        
-        return api
+            return api
+
+        return self._resolveAPI(application, '', api)
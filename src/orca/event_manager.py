@@ -28,20 +28,215 @@ import gi
 gi.require_version('Atspi', '2.0') 
 from gi.repository import Atspi
 from gi.repository import GLib
+import bisect
+import collections
+import json
+import os
 import queue
 import threading
 import time
 
 from . import debug
+from . import event_recorder
 from . import input_event
 from . import orca_state
 from . import script_manager
 from . import settings
+from . import settings_manager
 from .ax_object import AXObject
 from .ax_utilities import AXUtilities
 
 _scriptManager = script_manager.getManager()
 
+class _EventQueue:
+    """A FIFO of events which indexes the queued object events so that
+    duplicate and superseded events can be found in constant time, and
+    so that events of a given type can be removed without rebuilding
+    the queue."""
+
+    def __init__(self, coalescableEvents=()):
+        self._lock = threading.Lock()
+        self._events = collections.OrderedDict()
+        self._serial = 0
+        self._times = {}
+        self._keys = {}
+        self._latest = {}
+        self._byType = {}
+        self._bySource = {}
+        self._coalescableEvents = tuple(coalescableEvents)
+
+    @staticmethod
+    def _isObjectEvent(event):
+        return not isinstance(event, input_event.InputEvent)
+
+    @staticmethod
+    def _getKey(event):
+        key = event.type, event.source, event.detail1, event.detail2, event.any_data
+        try:
+            hash(key)
+        except TypeError:
+            key = event.type, event.source, event.detail1, event.detail2, str(event.any_data)
+        return key
+
+    def _isCoalescable(self, event):
+        return self._coalescableEvents and event.type.startswith(self._coalescableEvents)
+
+    @staticmethod
+    def _addToBucket(buckets, name, serial):
+        # Dictionaries rather than sets so that the order is retained.
+        buckets.setdefault(name, {})[serial] = None
+
+    @staticmethod
+    def _removeFromBucket(buckets, name, serial):
+        bucket = buckets.get(name)
+        if bucket is None:
+            return
+        bucket.pop(serial, None)
+        if not bucket:
+            del buckets[name]
+
+    def _remove(self, serial):
+        event = self._events.pop(serial)
+        self._times.pop(serial, None)
+        if not self._isObjectEvent(event):
+            return event
+
+        key = self._getKey(event)
+        count = self._keys.get(key, 0) - 1
+        if count > 0:
+            self._keys[key] = count
+        else:
+            self._keys.pop(key, None)
+
+        if self._latest.get((event.type, event.source)) == serial:
+            del self._latest[(event.type, event.source)]
+
+        self._removeFromBucket(self._byType, event.type, serial)
+        self._removeFromBucket(self._bySource, event.source, serial)
+        return event
+
+    def put(self, event):
+        """Adds event to the end of the queue. If event supersedes an event
+        already in the queue, that event is removed and returned."""
+
+        superseded = None
+        with self._lock:
+            self._serial += 1
+            if self._isObjectEvent(event):
+                key = self._getKey(event)
+                self._keys[key] = self._keys.get(key, 0) + 1
+                if self._isCoalescable(event):
+                    serial = self._latest.get((event.type, event.source))
+                    if serial is not None:
+                        superseded = self._remove(serial)
+                    self._latest[(event.type, event.source)] = self._serial
+                self._addToBucket(self._byType, event.type, self._serial)
+                self._addToBucket(self._bySource, event.source, self._serial)
+            self._events[self._serial] = event
+            self._times[self._serial] = time.monotonic()
+
+        return superseded
+
+    def get_nowait(self):
+        """Removes and returns the event at the front of the queue."""
+
+        return self.getWithWaitTime()[0]
+
+    def getWithWaitTime(self):
+        """Removes the event at the front of the queue and returns it along
+        with the number of seconds it spent in the queue."""
+
+        with self._lock:
+            if not self._events:
+                raise queue.Empty
+            serial = next(iter(self._events))
+            waitTime = time.monotonic() - self._times[serial]
+            return self._remove(serial), waitTime
+
+    def removeEvents(self, eventTypes, exceptSource=None):
+        """Removes all the queued events whose type is in eventTypes, other
+        than those from exceptSource, and returns them. The relative order
+        of the remaining events is unchanged."""
+
+        removed = []
+        with self._lock:
+            keep = self._bySource.get(exceptSource, {}) if exceptSource is not None else {}
+            for eventType in eventTypes:
+                serials = self._byType.get(eventType)
+                if not serials:
+                    continue
+                for serial in [x for x in serials if x not in keep]:
+                    removed.append(self._remove(serial))
+
+        return removed
+
+    def contains(self, event):
+        """Returns True if an event equivalent to event is in the queue."""
+
+        with self._lock:
+            return self._getKey(event) in self._keys
+
+    def qsize(self):
+        return len(self._events)
+
+    def empty(self):
+        return not self._events
+
+class _EventStatistics:
+    """Counts of processed events along with histograms of how long they
+    waited in the queue and how long they took to process, grouped by
+    event type and by script."""
+
+    # Upper bounds, in seconds, of the histogram buckets. Anything slower
+    # than the last bound is counted in an additional overflow bucket.
+    BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._startTime = time.time()
+        self._byType = {}
+        self._byScript = {}
+
+    def _newEntry(self):
+        size = len(self.BUCKETS) + 1
+        return {"count": 0,
+                "wait": {"total": 0.0, "max": 0.0, "histogram": [0] * size},
+                "processing": {"total": 0.0, "max": 0.0, "histogram": [0] * size}}
+
+    def _update(self, entry, waitTime, processingTime):
+        entry["count"] += 1
+        for name, value in (("wait", waitTime), ("processing", processingTime)):
+            timing = entry[name]
+            timing["total"] += value
+            timing["max"] = max(timing["max"], value)
+            timing["histogram"][bisect.bisect_left(self.BUCKETS, value)] += 1
+
+    def record(self, eventType, scriptName, waitTime, processingTime):
+        """Records the timing of one processed event."""
+
+        with self._lock:
+            for groups, name in ((self._byType, eventType), (self._byScript, scriptName)):
+                entry = groups.get(name)
+                if entry is None:
+                    entry = groups[name] = self._newEntry()
+                self._update(entry, waitTime, processingTime)
+
+    def reset(self):
+        with self._lock:
+            self._startTime = time.time()
+            self._byType = {}
+            self._byScript = {}
+
+    def asDict(self):
+        """Returns a JSON-serializable copy of the statistics."""
+
+        with self._lock:
+            return {"start": self._startTime,
+                    "end": time.time(),
+                    "buckets": list(self.BUCKETS),
+                    "byType": json.loads(json.dumps(self._byType)),
+                    "byScript": json.loads(json.dumps(self._byScript))}
+
 class EventManager:
 
     EMBEDDED_OBJECT_CHARACTER = '\ufffc'
@@ -54,7 +249,6 @@ class EventManager:
         self._active = False
         self._enqueueCount = 0
         self._dequeueCount = 0
-        self._eventQueue     = queue.Queue(0)
         self._gidleId        = 0
         self._gidleLock      = threading.Lock()
         self._gilSleepTime = 0.00001
@@ -62,6 +256,15 @@ class EventManager:
         self._eventsSuspended = False
         self._listener = Atspi.EventListener.new(self._enqueue)
 
+        # While the property cache is enabled, these are listened for whether
+        # or not a script wants them, and even while events are suspended, so
+        # that no change to a cached property goes unnoticed.
+        self._cacheListener = Atspi.EventListener.new(self._invalidateCachedProperties)
+        self._cacheEventTypes = ["object:state-changed",
+                                 "object:property-change",
+                                 "object:children-changed"]
+        self._cacheListenerRegistered = False
+
         # Note: These must match what the scripts registered for, otherwise
         # Atspi might segfault.
         #
@@ -77,6 +280,43 @@ class EventManager:
         self._ignoredEvents = ['object:bounds-changed',
                                'object:state-changed:defunct',
                                'object:property-change:accessible-parent']
+
+        # Events for which only the most recent one from a given source
+        # needs to be kept in the queue.
+        self._coalescableEvents = ['object:text-caret-moved',
+                                   'object:property-change:accessible-name',
+                                   'object:property-change:accessible-description',
+                                   'object:property-change:accessible-value']
+        self._eventQueue = _EventQueue(self._coalescableEvents)
+        self._statistics = _EventStatistics()
+        self._eventScript = None
+        self._recorder = None
+
+        # Events which are not processed during a flood, or even queued during
+        # a deluge, unless they are from the locus of focus.
+        self._floodNoiseEvents = ["object:text-changed:delete",
+                                  "object:text-changed:insert",
+                                  "object:text-changed:delete:system",
+                                  "object:text-changed:insert:system",
+                                  "object:text-attributes-changed",
+                                  "object:text-caret-moved",
+                                  "object:children-changed:add",
+                                  "object:children-changed:add:system",
+                                  "object:children-changed:remove",
+                                  "object:children-changed:remove:system",
+                                  "object:property-change:accessible-name",
+                                  "object:property-change:accessible-description",
+                                  "object:selection-changed",
+                                  "object:state-changed:showing",
+                                  "object:state-changed:sensitive"]
+
+        # The flood and deluge thresholds are the number of queued events we
+        # expect to take this many seconds to process, based on the measured
+        # rate at which the queue is drained.
+        self._floodDrainTime = 0.5
+        self._delugeDrainTime = 1.0
+        self._drainRate = 100.0
+        self._drainRateMinimumBatch = 10
         self._parentsOfDefunctDescendants = []
         orca_state.device = None
         debug.println(debug.LEVEL_INFO, 'Event manager initialized', True)
@@ -89,6 +329,11 @@ class EventManager:
         orca_state.device.event_count = 0
         orca_state.device.key_watcher = \
             orca_state.device.add_key_watcher(self._processKeyboardEvent)
+        AXObject.set_property_cache_enabled(settings.enableAccessiblePropertyCache)
+        if AXObject.PROPERTY_CACHE_ENABLED:
+            self._registerCacheListener()
+        if settings.eventRecordingFile:
+            self.startRecording(settings.eventRecordingFile)
 
         self._active = True
         debug.println(debug.LEVEL_INFO, 'EVENT MANAGER: Activated', True)
@@ -98,7 +343,9 @@ class EventManager:
 
         debug.println(debug.LEVEL_INFO, 'EVENT MANAGER: Deactivating', True)
         self._active = False
-        self._eventQueue = queue.Queue(0)
+        self.stopRecording()
+        self._deregisterCacheListener()
+        self._eventQueue = _EventQueue(self._coalescableEvents)
         self._scriptListenerCounts = {}
         orca_state.device = None
         debug.println(debug.LEVEL_INFO, 'EVENT MANAGER: Deactivated', True)
@@ -116,18 +363,54 @@ class EventManager:
     def _isDuplicateEvent(self, event):
         """Returns True if this event is already in the event queue."""
 
-        def isSame(x):
-            return x.type == event.type \
-                and x.source == event.source \
-                and x.detail1 == event.detail1 \
-                and x.detail2 == event.detail2 \
-                and x.any_data == event.any_data
+        return self._eventQueue.contains(event)
 
-        for e in self._eventQueue.queue:
-            if isSame(e):
-                return True
+    def _registerCacheListener(self):
+        """Starts listening for the events which invalidate cached properties."""
 
-        return False
+        if self._cacheListenerRegistered:
+            return
+
+        msg = "EVENT MANAGER: Registering property cache listener"
+        debug.println(debug.LEVEL_INFO, msg, True)
+        for eventType in self._cacheEventTypes:
+            self._cacheListener.register(eventType)
+        self._cacheListenerRegistered = True
+
+    def _deregisterCacheListener(self):
+        """Stops listening for the events which invalidate cached properties."""
+
+        if not self._cacheListenerRegistered:
+            return
+
+        msg = "EVENT MANAGER: Deregistering property cache listener"
+        debug.println(debug.LEVEL_INFO, msg, True)
+        for eventType in self._cacheEventTypes:
+            self._cacheListener.deregister(eventType)
+        self._cacheListenerRegistered = False
+
+    def _invalidateCachedProperties(self, event):
+        """Removes the cached properties of the event source which the event
+        indicates have changed."""
+
+        if not AXObject.PROPERTY_CACHE_ENABLED:
+            return
+
+        eType = event.type
+        if eType.startswith('object:property-change:accessible-name'):
+            AXObject.invalidate_cached_properties(event.source, ['name'])
+        elif eType.startswith('object:property-change:accessible-role'):
+            AXObject.invalidate_cached_properties(event.source, ['role'])
+        elif eType.startswith('object:property-change:accessible-parent'):
+            AXObject.invalidate_cached_properties(event.source, ['parent'])
+        elif eType.startswith('object:state-changed:defunct'):
+            AXObject.invalidate_cached_properties(event.source)
+        elif eType.startswith('object:state-changed'):
+            AXObject.invalidate_cached_properties(event.source, ['state_set'])
+        elif eType.startswith('object:children-changed'):
+            AXObject.invalidate_cached_properties(event.source, ['child_count'])
+            if isinstance(event.any_data, Atspi.Accessible):
+                AXObject.invalidate_cached_properties(event.any_data)
 
     def _ignore(self, event):
         """Returns True if this event should be ignored."""
@@ -402,11 +685,14 @@ class EventManager:
         if debugging:
             debug.println(debug.LEVEL_ALL, "           ...acquired")
             debug.println(debug.LEVEL_ALL, "           calling queue.put...")
-            debug.println(debug.LEVEL_ALL, f"           (full={self._eventQueue.full()})")
+            debug.println(debug.LEVEL_ALL, f"           (size={self._eventQueue.qsize()})")
 
-        self._eventQueue.put(event)
+        superseded = self._eventQueue.put(event)
         if debugging:
             debug.println(debug.LEVEL_ALL, "           ...put complete")
+        if superseded is not None:
+            msg = f"EVENT MANAGER: Removed superseded {superseded.type} from queue"
+            debug.println(debug.LEVEL_INFO, msg, True)
 
         if asyncMode and not self._gidleId:
             if self._gilSleepTime:
@@ -523,6 +809,12 @@ class EventManager:
 
         inputEvents = (input_event.KeyboardEvent, input_event.BrailleEvent)
         isObjectEvent = not isinstance(e, inputEvents)
+        if isObjectEvent:
+            if self._recorder:
+                self._recorder.record(e)
+            # Also done by the cache listener, but it might be called after
+            # this one, and the event might be processed right away.
+            self._invalidateCachedProperties(e)
 
         try:
             ignore = isObjectEvent and self._ignore(e)
@@ -562,7 +854,7 @@ class EventManager:
 
         self._addToQueue(e, asyncMode)
         if not asyncMode:
-            self._dequeue()
+            self._dequeue(maximum=1)
 
         if debug.debugEventQueue:
             self._enqueueCount -= 1
@@ -584,9 +876,67 @@ class EventManager:
         defaultScript.idleMessage()
         return False
 
-    def _dequeue(self):
+    def _getTimeBudget(self, event):
+        """Returns the time in seconds which may be spent processing a batch
+        of events beginning with event."""
+
+        if isinstance(event, input_event.InputEvent) \
+           or not settings.eventProcessingTimeBudgetByToolkit:
+            return settings.eventProcessingTimeBudget
+
+        toolkit = AXObject.get_application_toolkit_name(event.source)
+        return settings.eventProcessingTimeBudgetByToolkit.get(
+            toolkit, settings.eventProcessingTimeBudget)
+
+    def _processEvent(self, event, waitTime=0.0):
+        """Processes a single event which has been removed from the queue."""
+
+        self._queuePrintln(event, isEnqueue=False)
+        self._eventScript = None
+        startTime = time.monotonic()
+        try:
+            self._processQueuedEvent(event)
+        finally:
+            if isinstance(event, input_event.InputEvent):
+                eventType = type(event).__name__
+                script = orca_state.activeScript
+            else:
+                eventType = event.type
+                script = self._eventScript
+            scriptName = script.name if script else "(none)"
+            self._statistics.record(eventType, scriptName, waitTime, time.monotonic() - startTime)
+
+    def _processQueuedEvent(self, event):
+        inputEvents = (input_event.KeyboardEvent, input_event.BrailleEvent)
+        if isinstance(event, inputEvents):
+            self._processInputEvent(event)
+            return
+
+        debug.objEvent = event
+        debugging = not debug.eventDebugFilter \
+                    or debug.eventDebugFilter.match(event.type)
+        if debugging:
+            startTime = time.time()
+            debug.println(debug.eventDebugLevel,
+                          "\nvvvvv PROCESS OBJECT EVENT %s (queue size: %i) vvvvv" \
+                          % (event.type, self._eventQueue.qsize()))
+        self._processObjectEvent(event)
+        if self._didSuspendEventsFor(event):
+            self._unsuspendEvents(event)
+
+        if debugging:
+            debug.println(debug.eventDebugLevel,
+                          f"TOTAL PROCESSING TIME: {time.time() - startTime:.4f}")
+            debug.println(debug.eventDebugLevel,
+                          f"^^^^^ PROCESS OBJECT EVENT {event.type} ^^^^^\n")
+        debug.objEvent = None
+
+    def _dequeue(self, maximum=None):
         """Handles all events destined for scripts. Called by the GTK
-        idle thread."""
+        idle thread. Queued events are processed until the queue is empty,
+        the time budget is exhausted, or maximum events (if given) have
+        been processed, at which point control returns to the main loop
+        until the next idle callback."""
 
         rerun = True
 
@@ -595,31 +945,22 @@ class EventManager:
             debug.println(debug.LEVEL_ALL, msg, True)
             self._dequeueCount += 1
 
+        startTime = time.time()
+        budget = None
+        count = 0
+        exhausted = False
         try:
-            event = self._eventQueue.get_nowait()
-            self._queuePrintln(event, isEnqueue=False)
-            inputEvents = (input_event.KeyboardEvent, input_event.BrailleEvent)
-            if isinstance(event, inputEvents):
-                self._processInputEvent(event)
-            else:
-                debug.objEvent = event
-                debugging = not debug.eventDebugFilter \
-                            or debug.eventDebugFilter.match(event.type)
-                if debugging:
-                    startTime = time.time()
-                    debug.println(debug.eventDebugLevel,
-                                  "\nvvvvv PROCESS OBJECT EVENT %s (queue size: %i) vvvvv" \
-                                  % (event.type, self._eventQueue.qsize()))
-                self._processObjectEvent(event)
-                if self._didSuspendEventsFor(event):
-                    self._unsuspendEvents(event)
-
-                if debugging:
-                    debug.println(debug.eventDebugLevel,
-                                  f"TOTAL PROCESSING TIME: {time.time() - startTime:.4f}")
-                    debug.println(debug.eventDebugLevel,
-                                  f"^^^^^ PROCESS OBJECT EVENT {event.type} ^^^^^\n")
-                debug.objEvent = None
+            while True:
+                event, waitTime = self._eventQueue.getWithWaitTime()
+                count += 1
+                if budget is None:
+                    budget = self._getTimeBudget(event)
+                self._processEvent(event, waitTime)
+                if self._eventQueue.empty() or count == maximum:
+                    break
+                if time.time() - startTime >= budget:
+                    exhausted = True
+                    break
 
             self._gidleLock.acquire()
             if self._eventQueue.empty():
@@ -635,6 +976,16 @@ class EventManager:
         except Exception:
             debug.printException(debug.LEVEL_SEVERE)
 
+        self._updateDrainRate(count, time.time() - startTime, exhausted)
+        if count:
+            msg = (
+                f'EVENT MANAGER: Batch processed {count} event(s) in '
+                f'{time.time() - startTime:.4f}s (budget: {budget}s, '
+                f'remaining: {self._eventQueue.qsize()}, '
+                f'rate: {self._drainRate:.1f} events/s)'
+            )
+            debug.println(debug.LEVEL_INFO, msg, True)
+
         if debug.debugEventQueue:
             self._dequeueCount -= 1
             msg = 'EVENT MANAGER: Leaving _dequeue. Count: %d' % self._dequeueCount
@@ -642,6 +993,54 @@ class EventManager:
 
         return rerun
 
+    def startRecording(self, filename):
+        """Starts recording the object events received, along with snapshots
+        of the objects they refer to, to filename for offline replay."""
+
+        self.stopRecording()
+        try:
+            self._recorder = event_recorder.EventRecorder(filename)
+        except Exception:
+            debug.printException(debug.LEVEL_WARNING)
+            return
+
+        msg = f"EVENT MANAGER: Recording events to {filename}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+
+    def stopRecording(self):
+        """Stops recording events."""
+
+        if self._recorder is None:
+            return
+
+        self._recorder.close()
+        self._recorder = None
+
+    def getStatistics(self):
+        """Returns a dictionary of the per-event-type and per-script counts,
+        queue-wait times, and processing times of the processed events."""
+
+        return self._statistics.asDict()
+
+    def dumpStatistics(self, filename=None, reset=False):
+        """Writes the event statistics as JSON to filename, which defaults to
+        a file in the user's Orca directory, and returns the filename."""
+
+        if filename is None:
+            prefsDir = settings_manager.getManager().getPrefsDir()
+            filename = os.path.join(prefsDir, f"event-statistics-{os.getpid()}.json")
+
+        statistics = self.getStatistics()
+        if reset:
+            self._statistics.reset()
+
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(statistics, f, indent=1, sort_keys=True)
+
+        msg = f"EVENT MANAGER: Event statistics written to {filename}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+        return filename
+
     def registerListener(self, eventType):
         """Tells this module to listen for the given event type.
 
@@ -844,31 +1243,37 @@ class EventManager:
         if self._eventSourceIsDead(event):
             return True
 
-        ignore = ["object:text-changed:delete",
-                  "object:text-changed:insert",
-                  "object:text-changed:delete:system",
-                  "object:text-changed:insert:system",
-                  "object:text-attributes-changed",
-                  "object:text-caret-moved",
-                  "object:children-changed:add",
-                  "object:children-changed:add:system",
-                  "object:children-changed:remove",
-                  "object:children-changed:remove:system",
-                  "object:property-change:accessible-name",
-                  "object:property-change:accessible-description",
-                  "object:selection-changed",
-                  "object:state-changed:showing",
-                  "object:state-changed:sensitive"]
-
-        if event.type not in ignore:
+        if event.type not in self._floodNoiseEvents:
             return False
 
         return event.source != orca_state.locusOfFocus
 
+    def _getThreshold(self, drainTime, minimum, maximum):
+        """Returns the number of queued events expected to take drainTime
+        seconds to process, bounded by minimum and maximum."""
+
+        return int(max(minimum, min(maximum, self._drainRate * drainTime)))
+
+    def _updateDrainRate(self, count, duration, exhausted=False):
+        """Updates the average rate at which events are processed with that
+        of a batch of count events. Small batches which emptied the queue
+        before the time budget was exhausted are left out: they say little
+        about the rate under load, and the rate of e.g. a single quick event
+        would push the flood and deluge thresholds to their maximum."""
+
+        if not count or duration <= 0:
+            return
+
+        if count < self._drainRateMinimumBatch and not exhausted:
+            return
+
+        self._drainRate = 0.8 * self._drainRate + 0.2 * (count / duration)
+
     def _inDeluge(self):
         size = self._eventQueue.qsize()
-        if size > 100:
-            msg = 'EVENT MANAGER: DELUGE! Queue size is %i' % size
+        threshold = self._getThreshold(self._delugeDrainTime, 50, 1000)
+        if size > threshold:
+            msg = 'EVENT MANAGER: DELUGE! Queue size is %i (threshold: %i)' % (size, threshold)
             debug.println(debug.LEVEL_INFO, msg, True)
             return True
 
@@ -880,23 +1285,7 @@ class EventManager:
         if self._eventSourceIsDead(event):
             return False
 
-        ignore = ["object:text-changed:delete",
-                  "object:text-changed:insert",
-                  "object:text-changed:delete:system",
-                  "object:text-changed:insert:system",
-                  "object:text-attributes-changed",
-                  "object:text-caret-moved",
-                  "object:children-changed:add",
-                  "object:children-changed:add:system",
-                  "object:children-changed:remove",
-                  "object:children-changed:remove:system",
-                  "object:property-change:accessible-name",
-                  "object:property-change:accessible-description",
-                  "object:selection-changed",
-                  "object:state-changed:showing",
-                  "object:state-changed:sensitive"]
-
-        if event.type not in ignore:
+        if event.type not in self._floodNoiseEvents:
             return True
 
         return event.source == orca_state.locusOfFocus
@@ -934,29 +1323,20 @@ class EventManager:
         """Gets rid of events we don't care about during a flood."""
 
         oldSize = self._eventQueue.qsize()
+        pruned = self._eventQueue.removeEvents(
+            self._floodNoiseEvents, exceptSource=orca_state.locusOfFocus)
+        for event in pruned:
+            self._queuePrintln(event, isPrune=True)
 
-        newQueue = queue.Queue(0)
-        while not self._eventQueue.empty():
-            try:
-                event = self._eventQueue.get()
-            except Exception:
-                continue
-
-            if self._processDuringFlood(event):
-                newQueue.put(event)
-                self._queuePrintln(event, isPrune=False)
-            self._eventQueue.task_done()
-
-        self._eventQueue = newQueue
         newSize = self._eventQueue.qsize()
-
         msg = 'EVENT MANAGER: %i events pruned. New size: %i' % ((oldSize - newSize), newSize)
         debug.println(debug.LEVEL_INFO, msg, True)
 
     def _inFlood(self):
         size = self._eventQueue.qsize()
-        if size > 50:
-            msg = 'EVENT MANAGER: FLOOD? Queue size is %i' % size
+        threshold = self._getThreshold(self._floodDrainTime, 25, 500)
+        if size > threshold:
+            msg = 'EVENT MANAGER: FLOOD? Queue size is %i (threshold: %i)' % (size, threshold)
             debug.println(debug.LEVEL_INFO, msg, True)
             return True
 
@@ -1025,6 +1405,7 @@ class EventManager:
                 debug.printDetails(debug.LEVEL_INFO, indent, event.any_data, includeApp=False)
 
         script = self._getScriptForEvent(event)
+        self._eventScript = script
         if not script:
             msg = f'ERROR: Could not get script for {event}'
             debug.println(debug.LEVEL_INFO, msg, True)
@@ -0,0 +1,200 @@
+# Orca
+#
+# Copyright 2026 The Orca Team.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Records the object events seen by the event manager, along with
+snapshots of the accessible objects they refer to, so that they can be
+replayed later without the applications which emitted them. The recording
+is a file of JSON lines: a header, followed by one line per event. See
+test/harness/replay.py for the replay driver."""
+
+__id__        = "$Id$"
+__version__   = "$Revision$"
+__date__      = "$Date$"
+__copyright__ = "Copyright (c) 2026 The Orca Team."
+__license__   = "LGPL"
+
+import json
+import time
+
+import gi
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi
+
+from . import debug
+from .ax_object import AXObject
+
+FORMAT = "orca-event-recording"
+VERSION = 1
+
+class EventRecorder:
+    """Writes object events and accessible-tree snapshots to a file."""
+
+    # Children are only listed for objects with at most this many children,
+    # and text is truncated to this many characters.
+    MAX_CHILDREN = 500
+    MAX_TEXT_LENGTH = 100000
+
+    def __init__(self, filename):
+        self._filename = filename
+        self._file = open(filename, "w", encoding="utf-8")
+        self._startTime = time.monotonic()
+        self._ids = {}
+        self._seen = set()
+        self._count = 0
+        header = {"format": FORMAT, "version": VERSION, "start": time.time()}
+        self._file.write(f"{json.dumps(header)}\n")
+
+    def _getId(self, obj):
+        key = hash(obj)
+        nodeId = self._ids.get(key)
+        if nodeId is None:
+            nodeId = self._ids[key] = len(self._ids) + 1
+        return nodeId
+
+    def _snapshot(self, obj, includeChildren=True):
+        """Returns a dictionary describing obj."""
+
+        parent = AXObject.get_parent(obj)
+        app = AXObject.get_application(obj)
+        states = AXObject.get_state_set(obj).get_states()
+        node = {
+            "id": self._getId(obj),
+            "parent": self._getId(parent) if parent else None,
+            "index": AXObject.get_index_in_parent(obj),
+            "app": self._getId(app) if app else None,
+            "role": AXObject.get_role(obj).value_nick,
+            "name": AXObject.get_name(obj),
+            "description": AXObject.get_description(obj),
+            "states": [state.value_nick for state in states],
+            "attributes": dict(AXObject.get_attributes_dict(obj)),
+            "interfaces": AXObject.supported_interfaces_as_string(obj).split(", "),
+        }
+
+        if obj == app:
+            node["toolkit"] = AXObject.get_application_toolkit_name(obj)
+
+        relations = {}
+        for relation in AXObject.get_relations(obj):
+            relationType = relation.get_relation_type()
+            targets = AXObject.get_relation_targets(obj, relationType)
+            relations[relationType.value_nick] = [self._getId(x) for x in targets]
+        if relations:
+            node["relations"] = relations
+
+        childCount = AXObject.get_child_count(obj)
+        node["childCount"] = childCount
+        if includeChildren and childCount <= self.MAX_CHILDREN:
+            node["children"] = [self._getId(x) for x in AXObject.iter_children(obj)]
+
+        if AXObject.supports_component(obj):
+            try:
+                rect = Atspi.Component.get_extents(obj, Atspi.CoordType.WINDOW)
+                node["extents"] = [rect.x, rect.y, rect.width, rect.height]
+            except Exception as error:
+                msg = f"EVENT RECORDER: Exception getting extents of {obj}: {error}"
+                debug.println(debug.LEVEL_INFO, msg, True)
+
+        if AXObject.supports_text(obj):
+            try:
+                length = min(Atspi.Text.get_character_count(obj), self.MAX_TEXT_LENGTH)
+                node["text"] = Atspi.Text.get_text(obj, 0, length)
+                node["caret"] = Atspi.Text.get_caret_offset(obj)
+            except Exception as error:
+                msg = f"EVENT RECORDER: Exception getting text of {obj}: {error}"
+                debug.println(debug.LEVEL_INFO, msg, True)
+
+        return node
+
+    def _snapshotsFor(self, event):
+        """Returns the snapshots needed to replay event. The source is always
+        included because its properties may have changed. Its ancestors and
+        children, and an accessible any_data, are included the first time
+        they are seen."""
+
+        nodes = []
+        source = event.source
+        ancestors = []
+        parent = AXObject.get_parent(source)
+        while parent and hash(parent) not in self._seen:
+            ancestors.append(parent)
+            parent = AXObject.get_parent(parent)
+
+        for obj in reversed(ancestors):
+            nodes.append(self._snapshot(obj))
+            self._seen.add(hash(obj))
+
+        nodes.append(self._snapshot(source))
+        self._seen.add(hash(source))
+
+        related = []
+        if AXObject.get_child_count(source) <= self.MAX_CHILDREN:
+            related.extend(AXObject.iter_children(source))
+        if isinstance(event.any_data, Atspi.Accessible):
+            related.append(event.any_data)
+
+        for obj in related:
+            if obj and hash(obj) not in self._seen:
+                nodes.append(self._snapshot(obj, includeChildren=False))
+                self._seen.add(hash(obj))
+
+        return nodes
+
+    def _serializeAnyData(self, anyData):
+        if anyData is None:
+            return None
+        if isinstance(anyData, Atspi.Accessible):
+            return {"object": self._getId(anyData)}
+        if isinstance(anyData, (bool, int, float, str)):
+            return {"value": anyData}
+        return {"value": str(anyData)}
+
+    def record(self, event):
+        """Appends event, and the snapshots needed to replay it, to the file."""
+
+        if self._file is None or not AXObject.is_valid(event.source):
+            return
+
+        try:
+            record = {
+                "time": time.monotonic() - self._startTime,
+                "type": event.type,
+                "detail1": event.detail1,
+                "detail2": event.detail2,
+                "any_data": self._serializeAnyData(event.any_data),
+                "source": self._getId(event.source),
+                "nodes": self._snapshotsFor(event),
+            }
+            self._file.write(f"{json.dumps(record)}\n")
+        except Exception as error:
+            msg = f"EVENT RECORDER: Could not record {event.type}: {error}"
+            debug.println(debug.LEVEL_INFO, msg, True)
+            return
+
+        self._count += 1
+
+    def close(self):
+        """Closes the recording."""
+
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        msg = f"EVENT RECORDER: Recorded {self._count} event(s) to {self._filename}"
+        debug.println(debug.LEVEL_INFO, msg, True)
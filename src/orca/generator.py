@@ -34,10 +34,9 @@ from gi.repository import Atspi
 gi.require_version('Atk', '1.0')
 from gi.repository import Atk
 
+import builtins
 import re
-import sys
 import time
-import traceback
 
 from . import braille
 from . import debug
@@ -54,16 +53,6 @@ try:
 except ImportError:
     import collections as collections_abc
 
-def _formatExceptionInfo(maxTBlevel=5):
-    cla, exc, trbk = sys.exc_info()
-    excName = cla.__name__
-    try:
-        excArgs = exc.args
-    except KeyError:
-        excArgs = "<no args>"
-    excTb = traceback.format_tb(trbk, maxTBlevel)
-    return (excName, excArgs, excTb)
-
 # [[[WDW - general note -- for all the _generate* methods, it would be great if
 # we could return an empty array if we can determine the method does not
 # apply to the object.  This would allow us to reduce the number of strings
@@ -75,6 +64,49 @@ METHOD_PREFIX = "_generate"
 
 _settingsManager = settings_manager.getManager()
 
+# Shared by all generators, since every script creates its own: the names of
+# the generator methods of each generator class, the code of each formatting
+# string, and the formatting strings which have already been verified.
+#
+_methodNames = {}
+_compiledFormatting = {}
+_verifiedFormatting = set()
+
+class _GeneratorResults(dict):
+    """Namespace for evaluating a compiled formatting string. The result of
+    a generator method is obtained the first time its name is looked up."""
+
+    def __init__(self, generator, obj, args, globalsDict):
+        dict.__init__(self)
+        self._generator = generator
+        self._obj = obj
+        self._args = args
+        self._globals = globalsDict
+
+    def __missing__(self, name):
+        method = self._generator._methodsDict.get(name)
+        if method is None or name in self._globals:
+            # Fall back on the globals and builtins.
+            raise KeyError(name)
+
+        currentTime = time.time()
+        try:
+            value = method(self._obj, **self._args)
+        except KeyError as error:
+            # A KeyError would be treated by eval as an unresolved name.
+            raise RuntimeError(f"{name} failed: {error}") from error
+
+        self[name] = value
+        if isinstance(value, list) and debug.LEVEL_ALL >= debug.debugLevel:
+            duration = f"{time.time() - currentTime:.4f}"
+            stringResult = " ".join(filter(lambda x: x, map(
+                lambda x: self._generator._resultElementToString(x, False), value)))
+            debug.println(
+                debug.LEVEL_ALL,
+                f"{' ' * 18}GENERATION TIME: {duration} ----> {name}=[{stringResult}]")
+
+        return value
+
 class Generator:
     """Takes accessible objects and generates a presentation for those
     objects.  See the generate method, which is the primary entry
@@ -84,16 +116,26 @@ class Generator:
         self._mode = mode
         self._script = script
         self._activeProgressBars = {}
-        self._methodsDict = {}
-        for method in \
-            [z for z in [getattr(self, y).__get__(self, self.__class__) \
-                         for y in [x for x in dir(self) if x.startswith(METHOD_PREFIX)]] \
-                            if isinstance(z, collections_abc.Callable)]:
-            name = method.__name__[len(METHOD_PREFIX):]
-            name = name[0].lower() + name[1:]
-            self._methodsDict[name] = method
+        self._methodsDict = {name: getattr(self, attr) for name, attr in
+                             self._getMethodNames(self.__class__)}
         self._verifyFormatting()
 
+    @staticmethod
+    def _getMethodNames(cls):
+        """Returns (name, attribute) pairs for the generator methods of cls."""
+
+        names = _methodNames.get(cls)
+        if names is None:
+            names = []
+            for attr in dir(cls):
+                if not attr.startswith(METHOD_PREFIX) \
+                   or not isinstance(getattr(cls, attr), collections_abc.Callable):
+                    continue
+                name = attr[len(METHOD_PREFIX):]
+                names.append((name[0].lower() + name[1:], attr))
+            _methodNames[cls] = names
+        return names
+
     def _addGlobals(self, globalsDict):
         """Other things to make available from the formatting string.
         """
@@ -104,14 +146,10 @@ class Generator:
 
         # Verify the formatting strings are OK.  This is only
         # for verification and does not effect the function of
-        # Orca at all.
+        # Orca at all. As a side effect, the formatting strings
+        # are compiled and cached for later use by generate.
 
-        # Populate the entire globals with empty arrays
-        # for the results of all the legal method names.
-        #
         globalsDict = {}
-        for key in self._methodsDict.keys():
-            globalsDict[key] = []
         self._addGlobals(globalsDict)
 
         for roleKey in self._script.formatting[self._mode]:
@@ -126,21 +164,42 @@ class Generator:
                         # It's legal to have an empty string.
                         #
                         continue
-                    while True:
-                        try:
-                            eval(evalString, globalsDict)
-                            break
-                        except NameError:
-                            info = _formatExceptionInfo()
-                            arg = info[1][0]
-                            arg = arg.replace("name '", "")
-                            arg = arg.replace("' is not defined", "")
-                            if arg not in self._methodsDict:
-                                debug.printException(debug.LEVEL_SEVERE)
-                            globalsDict[arg] = []
-                        except Exception:
-                            debug.printException(debug.LEVEL_SEVERE)
-                            break
+                    verified = (self.__class__, self._mode, evalString)
+                    if verified in _verifiedFormatting:
+                        continue
+                    _verifiedFormatting.add(verified)
+                    try:
+                        code = self._compileFormatting(evalString)
+                    except Exception:
+                        debug.printException(debug.LEVEL_SEVERE)
+                        continue
+
+                    # Populate the names of all the legal method names
+                    # with empty arrays.
+                    #
+                    localsDict = {}
+                    for name in code.co_names:
+                        if name in globalsDict or hasattr(builtins, name):
+                            continue
+                        if name not in self._methodsDict:
+                            msg = f"GENERATOR: Unknown name '{name}' in {evalString}"
+                            debug.println(debug.LEVEL_SEVERE, msg)
+                        localsDict[name] = []
+                    try:
+                        eval(code, globalsDict, localsDict)
+                    except Exception:
+                        debug.printException(debug.LEVEL_SEVERE)
+
+    def _compileFormatting(self, formatting):
+        """Returns the code object for the formatting string, compiling it
+        the first time the string is seen."""
+
+        key = self._mode, formatting
+        code = _compiledFormatting.get(key)
+        if code is None:
+            code = compile(formatting, f"<{self._mode} formatting>", "eval")
+            _compiledFormatting[key] = code
+        return code
 
     def _overrideRole(self, newRole, args):
         """Convenience method to allow you to temporarily override the role in
@@ -213,12 +272,11 @@ class Generator:
             #
             args['role'] = globalsDict['role']
 
-            # We loop through the format string, catching each error
-            # as we go.  Each error should always be a NameError,
-            # where the name is the name of one of our generator
-            # functions.  When we encounter this, we call the function
-            # and get its results, placing them in the globals for the
-            # the call to eval.
+            # The formatting string is compiled once and then evaluated
+            # against a namespace which calls each of our generator
+            # functions the first time its name is reached. Thus only
+            # the functions needed by the evaluation are called, and
+            # each of them at most once.
             #
             args['mode'] = self._mode
             if not args.get('formatType', None):
@@ -239,50 +297,25 @@ class Generator:
                     formatting = f'{prefix} + {formatting} + {suffix}'
                 args['recursing'] = True
 
-            msg = (
-                f"{self._mode.upper()} GENERATOR: Starting {args.get('formatType')} "
-                f"generation for {obj} ({args.get('role')})"
-            )
-            debug.println(debug.LEVEL_INFO, msg, True)
+            debug.printLazy(debug.LEVEL_INFO, "%s GENERATOR: Starting %s generation for %s (%s)",
+                            self._mode.upper(), args.get('formatType'), obj, args.get('role'),
+                            timestamp=True)
 
             # Reset 'usedDescriptionFor*' if a previous generator used it.
             self._script.pointOfReference['usedDescriptionForName'] = False
             self._script.pointOfReference['usedDescriptionForUnrelatedLabels'] = False
             self._script.pointOfReference['usedDescriptionForAlert'] = False
 
-            def debuginfo(x):
-                return self._resultElementToString(x, False)
-
             assert(formatting)
-            while True:
-                currentTime = time.time()
-                try:
-                    result = eval(formatting, globalsDict)
-                    break
-                except NameError:
-                    result = []
-                    info = _formatExceptionInfo()
-                    arg = info[1][0]
-                    arg = arg.replace("name '", "")
-                    arg = arg.replace("' is not defined", "")
-                    if arg not in self._methodsDict:
-                        debug.printException(debug.LEVEL_SEVERE)
-                        break
-                    globalsDict[arg] = self._methodsDict[arg](obj, **args)
-                    duration = f"{time.time() - currentTime:.4f}"
-                    if isinstance(globalsDict[arg], list):
-                        stringResult = " ".join(filter(lambda x: x,
-                                                        map(debuginfo, globalsDict[arg])))
-                        debug.println(
-                            debug.LEVEL_ALL,
-                            f"{' ' * 18}GENERATION TIME: {duration} ----> {arg}=[{stringResult}]")
+            code = self._compileFormatting(formatting)
+            result = eval(code, globalsDict, _GeneratorResults(self, obj, args, globalsDict))
 
         except Exception:
             debug.printException(debug.LEVEL_SEVERE)
             result = []
 
-        duration = f"{time.time() - startTime:.4f}"
-        debug.println(debug.LEVEL_ALL, f"{' ' * 18}COMPLETION TIME: {duration}")
+        debug.printLazy(debug.LEVEL_ALL, "%sCOMPLETION TIME: %.4f", " " * 18,
+                        time.time() - startTime)
         self._debugResultInfo(result)
         if args.get('isProgressBarUpdate') and result and result[0]:
             self.setProgressBarUpdateTimeAndValue(obj)
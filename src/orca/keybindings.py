@@ -43,6 +43,11 @@ from .orca_i18n import _
 _keysymsCache = {}
 _keycodeCache = {}
 
+# Incremented whenever the keyboard layout changes, so that keycodes looked
+# up for the previous layout are looked up again.
+_keymapSerial = 0
+_keymapWatched = False
+
 MODIFIER_ORCA = 8
 NO_MODIFIER_MASK              =  0
 ALT_MODIFIER_MASK             =  1 << Atspi.ModifierType.ALT
@@ -100,11 +105,16 @@ def getKeycode(keysym):
     event.hw_code for key events.
     """
 
+    global _keymapWatched
+
     if not keysym:
         return 0
 
     if keysym not in _keycodeCache:
         keymap = Gdk.Keymap.get_default()
+        if not _keymapWatched:
+            keymap.connect("keys-changed", _onKeysChanged)
+            _keymapWatched = True
 
         # Find the numerical value of the keysym
         #
@@ -131,6 +141,16 @@ def getKeycode(keysym):
 
     return _keycodeCache[keysym]
 
+def _onKeysChanged(keymap):
+    """Forgets the keycodes which were looked up for the previous layout."""
+
+    global _keymapSerial
+
+    _keycodeCache.clear()
+    _keymapSerial += 1
+    msg = f"KEYBINDINGS: Keymap changed. Serial is now {_keymapSerial}"
+    debug.println(debug.LEVEL_INFO, msg, True)
+
 def getModifierNames(mods):
     """Gets the modifier names of a numeric modifier mask as a human
     consumable string.
@@ -232,20 +252,27 @@ class KeyBinding:
         self.handler = handler
         self.click_count = click_count
         self.keycode = None
+        self._keymapSerial = None
 
-    def matches(self, keycode, modifiers):
-        """Returns true if this key binding matches the given keycode and
-        modifier state.
-        """
+    def getKeycode(self):
+        """Returns the keycode of this binding's keysym in the current layout."""
 
         # We lazily bind the keycode.  The primary reason for doing this
         # is so that atspi does not have to be initialized before setting
         # keybindings in the user's preferences file.
         #
-        if not self.keycode:
+        if not self.keycode or self._keymapSerial != _keymapSerial:
             self.keycode = getKeycode(self.keysymstring)
+            self._keymapSerial = _keymapSerial
 
-        if self.keycode == keycode:
+        return self.keycode
+
+    def matches(self, keycode, modifiers):
+        """Returns true if this key binding matches the given keycode and
+        modifier state.
+        """
+
+        if self.getKeycode() == keycode:
             result = modifiers & self.modifier_mask
             return result == self.modifiers
         else:
@@ -277,8 +304,7 @@ class KeyBinding:
             will return an empty set.
         """
         ret = []
-        if not self.keycode:
-            self.keycode = getKeycode(self.keysymstring)
+        self.getKeycode()
 
         if self.modifiers & ORCA_MODIFIER_MASK:
             device = orca_state.device
@@ -309,9 +335,27 @@ class KeyBindings:
     """Structure that maintains a set of KeyBinding instances.
     """
 
+    # The attributes compared by each typeOfSearch of hasKeyBinding.
+    SEARCH_KEYS = {
+        "strict": lambda kb: (kb.handler.description, kb.keysymstring,
+                              kb.modifier_mask, kb.modifiers, kb.click_count),
+        "description": lambda kb: kb.handler.description,
+        "keys": lambda kb: (kb.keysymstring, kb.modifier_mask, kb.modifiers, kb.click_count),
+        "keysNoMask": lambda kb: (kb.keysymstring, kb.modifiers, kb.click_count),
+    }
+
     def __init__(self):
         self.keyBindings = []
 
+        # For each typeOfSearch, the number of bindings with each key.
+        self._searchCounts = {typeOfSearch: {} for typeOfSearch in self.SEARCH_KEYS}
+
+        # The bindings by keycode, and the bindings which can match exactly
+        # by (keycode, modifiers, click count). Built on demand.
+        self._byKeycode = None
+        self._exact = None
+        self._indexState = None
+
     def __str__(self):
         result = "[\n"
         for keyBinding in self.keyBindings:
@@ -324,6 +368,16 @@ class KeyBindings:
         result += "]"
         return result
 
+    def _updateSearchCounts(self, keyBinding, delta):
+        for typeOfSearch, getKey in self.SEARCH_KEYS.items():
+            counts = self._searchCounts[typeOfSearch]
+            key = getKey(keyBinding)
+            count = counts.get(key, 0) + delta
+            if count > 0:
+                counts[key] = count
+            else:
+                counts.pop(key, None)
+
     def add(self, keyBinding):
         """Adds the given KeyBinding instance to this set of keybindings.
         """
@@ -336,6 +390,8 @@ class KeyBindings:
            debug.println(debug.LEVEL_INFO, msg, True)
 
         self.keyBindings.append(keyBinding)
+        self._updateSearchCounts(keyBinding, 1)
+        self._byKeycode = None
 
     def remove(self, keyBinding):
         """Removes the given KeyBinding instance from this set of keybindings.
@@ -347,15 +403,21 @@ class KeyBindings:
             pass
         else:
             del self.keyBindings[i]
+            self._updateSearchCounts(keyBinding, -1)
+            self._byKeycode = None
 
     def removeByHandler(self, handler):
         """Removes the given KeyBinding instance from this set of keybindings.
         """
-        i = len(self.keyBindings)
-        while i > 0:
-            if self.keyBindings[i - 1].handler == handler:
-                del self.keyBindings[i - 1]
-            i = i - 1
+
+        removed = [kb for kb in self.keyBindings if kb.handler == handler]
+        if not removed:
+            return
+
+        self.keyBindings[:] = [kb for kb in self.keyBindings if kb.handler != handler]
+        for keyBinding in removed:
+            self._updateSearchCounts(keyBinding, -1)
+        self._byKeycode = None
 
     def hasKeyBinding (self, newKeyBinding, typeOfSearch="strict"):
         """Return True if keyBinding is already in self.keyBindings.
@@ -369,45 +431,11 @@ class KeyBindings:
               "keysNoMask":  matches the modifiers, key, and click count
         """
 
-        hasIt = False
+        getKey = self.SEARCH_KEYS.get(typeOfSearch)
+        if getKey is None:
+            return False
 
-        for keyBinding in self.keyBindings:
-            if typeOfSearch == "strict":
-                if (keyBinding.handler.description \
-                    == newKeyBinding.handler.description) \
-                    and (keyBinding.keysymstring \
-                         == newKeyBinding.keysymstring) \
-                    and (keyBinding.modifier_mask \
-                         == newKeyBinding.modifier_mask) \
-                    and (keyBinding.modifiers \
-                         == newKeyBinding.modifiers) \
-                    and (keyBinding.click_count \
-                         == newKeyBinding.click_count):
-                    hasIt = True
-            elif typeOfSearch == "description":
-                if keyBinding.handler.description \
-                    == newKeyBinding.handler.description:
-                    hasIt = True
-            elif typeOfSearch == "keys":
-                if (keyBinding.keysymstring \
-                    == newKeyBinding.keysymstring) \
-                    and (keyBinding.modifier_mask \
-                         == newKeyBinding.modifier_mask) \
-                    and (keyBinding.modifiers \
-                         == newKeyBinding.modifiers) \
-                    and (keyBinding.click_count \
-                         == newKeyBinding.click_count):
-                    hasIt = True
-            elif typeOfSearch == "keysNoMask":
-                if (keyBinding.keysymstring \
-                    == newKeyBinding.keysymstring) \
-                    and (keyBinding.modifiers \
-                         == newKeyBinding.modifiers) \
-                    and (keyBinding.click_count \
-                         == newKeyBinding.click_count):
-                    hasIt = True
-
-        return hasIt
+        return getKey(newKeyBinding) in self._searchCounts[typeOfSearch]
 
     def getBoundBindings(self, uniqueOnly=False):
         """Returns the KeyBinding instances which are bound to a keystroke.
@@ -419,8 +447,10 @@ class KeyBindings:
 
         bound = [kb for kb in self.keyBindings if kb.keysymstring]
         if uniqueOnly:
-            handlers = [kb.handler.description for kb in bound]
-            bound = [bound[i] for i in map(handlers.index, set(handlers))]
+            first = {}
+            for kb in bound:
+                first.setdefault(kb.handler.description, kb)
+            bound = list(first.values())
 
         bindings = {}
         for kb in bound:
@@ -459,25 +489,38 @@ class KeyBindings:
         )
         debug.println(debug.LEVEL_INFO, msg, True)
 
+    def _getIndex(self):
+        """Returns the bindings by keycode and the exact-match index, building
+        them if the bindings or the keyboard layout have changed."""
+
+        state = len(self.keyBindings), _keymapSerial
+        if self._byKeycode is not None and self._indexState == state:
+            return self._byKeycode, self._exact
+
+        byKeycode = {}
+        exact = {}
+        for keyBinding in self.keyBindings:
+            keycode = keyBinding.getKeycode()
+            byKeycode.setdefault(keycode, []).append(keyBinding)
+
+            # A binding matches exactly only when the event's modifiers are
+            # its modifier mask, which in turn must be its modifiers.
+            if keyBinding.modifier_mask == keyBinding.modifiers:
+                key = keycode, keyBinding.modifiers, keyBinding.click_count
+                exact.setdefault(key, []).append(keyBinding)
+
+        self._byKeycode, self._exact = byKeycode, exact
+        self._indexState = len(self.keyBindings), _keymapSerial
+        return byKeycode, exact
+
     def getInputHandler(self, keyboardEvent):
         """Returns the input handler of the key binding that matches the
         given keycode and modifiers, or None if no match exists.
         """
 
-        matches = []
-        candidates = []
+        byKeycode, exact = self._getIndex()
         clickCount = keyboardEvent.getClickCount()
-        for keyBinding in self.keyBindings:
-            if keyBinding.matches(keyboardEvent.hw_code, keyboardEvent.modifiers):
-                if keyBinding.modifier_mask == keyboardEvent.modifiers and \
-                   keyBinding.click_count == clickCount:
-                    matches.append(keyBinding)
-                # If there's no keysymstring, it's unbound and cannot be
-                # a match.
-                #
-                if keyBinding.keysymstring:
-                    candidates.append(keyBinding)
-
+        matches = exact.get((keyboardEvent.hw_code, keyboardEvent.modifiers, clickCount), [])
         self._checkMatchingBindings(keyboardEvent, matches)
         if matches:
             return matches[0].handler
@@ -485,6 +528,11 @@ class KeyBindings:
         if keyboardEvent.isKeyPadKeyWithNumlockOn():
             return None
 
+        # If there's no keysymstring, it's unbound and cannot be a match.
+        candidates = [kb for kb in byKeycode.get(keyboardEvent.hw_code, [])
+                      if kb.keysymstring
+                      and kb.matches(keyboardEvent.hw_code, keyboardEvent.modifiers)]
+
         # If we're still here, we don't have an exact match. Prefer
         # the one whose click count is closest to, but does not exceed,
         # the actual click count.
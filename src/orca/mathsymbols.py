@@ -2231,23 +2231,19 @@ _all.update(_arrows)
 _all.update(_operators)
 _all.update(_shapes)
 _RE = None
-_RE_COMBINING = None
+
+# The spoken names of the symbols in _all, keyed by whether they include the
+# style (e.g. "bold") of the alphanumeric symbols, and by fallbackOnUnicodeData.
+_spokenNames = {}
 
 def __compileRE():
     global _RE
     try:
-        _RE = re.compile(f"[{''.join(list(_all.keys()))}]", re.UNICODE)
+        _RE = re.compile(f"(?P<combined>.[{re.escape(''.join(_combining))}])"
+                         f"|[{re.escape(''.join(_all))}]", re.UNICODE)
     except Exception:
         _RE = None
 
-def __compileRE_COMBINING():
-    global _RE_COMBINING
-    try:
-        _RE_COMBINING = re.compile(f".[{''.join(list(_combining.keys()))}]",
-                                   re.UNICODE)
-    except Exception:
-        _RE_COMBINING = None
-
 def _getStyleString(symbol):
     o = ord(symbol)
     if o in _bold or o in _boldGreek or o in _boldDigits:
@@ -2282,8 +2278,10 @@ def _getStyleString(symbol):
     return "%s"
 
 def updateSymbols(symbolDict):
-    global _all
+    global _all, _RE
     _all.update(symbolDict)
+    _RE = None
+    _spokenNames.clear()
 
 def _getSpokenName(symbol, includeStyle):
     if symbol not in _all:
@@ -2291,8 +2289,11 @@ def _getSpokenName(symbol, includeStyle):
 
     name = _all.get(symbol)
     if not name and fallbackOnUnicodeData:
+        # The symbol is already in _all, so _RE doesn't need to be compiled
+        # again. Calling updateSymbols here would also clear _spokenNames
+        # while _getSpokenNames is building them.
         name = unicodedata.name(symbol).lower()
-        updateSymbols({symbol: name})
+        _all[symbol] = name
         return name
 
     if includeStyle and symbol in _alnum:
@@ -2300,29 +2301,37 @@ def _getSpokenName(symbol, includeStyle):
 
     return name
 
+def _getSpokenNames(includeStyle):
+    key = includeStyle, fallbackOnUnicodeData
+    names = _spokenNames.get(key)
+    if names is None:
+        names = {symbol: _getSpokenName(symbol, includeStyle) for symbol in list(_all)}
+        _spokenNames[key] = names
+
+    return names
+
 def getCharacterName(symbol):
-    return _getSpokenName(symbol, speakStyle != SPEAK_NEVER)
+    return _getSpokenNames(speakStyle != SPEAK_NEVER).get(symbol, "")
 
 def adjustForSpeech(string):
     if _RE is None:
         __compileRE()
 
-    if _RE_COMBINING is None:
-        __compileRE_COMBINING()
-
-    if _RE_COMBINING is not None:
-        combiningPairs = set(re.findall(_RE_COMBINING, string))
-        for pair in combiningPairs:
-            name = _combining.get(pair[1])
-            if name:
-                string = re.sub(pair, f" {name % pair[0]} ", string)
-
-    if _RE is not None:
-        chars = set(re.findall(_RE, string))
-        includeStyle = speakStyle == SPEAK_ALWAYS
-        for char in chars:
-            name = _getSpokenName(char, includeStyle)
-            if name:
-                string = re.sub(char, f" {name} ", string)
-
-    return string
+    if _RE is None:
+        return string
+
+    names = _getSpokenNames(speakStyle == SPEAK_ALWAYS)
+
+    def _getName(symbol):
+        name = names.get(symbol)
+        if name:
+            return f" {name} "
+        return symbol
+
+    def _replace(match):
+        if match.group("combined"):
+            symbol, combining = match.group()
+            return f" {_combining[combining] % _getName(symbol)} "
+        return _getName(match.group())
+
+    return _RE.sub(_replace, string)
@@ -83,7 +83,6 @@ from orca import text_attribute_names
 from orca import speechserver
 from orca import input_event
 from orca import pronunciation_dict
-from orca import orca_gtkbuilder
 from orca import signal_manager
 from orca import dynamic_api_manager
 from orca import eventsynthesizer
@@ -258,7 +257,18 @@ def setLocusOfFocus(event, obj, notifyScript=True, force=False):
         debug.println(debug.LEVEL_INFO, msg, True)
         return
 
+    if not AXObject.PROPERTY_CACHE_ENABLED:
+        orca_state.activeScript.locusOfFocusChanged(event, oldFocus, orca_state.locusOfFocus)
+        return
+
+    before = AXObject.get_property_cache_stats()
     orca_state.activeScript.locusOfFocusChanged(event, oldFocus, orca_state.locusOfFocus)
+    after = AXObject.get_property_cache_stats()
+    msg = (
+        f"ORCA: Property cache for focus change: {after['hits'] - before['hits']} hits, "
+        f"{after['misses'] - before['misses']} misses"
+    )
+    debug.println(debug.LEVEL_INFO, msg, True)
 
 ########################################################################
 #                                                                      #
@@ -695,6 +705,7 @@ def shutdown(script=None, inputEvent=None):
 
     _eventManager.deactivate()
     _scriptManager.deactivate()
+    _settingsManager.flush()
 
     # Shutdown all the other support.
     #
@@ -715,6 +726,7 @@ def shutdown(script=None, inputEvent=None):
     debug.println(debug.LEVEL_INFO, 'ORCA: Quitting Atspi main event loop', True)
     Atspi.event_quit()
     debug.println(debug.LEVEL_INFO, 'ORCA: Shutdown complete', True)
+    debug.flush()
 
     return True
 
@@ -759,11 +771,18 @@ def shutdownOnSignal(signum, frame):
     if not cleanExit:
         die(EXIT_CODE_HANG)
 
+def dumpEventStatisticsOnSignal(signum, frame):
+    try:
+        _eventManager.dumpStatistics()
+    except Exception:
+        debug.printException(debug.LEVEL_WARNING)
+
 def crashOnSignal(signum, frame):
     signalString = f'({signal.strsignal(signum)})'
     msg = 'ORCA: Shutting down and exiting due to signal=%d %s' % (signum, signalString)
     debug.println(debug.LEVEL_SEVERE, msg, True)
     debug.printStack(debug.LEVEL_SEVERE)
+    debug.flush()
     _restoreXmodmap(_orcaModifiers)
     try:
         orca_state.activeScript.presentationInterrupt()
@@ -807,6 +826,7 @@ def main():
     signal.signal(signal.SIGTERM, shutdownOnSignal)
     signal.signal(signal.SIGQUIT, shutdownOnSignal)
     signal.signal(signal.SIGSEGV, crashOnSignal)
+    signal.signal(signal.SIGUSR1, dumpEventStatisticsOnSignal)
 
     debug.println(debug.LEVEL_INFO, "ORCA: Enabling accessibility (if needed).", True)
     if not _settingsManager.isAccessibilityEnabled():
@@ -913,6 +933,8 @@ class Orca(GObject.Object):
         # for now add compatibility layer using Dynamic API
         # should be removed step by step
         # use clean objects, getters and setters instead
+        # orca_gtkbuilder is only needed for dialogs, so it is not imported
+        # until it is first requested
 
         self.getDynamicApiManager().registerAPI('Logger', _logger)
         self.getDynamicApiManager().registerAPI('SettingsManager', settings_manager)
@@ -935,7 +957,7 @@ class Orca(GObject.Object):
         self.getDynamicApiManager().registerAPI('PronunciationDict', pronunciation_dict)
         self.getDynamicApiManager().registerAPI('InputEvent', input_event)
         self.getDynamicApiManager().registerAPI('SpeechServer', speechserver)
-        self.getDynamicApiManager().registerAPI('OrcaGtkbuilder', orca_gtkbuilder)
+        self.getDynamicApiManager().registerModuleAPI('OrcaGtkbuilder', 'orca.orca_gtkbuilder')
         self.getDynamicApiManager().registerAPI('EventSynthesizer', eventsynthesizer)
         self.getDynamicApiManager().registerAPI('AXObject', AXObject)
         self.getDynamicApiManager().registerAPI('AXUtilities', AXUtilities)
@@ -5,7 +5,6 @@ gi.require_version('Peas', '1.0')
 from gi.repository import GObject
 from gi.repository import Peas
 import importlib, os
-import orca_gui_prefs
 
 class ClassicPreferences(GObject.Object, Peas.Activatable, plugin.Plugin):
     #__gtype_name__ = 'ClassicPreferences'
@@ -75,6 +74,10 @@ class ClassicPreferences(GObject.Object, Peas.Activatable, plugin.Plugin):
             orca_state.orcaOS.showGUI()
             return
 
+        # the dialog is only imported when it is first shown, since
+        # it is large and this plugin is activated at startup
+        import orca_gui_prefs
+
         uiFile = os.path.join(self.getModuleDir(),
                             "orca-setup.ui")
 
@@ -911,6 +911,8 @@ class OrcaSetupGUI(orca_gtkbuilder.GtkBuilderWrapper):
             self.get_widget("speechServers").set_active(0)
             self.speechServersChoice = self.speechServersChoices[0]
 
+        # Pick up voices installed since they were last listed.
+        self.speechServersChoice.rescanVoices()
         self._setupVoices()
 
     def _setupSpeechServers(self):
@@ -1971,7 +1973,7 @@ class OrcaSetupGUI(orca_gtkbuilder.GtkBuilderWrapper):
     def getModelDict(self, model):
         """Get the list of values from a list[str,str] model
         """
-        pronunciation_dict.pronunciation_dict = {}
+        pronunciation_dict.clearPronunciations()
         currentIter = model.get_iter_first()
         while currentIter is not None:
             key, value = model.get(currentIter, ACTUAL, REPLACEMENT)
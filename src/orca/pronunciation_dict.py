@@ -26,6 +26,24 @@ __date__      = "$Date$"
 __copyright__ = "Copyright (c) 2006-2008 Sun Microsystems Inc."
 __license__   = "LGPL"
 
+import re
+
+from . import debug
+
+# Where an entry may begin and end: anywhere not preceded or followed by a
+# word character, so that e.g. "C++" is found in "C++ code", "C++." and
+# "(C++)", but not in "C++x", and "#tag" is not found in "a#tag". The U+E000
+# with which the speech dispatcher backend marks each word is not a word
+# character, so marked words are found too.
+#
+_START = r"(?<!\w)"
+_END = r"(?!\w)"
+
+# What the white space between the words of a phrase matches: any white
+# space, and the mark of the next word, if it is marked.
+#
+_SPACE = r"\s+\ue000?"
+
 def getPronunciation(word, pronunciations=None):
     """Given a word, return a string that represents what this word
     sounds like. Note: This code does not handle the pronunciation
@@ -60,14 +78,160 @@ def setPronunciation(word, replacementString, pronunciations=None):
       into.
     """
 
+    global _generation
+
     key = word.lower()
     if pronunciations is not None:
         pronunciations[key] = [ word, replacementString ]
     else:
         pronunciation_dict[key] = [ word, replacementString ]
+        _generation += 1
+
+def clearPronunciations():
+    """Replaces pronunciation_dict with a new, empty dictionary. Use this and
+    setPronunciation, rather than changing pronunciation_dict directly, so
+    that adjustLine uses the new entries."""
+
+    global pronunciation_dict, _generation
+
+    pronunciation_dict = {}
+    _generation += 1
+
+def setCacheKey(key):
+    """Says what the entries of pronunciation_dict are for, e.g. a profile
+    and application, so that its compiled form is kept and used again when
+    the same entries are set for the same key.
+
+    Arguments:
+    - key: a hashable value identifying the entries.
+    """
+
+    global _cacheKey
+    _cacheKey = key
+
+def adjustLine(line):
+    """Replaces every word and phrase in line which is in pronunciation_dict
+    with its pronunciation, in a single pass. A phrase is an entry of
+    several words; it is used in preference to the entries for its words.
+    Entries only match whole words, and match regardless of case.
+
+    Arguments:
+    - line: the string to adjust.
+
+    Returns the adjusted string.
+    """
+
+    if not pronunciation_dict:
+        return line
+
+    return _getCompiled().adjustLine(line)
+
+def _getCompiled():
+    """Returns the compiled form of pronunciation_dict, compiling it only if
+    it was not compiled before for the current entries and cache key."""
+
+    global _active
+
+    if _active is not None and _active[0] is pronunciation_dict \
+       and _active[1] == _generation:
+        return _active[2]
+
+    entries = frozenset((key, value[1]) for key, value in pronunciation_dict.items())
+    entriesAndCompiled = _compiled.get(_cacheKey)
+    if entriesAndCompiled is None or entriesAndCompiled[0] != entries:
+        entriesAndCompiled = entries, _CompiledPronunciations(entries)
+        _compiled[_cacheKey] = entriesAndCompiled
+        msg = f"PRONUNCIATION DICT: Compiled {len(entries)} entries for {_cacheKey}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+
+    _active = pronunciation_dict, _generation, entriesAndCompiled[1]
+    return _active[2]
+
+class _CompiledPronunciations:
+    """The entries of a pronunciation dictionary compiled into one regular
+    expression, structured as a trie of the lowercase entries, which finds
+    the longest entry at each word boundary."""
+
+    def __init__(self, entries):
+        self._replacements = {self._normalize(key): value for key, value in entries}
+
+        trie = {}
+        for key in filter(None, self._replacements):
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        pattern = self._toPattern(trie)
+        self._pattern = re.compile(f"{_START}{pattern}{_END}", re.IGNORECASE)
+
+    @classmethod
+    def _toPattern(cls, node):
+        """Returns the pattern for the subtree at node, with the longer entries
+        tried before the shorter ones."""
+
+        branches = []
+        for char, child in sorted(node.items()):
+            if not char:
+                continue
+
+            # Chains without branches become literals, which also keeps the
+            # nesting of the pattern shallow.
+            literal = char
+            while len(child) == 1 and "" not in child:
+                [(char, child)] = child.items()
+                literal += char
+
+            literal = _SPACE.join(map(re.escape, literal.split(" ")))
+            if list(child) == [""]:
+                branches.append(literal)
+            else:
+                branches.append(literal + cls._toPattern(child))
+
+        pattern = "|".join(branches)
+        if "" in node:
+            return f"(?:{pattern})?"
+        if len(branches) > 1:
+            return f"(?:{pattern})"
+        return pattern
+
+    @staticmethod
+    def _normalize(text):
+        """Returns text in lowercase, without word marks, and with the white
+        space between its words reduced to a single space."""
+
+        return " ".join(text.replace("\ue000", "").lower().split())
+
+    def _replace(self, match):
+        text = match.group()
+        replacement = self._replacements.get(self._normalize(text))
+        if replacement is None:
+            return text
+
+        # The marks of the words after the first one are kept, after the
+        # pronunciation, so that each mark still belongs to its word.
+        return replacement + "\ue000" * text.count("\ue000")
+
+    def adjustLine(self, line):
+        return self._pattern.sub(self._replace, line)
 
 # pronunciation_dict is a dictionary where the keys are words and the
 # values represent word the pronunciation of that word (in other words,
 # what the word sounds like).
 #
 pronunciation_dict = {}
+
+# Incremented whenever setPronunciation or clearPronunciations changes
+# pronunciation_dict.
+#
+_generation = 0
+
+# The compiled forms of pronunciation_dict, keyed by _cacheKey. Each is kept
+# with the entries it was compiled from.
+#
+_compiled = {}
+_cacheKey = None
+
+# The pronunciation_dict and _generation last compiled, with the compiled form.
+#
+_active = None
@@ -75,10 +75,71 @@ _eventManager = event_manager.getManager()
 _scriptManager = script_manager.getManager()
 _settingsManager = settings_manager.getManager()
 
+class _LazyAttribute:
+    """A script attribute which is created by calling the script's getter
+    for it the first time it is used, rather than when the script is. Most
+    scripts are created on focus and only ever use a few of them. Assigning
+    to the attribute replaces the value as it would for a plain attribute."""
+
+    def __init__(self, getterName):
+        self._getterName = getterName
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # Some getters, e.g. getBookmarks(), return the attribute if it
+        # exists and otherwise create and assign it themselves.
+        pending = instance.__dict__.setdefault("_pendingLazyAttributes", set())
+        if self._name in pending:
+            raise AttributeError(self._name)
+
+        pending.add(self._name)
+        try:
+            value = getattr(instance, self._getterName)()
+        finally:
+            pending.discard(self._name)
+
+        value = instance.__dict__.setdefault(self._name, value)
+        msg = f"SCRIPT: Created {self._name} for {instance.name}"
+        debug.println(debug.LEVEL_ALL, msg, True)
+        return value
+
+
 class Script:
     """The specific focus tracking scripts for applications.
     """
 
+    labelInference = _LazyAttribute("getLabelInference")
+    structuralNavigation = _LazyAttribute("getStructuralNavigation")
+    caretNavigation = _LazyAttribute("getCaretNavigation")
+    bookmarks = _LazyAttribute("getBookmarks")
+    liveRegionManager = _LazyAttribute("getLiveRegionManager")
+    notificationPresenter = _LazyAttribute("getNotificationPresenter")
+    flatReviewPresenter = _LazyAttribute("getFlatReviewPresenter")
+    speechAndVerbosityManager = _LazyAttribute("getSpeechAndVerbosityManager")
+    dateAndTimePresenter = _LazyAttribute("getDateAndTimePresenter")
+    objectNavigator = _LazyAttribute("getObjectNavigator")
+    whereAmIPresenter = _LazyAttribute("getWhereAmIPresenter")
+    learnModePresenter = _LazyAttribute("getLearnModePresenter")
+    mouseReviewer = _LazyAttribute("getMouseReviewer")
+    eventSynthesizer = _LazyAttribute("getEventSynthesizer")
+    actionPresenter = _LazyAttribute("getActionPresenter")
+    chat = _LazyAttribute("getChat")
+    spellcheck = _LazyAttribute("getSpellCheck")
+    inputEventHandlers = _LazyAttribute("_getInputEventHandlers")
+    keyBindings = _LazyAttribute("getKeyBindings")
+    brailleBindings = _LazyAttribute("getBrailleBindings")
+    formatting = _LazyAttribute("getFormatting")
+    brailleGenerator = _LazyAttribute("getBrailleGenerator")
+    soundGenerator = _LazyAttribute("getSoundGenerator")
+    speechGenerator = _LazyAttribute("getSpeechGenerator")
+    tutorialGenerator = _LazyAttribute("getTutorialGenerator")
+
     def __init__(self, app):
         """Creates a script for the given application, if necessary.
         This method should not be called by anyone except the
@@ -103,37 +164,9 @@ class Script:
         self.presentIfInactive = True
 
         self.utilities = self.getUtilities()
-        self.labelInference = self.getLabelInference()
-        self.structuralNavigation = self.getStructuralNavigation()
-        self.caretNavigation = self.getCaretNavigation()
-        self.bookmarks = self.getBookmarks()
-        self.liveRegionManager = self.getLiveRegionManager()
-        self.notificationPresenter = self.getNotificationPresenter()
-        self.flatReviewPresenter = self.getFlatReviewPresenter()
-        self.speechAndVerbosityManager = self.getSpeechAndVerbosityManager()
-        self.dateAndTimePresenter = self.getDateAndTimePresenter()
-        self.objectNavigator = self.getObjectNavigator()
-        self.whereAmIPresenter = self.getWhereAmIPresenter()
-        self.learnModePresenter = self.getLearnModePresenter()
-        self.mouseReviewer = self.getMouseReviewer()
-        self.eventSynthesizer = self.getEventSynthesizer()
-        self.actionPresenter = self.getActionPresenter()
-
-        self.chat = self.getChat()
-        self.inputEventHandlers = {}
         self.pointOfReference = {}
-        self.setupInputEventHandlers()
-        self.keyBindings = self.getKeyBindings()
-        self.brailleBindings = self.getBrailleBindings()
-
-        self.formatting = self.getFormatting()
-        self.brailleGenerator = self.getBrailleGenerator()
-        self.soundGenerator = self.getSoundGenerator()
-        self.speechGenerator = self.getSpeechGenerator()
         self.generatorCache = {}
         self.eventCache = {}
-        self.spellcheck = self.getSpellCheck()
-        self.tutorialGenerator = self.getTutorialGenerator()
 
         self.findCommandRun = False
         self._lastCommandWasStructNav = False
@@ -154,6 +187,13 @@ class Script:
         called by the key and braille bindings."""
         pass
 
+    def _getInputEventHandlers(self):
+        """Returns the input event handlers set up by setupInputEventHandlers."""
+
+        self.inputEventHandlers = {}
+        self.setupInputEventHandlers()
+        return self.inputEventHandlers
+
     def getKeyBindings(self):
         """Defines the key bindings for this script.
 
@@ -26,8 +26,11 @@ __license__   = "LGPL"
 
 import importlib
 
+from gi.repository import GLib
+
 from . import debug
 from . import orca_state
+from . import settings
 from .ax_object import AXObject
 from .ax_utilities import AXUtilities
 from .scripts import apps, toolkits
@@ -59,6 +62,10 @@ class ScriptManager:
             }
         self._toolkitNames = \
             {'WebKitGTK': 'WebKitGtk', 'GTK': 'gtk'}
+        self._missingModules = set()
+        self._prewarmQueue = []
+        self._prewarmed = set()
+        self._prewarmId = 0
 
         self.setActiveScript(None, "__init__")
         self._active = False
@@ -72,12 +79,18 @@ class ScriptManager:
         self._defaultScript.registerEventListeners()
         self.setActiveScript(self._defaultScript, "activate")
         self._active = True
+        if settings.prewarmScripts:
+            self.prewarmScripts()
         debug.println(debug.LEVEL_INFO, 'SCRIPT MANAGER: Activated', True)
 
     def deactivate(self):
         """Called when this script manager is deactivated."""
 
         debug.println(debug.LEVEL_INFO, 'SCRIPT MANAGER: Deactivating', True)
+        if self._prewarmId:
+            GLib.source_remove(self._prewarmId)
+            self._prewarmId = 0
+        self._prewarmQueue = []
         if self._defaultScript:
             self._defaultScript.deregisterEventListeners()
         self._defaultScript = None
@@ -144,12 +157,9 @@ class ScriptManager:
         script = None
         for package in self._scriptPackages:
             moduleName = '.'.join((package, name))
-            try:
-                module = importlib.import_module(moduleName)
-            except ImportError:
+            module = self._importModule(moduleName)
+            if module is None:
                 continue
-            except OSError:
-                debug.examineProcesses()
 
             debug.println(debug.LEVEL_INFO, f'SCRIPT MANAGER: Found {moduleName}', True)
             try:
@@ -165,6 +175,100 @@ class ScriptManager:
 
         return script
 
+    def _importModule(self, moduleName):
+        """Returns the module called moduleName, or None if it cannot be
+        imported. Modules which do not exist are only looked for once."""
+
+        if moduleName in self._missingModules:
+            return None
+
+        try:
+            return importlib.import_module(moduleName)
+        except ImportError:
+            self._missingModules.add(moduleName)
+        except OSError:
+            debug.examineProcesses()
+
+        return None
+
+    def prewarmScripts(self):
+        """Queues the script modules of the running applications to be
+        imported, one per idle callback, so that the first focus in each
+        of those applications only has to create the script."""
+
+        for app in AXUtilities.get_all_applications():
+            toolkitName = AXObject.get_application_toolkit_name(app)
+            for name in [self.getModuleName(app), self._toolkitNames.get(toolkitName, toolkitName)]:
+                if name in self._prewarmed or name in self._prewarmQueue:
+                    continue
+                if name in self._appModules or name in self._toolkitModules:
+                    self._prewarmQueue.append(name)
+
+        if self._prewarmQueue and not self._prewarmId:
+            msg = f'SCRIPT MANAGER: Prewarming {", ".join(self._prewarmQueue)}'
+            debug.println(debug.LEVEL_INFO, msg, True)
+            self._prewarmId = GLib.idle_add(self._prewarmNext, priority=GLib.PRIORITY_LOW)
+
+    def _prewarmNext(self):
+        """Imports the next queued script module, and builds a template
+        script from it so that the classes shared by all of its scripts,
+        e.g. the generators, have done their one-time setup."""
+
+        if not self._prewarmQueue:
+            self._prewarmId = 0
+            return False
+
+        name = self._prewarmQueue.pop(0)
+        self._prewarmed.add(name)
+        for package in self._scriptPackages:
+            moduleName = '.'.join((package, name))
+            module = self._importModule(moduleName)
+            if module is None:
+                continue
+
+            # Some scripts give settings which are unset a value of their own
+            # when they are created, e.g. sayAllOnLoad, which must not be left
+            # to whichever template happens to be built first.
+            savedSettings = dict(vars(settings))
+            try:
+                # Reading these attributes creates them. See script.py.
+                template = module.Script(None)
+                for attr in ["brailleGenerator", "soundGenerator", "speechGenerator"]:
+                    getattr(template, attr)
+            except Exception:
+                debug.printException(debug.LEVEL_INFO)
+                msg = f'SCRIPT MANAGER: Could not build a template from {moduleName}'
+                debug.println(debug.LEVEL_INFO, msg, True)
+            else:
+                msg = f'SCRIPT MANAGER: Prewarmed {moduleName}'
+                debug.println(debug.LEVEL_INFO, msg, True)
+            finally:
+                self._restoreSettings(savedSettings)
+            break
+
+        if self._prewarmQueue:
+            return True
+
+        self._prewarmId = 0
+        return False
+
+    @staticmethod
+    def _restoreSettings(savedSettings):
+        """Undoes any change to the settings since savedSettings, a copy of
+        the settings module's attributes, was made."""
+
+        current = vars(settings)
+        for name in set(current).difference(savedSettings):
+            msg = f'SCRIPT MANAGER: Removing setting {name} set by template'
+            debug.println(debug.LEVEL_INFO, msg, True)
+            delattr(settings, name)
+
+        for name, value in savedSettings.items():
+            if name not in current or current[name] is not value:
+                msg = f'SCRIPT MANAGER: Restoring setting {name} changed by template'
+                debug.println(debug.LEVEL_INFO, msg, True)
+                setattr(settings, name, value)
+
     def _createScript(self, app, obj=None):
         """For the given application, create a new script instance."""
 
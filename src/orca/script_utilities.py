@@ -85,6 +85,8 @@ class Utilities:
     WORDS_RE = re.compile(r"(\W+)", flags)
     SUPERSCRIPTS_RE = re.compile(f"[{''.join(SUPERSCRIPT_DIGITS)}]+", flags)
     SUBSCRIPTS_RE = re.compile(f"[{''.join(SUBSCRIPT_DIGITS)}]+", flags)
+    DIGITS_RE = re.compile(f"(?P<superscript>{SUPERSCRIPTS_RE.pattern})"
+                           f"|(?P<subscript>{SUBSCRIPTS_RE.pattern})", flags)
     PUNCTUATION = re.compile(r"[^\w\s]", flags)
 
     # generatorCache
@@ -3086,6 +3088,7 @@ class Utilities:
 
         if settings.speakMultiCaseStringsAsWords:
             line = self._processMultiCaseString(line)
+        splitLine = line
 
         if self.speakMathSymbolNames():
             line = mathsymbols.adjustForSpeech(line)
@@ -3102,11 +3105,11 @@ class Utilities:
         if not settings.usePronunciationDictionary:
             return line
 
-        newLine = ""
-        words = self.WORDS_RE.split(line)
-        newLine = ''.join(map(pronunciation_dict.getPronunciation, words))
+        newLine = pronunciation_dict.adjustLine(line)
 
-        if settings.speakMultiCaseStringsAsWords:
+        # Multi-case strings were already split, so only text which has been
+        # added since can need it.
+        if settings.speakMultiCaseStringsAsWords and newLine != splitLine:
             newLine = self._processMultiCaseString(newLine)
 
         return newLine
@@ -3159,20 +3162,17 @@ class Utilities:
         Returns: a new string which contains actual digits.
         """
 
-        subscripted = set(re.findall(self.SUBSCRIPTS_RE, string))
-        superscripted = set(re.findall(self.SUPERSCRIPTS_RE, string))
-
-        for number in superscripted:
-            new = [str(self.SUPERSCRIPT_DIGITS.index(d)) for d in number]
-            newString = messages.DIGITS_SUPERSCRIPT % "".join(new)
-            string = re.sub(number, newString, string)
+        def _replace(match):
+            number = match.group("superscript")
+            if number:
+                new = [str(self.SUPERSCRIPT_DIGITS.index(d)) for d in number]
+                return messages.DIGITS_SUPERSCRIPT % "".join(new)
 
-        for number in subscripted:
+            number = match.group("subscript")
             new = [str(self.SUBSCRIPT_DIGITS.index(d)) for d in number]
-            newString = messages.DIGITS_SUBSCRIPT % "".join(new)
-            string = re.sub(number, newString, string)
+            return messages.DIGITS_SUBSCRIPT % "".join(new)
 
-        return string
+        return self.DIGITS_RE.sub(_replace, string)
 
     def indentationDescription(self, line):
         if _settingsManager.getSetting('onlySpeakDisplayedText') \
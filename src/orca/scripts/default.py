@@ -214,6 +214,11 @@ class Script(script.Script):
                 Script.cycleDebugLevel,
                 cmdnames.CYCLE_DEBUG_LEVEL)
 
+        self.inputEventHandlers["dumpEventStatisticsHandler"] = \
+            input_event.InputEventHandler(
+                Script.dumpEventStatistics,
+                cmdnames.DUMP_EVENT_STATISTICS)
+
         self.inputEventHandlers["bypassNextCommandHandler"] = \
             input_event.InputEventHandler(
                 Script.bypassNextCommand,
@@ -1096,6 +1101,17 @@ class Script(script.Script):
 
         return True
 
+    def dumpEventStatistics(self, inputEvent=None):
+        try:
+            filename = orca.getManager().getEventManager().dumpStatistics()
+        except Exception:
+            debug.printException(debug.LEVEL_WARNING)
+            self.presentMessage("Could not save event statistics.")
+            return True
+
+        self.presentMessage(f"Event statistics saved to {filename}.", "Event statistics saved.")
+        return True
+
     ########################################################################
     #                                                                      #
     # AT-SPI OBJECT EVENT HANDLERS                                         #
@@ -41,20 +41,6 @@ from orca.ax_utilities import AXUtilities
 
 class Utilities(web.Utilities):
 
-    def __init__(self, script):
-        super().__init__(script)
-        self._isStaticTextLeaf = {}
-        self._isPseudoElement = {}
-        self._isListItemMarker = {}
-        self._topLevelObject = {}
-
-    def clearCachedObjects(self):
-        super().clearCachedObjects()
-        self._isStaticTextLeaf = {}
-        self._isPseudoElement = {}
-        self._isListItemMarker = {}
-        self._topLevelObject = {}
-
     def isStaticTextLeaf(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return super().isStaticTextLeaf(obj)
@@ -65,7 +51,7 @@ class Utilities(web.Utilities):
         if self.isListItemMarker(obj):
             return False
 
-        rv = self._isStaticTextLeaf.get(hash(obj))
+        rv = self._objectCache.get("isStaticTextLeaf", obj)
         if rv is not None:
             return rv
 
@@ -75,14 +61,14 @@ class Utilities(web.Utilities):
             msg = f"CHROMIUM: {obj} believed to be static text leaf"
             debug.println(debug.LEVEL_INFO, msg, True)
 
-        self._isStaticTextLeaf[hash(obj)] = rv
+        self._objectCache.set("isStaticTextLeaf", obj, rv)
         return rv
 
     def isPseudoElement(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return super().isPseudoElement(obj)
 
-        rv = self._isPseudoElement.get(hash(obj))
+        rv = self._objectCache.get("isPseudoElement", obj)
         if rv is not None:
             return rv
 
@@ -91,14 +77,14 @@ class Utilities(web.Utilities):
             msg = f"CHROMIUM: {obj} believed to be pseudo element"
             debug.println(debug.LEVEL_INFO, msg, True)
 
-        self._isPseudoElement[hash(obj)] = rv
+        self._objectCache.set("isPseudoElement", obj, rv)
         return rv
 
     def isListItemMarker(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isListItemMarker.get(hash(obj))
+        rv = self._objectCache.get("isListItemMarker", obj)
         if rv is not None:
             return rv
 
@@ -115,7 +101,7 @@ class Utilities(web.Utilities):
             else:
                 rv = AXObject.get_name(obj) != self.displayedText(parent)
 
-        self._isListItemMarker[hash(obj)] = rv
+        self._objectCache.set("isListItemMarker", obj, rv)
         return rv
 
     def isMenuInCollapsedSelectElement(self, obj):
@@ -179,7 +165,7 @@ class Utilities(web.Utilities):
                 debug.println(debug.LEVEL_INFO, msg, True)
                 return parent
 
-        cached = self._topLevelObject.get(hash(obj))
+        cached = self._objectCache.get("topLevelObject", obj)
         if cached is not None:
             return cached
 
@@ -212,7 +198,7 @@ class Utilities(web.Utilities):
             msg = f"CHROMIUM: Top level object for {autocomplete} is {result}"
             debug.println(debug.LEVEL_INFO, msg, True)
 
-        self._topLevelObject[hash(obj)] = result
+        self._objectCache.set("topLevelObject", obj, result)
         return result
 
     def autocompleteForPopup(self, obj):
@@ -1843,7 +1843,7 @@ class Script(default.Script):
             else:
                 msg = f"WEB: Not dumping full cache. Focus is {orca_state.locusOfFocus}"
                 debug.println(debug.LEVEL_INFO, msg, True)
-                self.utilities.clearCachedObjects()
+                self.utilities.clearCachedObjectsInSubtree(event.source)
 
         elif isLiveRegion:
             if self.utilities.handleAsLiveRegion(event):
@@ -1953,7 +1953,7 @@ class Script(default.Script):
             else:
                 msg = f"WEB: Not dumping full cache. Focus is {orca_state.locusOfFocus}"
                 debug.println(debug.LEVEL_INFO, msg, True)
-                self.utilities.clearCachedObjects()
+                self.utilities.clearCachedObjectsInSubtree(event.source)
 
         if self.utilities.handleEventForRemovedChild(event):
             msg = "WEB: Event handled for removed child."
@@ -50,76 +50,148 @@ _scriptManager = script_manager.getManager()
 _settingsManager = settings_manager.getManager()
 
 
+class ObjectCache:
+    """Stores the cached results of the per-object predicates. Each object's
+    ancestors are recorded along with its results so that the results which
+    a change to a subtree might affect can be removed without clearing the
+    rest of the cache."""
+
+    # The predicates whose results depend on relations to objects which may be
+    # anywhere in the document, e.g. a label and what it labels. A change to
+    # any subtree removes all of their results.
+    RELATIONAL = frozenset(["displayedLabelText",
+                            "hasDetails",
+                            "hasVisibleCaption",
+                            "inferredLabels",
+                            "isDetails",
+                            "isErrorMessage",
+                            "isOffScreenLabel",
+                            "labelIsAncestorOfLabelled",
+                            "labelTargets",
+                            "labelsForObject",
+                            "shouldInferLabelFor"])
+
+    def __init__(self):
+        self._results = {}
+        self._ancestors = {}
+        self._descendants = {}
+        self._relational = set()
+        self._stats = {}
+
+    def get(self, name, obj):
+        """Returns the cached result of name for obj, or None."""
+
+        rv = self._results.get(hash(obj), {}).get(name)
+        stats = self._stats.setdefault(name, [0, 0])
+        stats[rv is None] += 1
+        return rv
+
+    def set(self, name, obj, value):
+        """Caches value as the result of name for obj."""
+
+        key = hash(obj)
+        if key not in self._ancestors:
+            self._recordAncestors(obj)
+        self._results.setdefault(key, {})[name] = value
+        if name in self.RELATIONAL:
+            self._relational.add(key)
+
+    def _recordAncestors(self, obj):
+        ancestors = []
+        parent = AXObject.get_parent(obj)
+        while parent is not None:
+            parentKey = hash(parent)
+            if parentKey in ancestors:
+                break
+            ancestors.append(parentKey)
+            if parentKey in self._ancestors:
+                ancestors.extend(self._ancestors[parentKey])
+                break
+            parent = AXObject.get_parent(parent)
+
+        key = hash(obj)
+        self._ancestors[key] = ancestors
+        for ancestor in ancestors:
+            self._descendants.setdefault(ancestor, set()).add(key)
+
+    def _forget(self, key):
+        self._results.pop(key, None)
+        for ancestor in self._ancestors.pop(key, []):
+            descendants = self._descendants.get(ancestor)
+            if descendants is not None:
+                descendants.discard(key)
+
+    def clear(self):
+        """Removes all cached results."""
+
+        self._results = {}
+        self._ancestors = {}
+        self._descendants = {}
+        self._relational = set()
+
+    def clearSubtree(self, root):
+        """Removes the cached results for root, its descendants, and its
+        ancestors, and the results of the RELATIONAL predicates for all
+        objects. Returns the number of objects whose results were removed."""
+
+        rootKey = hash(root)
+        if rootKey in self._ancestors:
+            ancestors = self._ancestors[rootKey]
+        else:
+            ancestors = []
+            parent = AXObject.get_parent(root)
+            while parent is not None and hash(parent) not in ancestors:
+                ancestors.append(hash(parent))
+                parent = AXObject.get_parent(parent)
+
+        # The ancestors have not moved, but their results may depend on the
+        # subtree which has changed.
+        count = 0
+        for key in ancestors:
+            if self._results.pop(key, None) is not None:
+                count += 1
+
+        subtree = {rootKey}.union(self._descendants.pop(rootKey, set()))
+        for key in subtree:
+            if key in self._results:
+                count += 1
+            self._forget(key)
+
+        for key in self._relational.difference(subtree):
+            results = self._results.get(key)
+            if not results:
+                continue
+            names = self.RELATIONAL.intersection(results)
+            if names:
+                count += 1
+            for name in names:
+                del results[name]
+        self._relational = set()
+
+        return count
+
+    def statsAsString(self):
+        """Returns a string containing the hit rate of each predicate."""
+
+        def asString(item):
+            name, (hits, misses) = item
+            return f"{name}: {hits}/{hits + misses} ({100 * hits // (hits + misses)}%)"
+
+        return ", ".join(map(asString, sorted(self._stats.items())))
+
+
 class Utilities(script_utilities.Utilities):
 
     def __init__(self, script):
         super().__init__(script)
 
-        self._objectAttributes = {}
+        self._objectCache = ObjectCache()
         self._currentTextAttrs = {}
         self._caretContexts = {}
         self._priorContexts = {}
         self._canHaveCaretContextDecision = {}
         self._contextPathsRolesAndNames = {}
-        self._paths = {}
-        self._inDocumentContent = {}
-        self._inTopLevelWebApp = {}
-        self._isTextBlockElement = {}
-        self._isContentEditableWithEmbeddedObjects = {}
-        self._isCodeDescendant = {}
-        self._isEntryDescendant = {}
-        self._hasGridDescendant = {}
-        self._isGridDescendant = {}
-        self._isLabelDescendant = {}
-        self._isModalDialogDescendant = {}
-        self._isMenuDescendant = {}
-        self._isNavigableToolTipDescendant = {}
-        self._isToolBarDescendant = {}
-        self._isWebAppDescendant = {}
-        self._isLayoutOnly = {}
-        self._isFocusableWithMathChild = {}
-        self._mathNestingLevel = {}
-        self._isOffScreenLabel = {}
-        self._labelIsAncestorOfLabelled = {}
-        self._elementLinesAreSingleChars= {}
-        self._elementLinesAreSingleWords= {}
-        self._hasNoSize = {}
-        self._hasLongDesc = {}
-        self._hasVisibleCaption = {}
-        self._hasDetails = {}
-        self._isDetails = {}
-        self._isNonInteractiveDescendantOfControl = {}
-        self._isClickableElement = {}
-        self._isAnchor = {}
-        self._isEditableComboBox = {}
-        self._isErrorMessage = {}
-        self._isInlineIframeDescendant = {}
-        self._isInlineListItem = {}
-        self._isInlineListDescendant = {}
-        self._isLandmark = {}
-        self._isLink = {}
-        self._isListDescendant = {}
-        self._isNonNavigablePopup = {}
-        self._isNonEntryTextWidget = {}
-        self._isCustomImage = {}
-        self._isUselessImage = {}
-        self._isRedundantSVG = {}
-        self._isUselessEmptyElement = {}
-        self._hasNameAndActionAndNoUsefulChildren = {}
-        self._isNonNavigableEmbeddedDocument = {}
-        self._isParentOfNullChild = {}
-        self._inferredLabels = {}
-        self._labelsForObject = {}
-        self._labelTargets = {}
-        self._descriptionListTerms = {}
-        self._valuesForTerm = {}
-        self._displayedLabelText = {}
-        self._mimeType = {}
-        self._preferDescriptionOverName = {}
         self._shouldFilter = {}
-        self._shouldInferLabelFor = {}
-        self._treatAsTextObject = {}
-        self._treatAsDiv = {}
         self._currentObjectContents = None
         self._currentSentenceContents = None
         self._currentLineContents = None
@@ -159,66 +231,22 @@ class Utilities(script_utilities.Utilities):
 
     def clearCachedObjects(self):
         debug.println(debug.LEVEL_INFO, "WEB: cleaning up cached objects", True)
-        self._objectAttributes = {}
-        self._inDocumentContent = {}
-        self._inTopLevelWebApp = {}
-        self._isTextBlockElement = {}
-        self._isContentEditableWithEmbeddedObjects = {}
-        self._isCodeDescendant = {}
-        self._isEntryDescendant = {}
-        self._hasGridDescendant = {}
-        self._isGridDescendant = {}
-        self._isLabelDescendant = {}
-        self._isMenuDescendant = {}
-        self._isModalDialogDescendant = {}
-        self._isNavigableToolTipDescendant = {}
-        self._isToolBarDescendant = {}
-        self._isWebAppDescendant = {}
-        self._isLayoutOnly = {}
-        self._isFocusableWithMathChild = {}
-        self._mathNestingLevel = {}
-        self._isOffScreenLabel = {}
-        self._labelIsAncestorOfLabelled = {}
-        self._elementLinesAreSingleChars= {}
-        self._elementLinesAreSingleWords= {}
-        self._hasNoSize = {}
-        self._hasLongDesc = {}
-        self._hasVisibleCaption = {}
-        self._hasDetails = {}
-        self._isDetails = {}
-        self._isNonInteractiveDescendantOfControl = {}
-        self._isClickableElement = {}
-        self._isAnchor = {}
-        self._isEditableComboBox = {}
-        self._isErrorMessage = {}
-        self._isInlineIframeDescendant = {}
-        self._isInlineListItem = {}
-        self._isInlineListDescendant = {}
-        self._isLandmark = {}
-        self._isLink = {}
-        self._isListDescendant = {}
-        self._isNonNavigablePopup = {}
-        self._isNonEntryTextWidget = {}
-        self._isCustomImage = {}
-        self._isUselessImage = {}
-        self._isRedundantSVG = {}
-        self._isUselessEmptyElement = {}
-        self._hasNameAndActionAndNoUsefulChildren = {}
-        self._isNonNavigableEmbeddedDocument = {}
-        self._isParentOfNullChild = {}
-        self._inferredLabels = {}
-        self._labelsForObject = {}
-        self._labelTargets = {}
-        self._descriptionListTerms = {}
-        self._valuesForTerm = {}
-        self._displayedLabelText = {}
-        self._mimeType = {}
-        self._preferDescriptionOverName = {}
+        msg = f"WEB: Object cache hit rates: {self._objectCache.statsAsString()}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+        self._objectCache.clear()
+        self._clearCachedContexts()
+
+    def clearCachedObjectsInSubtree(self, root):
+        """Clears the cached objects which a change to the subtree of root might
+        affect, leaving the cached objects for the rest of the document."""
+
+        count = self._objectCache.clearSubtree(root)
+        msg = f"WEB: Cleared cached info for {count} objects in subtree of {root}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+        self._clearCachedContexts()
+
+    def _clearCachedContexts(self):
         self._shouldFilter = {}
-        self._shouldInferLabelFor = {}
-        self._treatAsTextObject = {}
-        self._treatAsDiv = {}
-        self._paths = {}
         self._contextPathsRolesAndNames = {}
         self._canHaveCaretContextDecision = {}
         self._cleanupContexts()
@@ -250,13 +278,13 @@ class Utilities(script_utilities.Utilities):
         if self.isDocument(obj):
             return True
 
-        rv = self._inDocumentContent.get(hash(obj))
+        rv = self._objectCache.get("inDocumentContent", obj)
         if rv is not None:
             return rv
 
         document = self.getDocumentForObject(obj)
         rv = document is not None
-        self._inDocumentContent[hash(obj)] = rv
+        self._objectCache.set("inDocumentContent", obj, rv)
         return rv
 
     def _getDocumentsEmbeddedBy(self, frame):
@@ -330,7 +358,7 @@ class Utilities(script_utilities.Utilities):
 
     def mimeType(self, documentFrame=None):
         documentFrame = documentFrame or self.documentFrame()
-        rv = self._mimeType.get(hash(documentFrame))
+        rv = self._objectCache.get("mimeType", documentFrame)
         if rv is not None:
             return rv
 
@@ -346,7 +374,7 @@ class Utilities(script_utilities.Utilities):
         else:
             rv = attrs.get("MimeType")
             msg = f"WEB: MimeType of {documentFrame} is '{rv}'"
-            self._mimeType[hash(documentFrame)] = rv
+            self._objectCache.set("mimeType", documentFrame, rv)
 
         return rv
 
@@ -453,12 +481,12 @@ class Utilities(script_utilities.Utilities):
             return super().objectAttributes(obj)
 
         if useCache:
-            rv = self._objectAttributes.get(hash(obj))
+            rv = self._objectCache.get("objectAttributes", obj)
             if rv is not None:
                 return rv
 
         rv = AXObject.get_attributes_dict(obj)
-        self._objectAttributes[hash(obj)] = rv
+        self._objectCache.set("objectAttributes", obj, rv)
         return rv
 
     def getRoleDescription(self, obj, isBraille=False):
@@ -917,7 +945,7 @@ class Utilities(script_utilities.Utilities):
         return result
 
     def isNonEntryTextWidget(self, obj):
-        rv = self._isNonEntryTextWidget.get(hash(obj))
+        rv = self._objectCache.get("isNonEntryTextWidget", obj)
         if rv is not None:
             return rv
 
@@ -942,14 +970,14 @@ class Utilities(script_utilities.Utilities):
             else:
                 rv = not self.isTextBlockElement(obj)
 
-        self._isNonEntryTextWidget[hash(obj)] = rv
+        self._objectCache.set("isNonEntryTextWidget", obj, rv)
         return rv
 
     def treatAsTextObject(self, obj, excludeNonEntryTextWidgets=True):
         if not obj or self.isDead(obj):
             return False
 
-        rv = self._treatAsTextObject.get(hash(obj))
+        rv = self._objectCache.get("treatAsTextObject", obj)
         if rv is not None:
             return rv
 
@@ -991,7 +1019,7 @@ class Utilities(script_utilities.Utilities):
                 debug.println(debug.LEVEL_INFO, msg, True)
                 rv = False
 
-        self._treatAsTextObject[hash(obj)] = rv
+        self._objectCache.set("treatAsTextObject", obj, rv)
         return rv
 
     def queryNonEmptyText(self, obj, excludeNonEntryTextWidgets=True):
@@ -1007,7 +1035,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._hasNameAndActionAndNoUsefulChildren.get(hash(obj))
+        rv = self._objectCache.get("hasNameAndActionAndNoUsefulChildren", obj)
         if rv is not None:
             return rv
 
@@ -1023,14 +1051,14 @@ class Utilities(script_utilities.Utilities):
             msg = f"WEB: {obj} has name and action and no useful children"
             debug.println(debug.LEVEL_INFO, msg, True)
 
-        self._hasNameAndActionAndNoUsefulChildren[hash(obj)] = rv
+        self._objectCache.set("hasNameAndActionAndNoUsefulChildren", obj, rv)
         return rv
 
     def isNonInteractiveDescendantOfControl(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isNonInteractiveDescendantOfControl.get(hash(obj))
+        rv = self._objectCache.get("isNonInteractiveDescendantOfControl", obj)
         if rv is not None:
             return rv
 
@@ -1050,7 +1078,7 @@ class Utilities(script_utilities.Utilities):
                         Atspi.Role.TREE_ITEM]
             rv = AXObject.find_ancestor(obj, lambda x: AXObject.get_role(x) in controls)
 
-        self._isNonInteractiveDescendantOfControl[hash(obj)] = rv
+        self._objectCache.set("isNonInteractiveDescendantOfControl", obj, rv)
         return rv
 
     def _treatObjectAsWhole(self, obj, offset=None):
@@ -1211,10 +1239,12 @@ class Utilities(script_utilities.Utilities):
 
         if boundary is None:
             string, start, end = text.getText(0, -1), 0, text.characterCount
-            s = stringForDebug(string)
-            msg = "WEB: Results for text at offset %i for %s using %s:\n" \
-                  "     String: '%s', Start: %i, End: %i." % (offset, obj, boundary, s, start, end)
-            debug.println(debug.LEVEL_INFO, msg, True)
+            debug.printLazy(
+                debug.LEVEL_INFO,
+                lambda: "WEB: Results for text at offset %i for %s using %s:\n"
+                        "     String: '%s', Start: %i, End: %i."
+                        % (offset, obj, boundary, stringForDebug(string), start, end),
+                timestamp=True)
             return string, start, end
 
         if boundary == Atspi.TextBoundaryType.SENTENCE_START \
@@ -1223,28 +1253,32 @@ class Utilities(script_utilities.Utilities):
             if AXObject.get_role(obj) in [Atspi.Role.LIST_ITEM, Atspi.Role.HEADING] \
                or not (re.search(r"\w", allText) and self.isTextBlockElement(obj)):
                 string, start, end = allText, 0, text.characterCount
-                s = stringForDebug(string)
-                msg = "WEB: Results for text at offset %i for %s using %s:\n" \
-                      "     String: '%s', Start: %i, End: %i." % \
-                        (offset, obj, boundary, s, start, end)
-                debug.println(debug.LEVEL_INFO, msg, True)
+                debug.printLazy(
+                    debug.LEVEL_INFO,
+                    lambda: "WEB: Results for text at offset %i for %s using %s:\n"
+                            "     String: '%s', Start: %i, End: %i."
+                            % (offset, obj, boundary, stringForDebug(string), start, end),
+                    timestamp=True)
                 return string, start, end
 
         if boundary == Atspi.TextBoundaryType.LINE_START and self.treatAsEndOfLine(obj, offset):
             offset -= 1
-            msg = "WEB: Line sought for %s at end of text. Adjusting offset to %i." % (obj, offset)
-            debug.println(debug.LEVEL_INFO, msg, True)
+            debug.printLazy(debug.LEVEL_INFO,
+                            "WEB: Line sought for %s at end of text. Adjusting offset to %i.",
+                            obj, offset, timestamp=True)
 
         offset = max(0, offset)
         string, start, end = text.getTextAtOffset(offset, boundary)
 
         # The above should be all that we need to do, but....
         if not self._attemptBrokenTextRecovery(obj, boundary=boundary):
-            s = stringForDebug(string)
-            msg = "WEB: Results for text at offset %i for %s using %s:\n" \
-                  "     String: '%s', Start: %i, End: %i.\n" \
-                  "     Not checking for broken text." % (offset, obj, boundary, s, start, end)
-            debug.println(debug.LEVEL_INFO, msg, True)
+            debug.printLazy(
+                debug.LEVEL_INFO,
+                lambda: "WEB: Results for text at offset %i for %s using %s:\n"
+                        "     String: '%s', Start: %i, End: %i.\n"
+                        "     Not checking for broken text."
+                        % (offset, obj, boundary, stringForDebug(string), start, end),
+                timestamp=True)
             return string, start, end
 
         needSadHack = False
@@ -1307,10 +1341,12 @@ class Utilities(script_utilities.Utilities):
             debug.println(debug.LEVEL_INFO, msg, True)
             return sadString, sadStart, sadEnd
 
-        s = stringForDebug(string)
-        msg = "WEB: Results for text at offset %i for %s using %s:\n" \
-              "     String: '%s', Start: %i, End: %i." % (offset, obj, boundary, s, start, end)
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(
+            debug.LEVEL_INFO,
+            lambda: "WEB: Results for text at offset %i for %s using %s:\n"
+                    "     String: '%s', Start: %i, End: %i."
+                    % (offset, obj, boundary, stringForDebug(string), start, end),
+            timestamp=True)
         return string, start, end
 
     def _getContentsForObj(self, obj, offset, boundary):
@@ -1823,8 +1859,8 @@ class Utilities(script_utilities.Utilities):
             prevObj, pOffset = self.findPreviousCaretInOrder(firstObj, firstStart)
 
         prevEndTime = time.time()
-        msg = f"INFO: Time to get line contents on left: {prevEndTime - prevStartTime:.4f}s"
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(debug.LEVEL_INFO, "INFO: Time to get line contents on left: %.4fs",
+                        prevEndTime - prevStartTime, timestamp=True)
 
         # Check for things on the same line to the right of this object.
         nextStartTime = time.time()
@@ -1853,8 +1889,8 @@ class Utilities(script_utilities.Utilities):
             nextObj, nOffset = self.findNextCaretInOrder(lastObj, lastEnd - 1)
 
         nextEndTime = time.time()
-        msg = f"INFO: Time to get line contents on right: {nextEndTime - nextStartTime:.4f}s"
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(debug.LEVEL_INFO, "INFO: Time to get line contents on right: %.4fs",
+                        nextEndTime - nextStartTime, timestamp=True)
 
         firstObj, firstStart, firstEnd, firstString = objects[0]
         if firstString == "\n" and len(objects) > 1:
@@ -1863,8 +1899,8 @@ class Utilities(script_utilities.Utilities):
         if useCache:
             self._currentLineContents = objects
 
-        msg = f"INFO: Time to get line contents: {time.time() - startTime:.4f}s"
-        debug.println(debug.LEVEL_INFO, msg, True)
+        debug.printLazy(debug.LEVEL_INFO, "INFO: Time to get line contents: %.4fs",
+                        time.time() - startTime, timestamp=True)
 
         self._debugContentsInfo(obj, offset, objects, "Line (layout mode)")
 
@@ -2131,7 +2167,7 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             obj = orca_state.locusOfFocus
 
-        rv = self._inTopLevelWebApp.get(hash(obj))
+        rv = self._objectCache.get("inTopLevelWebApp", obj)
         if rv is not None:
             return rv
 
@@ -2140,7 +2176,7 @@ class Utilities(script_utilities.Utilities):
             document = obj
 
         rv = self.isTopLevelWebApp(document)
-        self._inTopLevelWebApp[hash(obj)] = rv
+        self._objectCache.set("inTopLevelWebApp", obj, rv)
         return rv
 
     def isTopLevelWebApp(self, obj):
@@ -2312,7 +2348,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isFocusableWithMathChild.get(hash(obj))
+        rv = self._objectCache.get("isFocusableWithMathChild", obj)
         if rv is not None:
             return rv
 
@@ -2323,7 +2359,7 @@ class Utilities(script_utilities.Utilities):
                 rv = True
                 break
 
-        self._isFocusableWithMathChild[hash(obj)] = rv
+        self._objectCache.set("isFocusableWithMathChild", obj, rv)
         return rv
 
     def isFocusedWithMathChild(self, obj):
@@ -2335,7 +2371,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isTextBlockElement.get(hash(obj))
+        rv = self._objectCache.get("isTextBlockElement", obj)
         if rv is not None:
             return rv
 
@@ -2358,7 +2394,7 @@ class Utilities(script_utilities.Utilities):
         else:
             rv = False
 
-        self._isTextBlockElement[hash(obj)] = rv
+        self._objectCache.set("isTextBlockElement", obj, rv)
         return rv
 
     def _advanceCaretInEmptyObject(self, obj):
@@ -2401,7 +2437,7 @@ class Utilities(script_utilities.Utilities):
         if AXUtilities.is_panel(obj) and not childCount:
             return True
 
-        rv = self._treatAsDiv.get(hash(obj))
+        rv = self._objectCache.get("treatAsDiv", obj)
         if rv is not None:
             return rv
 
@@ -2424,7 +2460,7 @@ class Utilities(script_utilities.Utilities):
 
                 rv = bool([x for x in AXObject.iter_children(parent, pred2)])
 
-        self._treatAsDiv[hash(obj)] = rv
+        self._objectCache.set("treatAsDiv", obj, rv)
         return rv
 
     def isAriaAlert(self, obj):
@@ -2508,13 +2544,13 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return False
 
-        rv = self._isInlineIframeDescendant.get(hash(obj))
+        rv = self._objectCache.get("isInlineIframeDescendant", obj)
         if rv is not None:
             return rv
 
         ancestor = AXObject.find_ancestor(obj, self.isInlineIframe)
         rv = ancestor is not None
-        self._isInlineIframeDescendant[hash(obj)] = rv
+        self._objectCache.set("isInlineIframeDescendant", obj, rv)
         return rv
 
     def isInlineSuggestion(self, obj):
@@ -2797,7 +2833,7 @@ class Utilities(script_utilities.Utilities):
         return [attrs.get('open', '('), attrs.get('close', ')')]
 
     def getMathNestingLevel(self, obj, test=None):
-        rv = self._mathNestingLevel.get(hash(obj))
+        rv = self._objectCache.get("mathNestingLevel", obj)
         if rv is not None:
             return rv
 
@@ -2812,7 +2848,7 @@ class Utilities(script_utilities.Utilities):
             ancestor = AXObject.find_ancestor(ancestor, pred)
             rv += 1
 
-        self._mathNestingLevel[hash(obj)] = rv
+        self._objectCache.set("mathNestingLevel", obj, rv)
         return rv
 
     def filterContentsForPresentation(self, contents, inferLabels=False):
@@ -2875,7 +2911,7 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return False
 
-        rv = self._hasGridDescendant.get(hash(obj))
+        rv = self._objectCache.get("hasGridDescendant", obj)
         if rv is not None:
             return rv
 
@@ -2892,19 +2928,19 @@ class Utilities(script_utilities.Utilities):
             grids = AXUtilities.find_all_grids(obj)
             rv = bool(grids)
 
-        self._hasGridDescendant[hash(obj)] = rv
+        self._objectCache.set("hasGridDescendant", obj, rv)
         return rv
 
     def isGridDescendant(self, obj):
         if not obj:
             return False
 
-        rv = self._isGridDescendant.get(hash(obj))
+        rv = self._objectCache.get("isGridDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, self.supportsSelectionAndTable) is not None
-        self._isGridDescendant[hash(obj)] = rv
+        self._objectCache.set("isGridDescendant", obj, rv)
         return rv
 
     def isSorted(self, obj):
@@ -3048,24 +3084,24 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return False
 
-        rv = self._isEntryDescendant.get(hash(obj))
+        rv = self._objectCache.get("isEntryDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, AXUtilities.is_entry) is not None
-        self._isEntryDescendant[hash(obj)] = rv
+        self._objectCache.set("isEntryDescendant", obj, rv)
         return rv
 
     def isLabelDescendant(self, obj):
         if not obj:
             return False
 
-        rv = self._isLabelDescendant.get(hash(obj))
+        rv = self._objectCache.get("isLabelDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, AXUtilities.is_label_or_caption) is not None
-        self._isLabelDescendant[hash(obj)] = rv
+        self._objectCache.set("isLabelDescendant", obj, rv)
         return rv
 
     def isMenuInCollapsedSelectElement(self, obj):
@@ -3075,31 +3111,31 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return False
 
-        rv = self._isMenuDescendant.get(hash(obj))
+        rv = self._objectCache.get("isMenuDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, AXUtilities.is_menu) is not None
-        self._isMenuDescendant[hash(obj)] = rv
+        self._objectCache.set("isMenuDescendant", obj, rv)
         return rv
 
     def isModalDialogDescendant(self, obj):
         if not obj:
             return False
 
-        rv = self._isModalDialogDescendant.get(hash(obj))
+        rv = self._objectCache.get("isModalDialogDescendant", obj)
         if rv is not None:
             return rv
 
         rv = super().isModalDialogDescendant(obj)
-        self._isModalDialogDescendant[hash(obj)] = rv
+        self._objectCache.set("isModalDialogDescendant", obj, rv)
         return rv
 
     def isNavigableToolTipDescendant(self, obj):
         if not obj:
             return False
 
-        rv = self._isNavigableToolTipDescendant.get(hash(obj))
+        rv = self._objectCache.get("isNavigableToolTipDescendant", obj)
         if rv is not None:
             return rv
 
@@ -3108,7 +3144,7 @@ class Utilities(script_utilities.Utilities):
         else:
             ancestor = AXObject.find_ancestor(obj, AXUtilities.is_tool_tip)
         rv = ancestor and not self.isNonNavigablePopup(ancestor)
-        self._isNavigableToolTipDescendant[hash(obj)] = rv
+        self._objectCache.set("isNavigableToolTipDescendant", obj, rv)
         return rv
 
     def isTime(self, obj):
@@ -3118,31 +3154,31 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return False
 
-        rv = self._isToolBarDescendant.get(hash(obj))
+        rv = self._objectCache.get("isToolBarDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, AXUtilities.is_tool_bar) is not None
-        self._isToolBarDescendant[hash(obj)] = rv
+        self._objectCache.set("isToolBarDescendant", obj, rv)
         return rv
 
     def isWebAppDescendant(self, obj):
         if not obj:
             return False
 
-        rv = self._isWebAppDescendant.get(hash(obj))
+        rv = self._objectCache.get("isWebAppDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, AXUtilities.is_embedded) is not None
-        self._isWebAppDescendant[hash(obj)] = rv
+        self._objectCache.set("isWebAppDescendant", obj, rv)
         return rv
 
     def isLayoutOnly(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return super().isLayoutOnly(obj)
 
-        rv = self._isLayoutOnly.get(hash(obj))
+        rv = self._objectCache.get("isLayoutOnly", obj)
         if rv is not None:
             if rv:
                 msg = f"WEB: {obj} is deemed to be layout only"
@@ -3194,7 +3230,7 @@ class Utilities(script_utilities.Utilities):
             msg = f"WEB: {obj} is deemed to be layout only"
             debug.println(debug.LEVEL_INFO, msg, True)
 
-        self._isLayoutOnly[hash(obj)] = rv
+        self._objectCache.set("isLayoutOnly", obj, rv)
         return rv
 
     def elementIsPreformattedText(self, obj):
@@ -3213,7 +3249,7 @@ class Utilities(script_utilities.Utilities):
         if self.elementIsPreformattedText(obj):
             return False
 
-        rv = self._elementLinesAreSingleWords.get(hash(obj))
+        rv = self._objectCache.get("elementLinesAreSingleWords", obj)
         if rv is not None:
             return rv
 
@@ -3255,14 +3291,14 @@ class Utilities(script_utilities.Utilities):
                     break
                 i = max(i+1, end)
 
-        self._elementLinesAreSingleWords[hash(obj)] = rv
+        self._objectCache.set("elementLinesAreSingleWords", obj, rv)
         return rv
 
     def elementLinesAreSingleChars(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._elementLinesAreSingleChars.get(hash(obj))
+        rv = self._objectCache.get("elementLinesAreSingleChars", obj)
         if rv is not None:
             return rv
 
@@ -3305,14 +3341,14 @@ class Utilities(script_utilities.Utilities):
                     rv = False
                     break
 
-        self._elementLinesAreSingleChars[hash(obj)] = rv
+        self._objectCache.set("elementLinesAreSingleChars", obj, rv)
         return rv
 
     def labelIsAncestorOfLabelled(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._labelIsAncestorOfLabelled.get(hash(obj))
+        rv = self._objectCache.get("labelIsAncestorOfLabelled", obj)
         if rv is not None:
             return rv
 
@@ -3322,14 +3358,14 @@ class Utilities(script_utilities.Utilities):
                 rv = True
                 break
 
-        self._labelIsAncestorOfLabelled[hash(obj)] = rv
+        self._objectCache.set("labelIsAncestorOfLabelled", obj, rv)
         return rv
 
     def isOffScreenLabel(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isOffScreenLabel.get(hash(obj))
+        rv = self._objectCache.get("isOffScreenLabel", obj)
         if rv is not None:
             return rv
 
@@ -3348,7 +3384,7 @@ class Utilities(script_utilities.Utilities):
             if x < 0 or y < 0:
                 rv = True
 
-        self._isOffScreenLabel[hash(obj)] = rv
+        self._objectCache.set("isOffScreenLabel", obj, rv)
         return rv
 
     def isDetachedDocument(self, obj):
@@ -3398,12 +3434,12 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return []
 
-        rv = self._labelTargets.get(hash(obj))
+        rv = self._objectCache.get("labelTargets", obj)
         if rv is not None:
             return rv
 
         rv = [hash(t) for t in self.targetsForLabel(obj)]
-        self._labelTargets[hash(obj)] = rv
+        self._objectCache.set("labelTargets", obj, rv)
         return rv
 
     def isLinkAncestorOfImageInContents(self, link, contents):
@@ -3432,7 +3468,7 @@ class Utilities(script_utilities.Utilities):
         return None
 
     def isLabellingInteractiveElement(self, obj):
-        if self._labelTargets.get(hash(obj)) == []:
+        if self._objectCache.get("labelTargets", obj) == []:
             return False
 
         targets = self.targetsForLabel(obj)
@@ -3473,7 +3509,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isAnchor.get(hash(obj))
+        rv = self._objectCache.get("isAnchor", obj)
         if rv is not None:
             return rv
 
@@ -3484,7 +3520,7 @@ class Utilities(script_utilities.Utilities):
            and not self._getXMLRoles(obj):
             rv = True
 
-        self._isAnchor[hash(obj)] = rv
+        self._objectCache.set("isAnchor", obj, rv)
         return rv
 
     def isEmptyAnchor(self, obj):
@@ -3519,7 +3555,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isClickableElement.get(hash(obj))
+        rv = self._objectCache.get("isClickableElement", obj)
         if rv is not None:
             return rv
 
@@ -3543,19 +3579,19 @@ class Utilities(script_utilities.Utilities):
             if not string.strip():
                 rv = not (AXUtilities.is_static(obj) or AXUtilities.is_link(obj))
 
-        self._isClickableElement[hash(obj)] = rv
+        self._objectCache.set("isClickableElement", obj, rv)
         return rv
 
     def isCodeDescendant(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return super().isCodeDescendant(obj)
 
-        rv = self._isCodeDescendant.get(hash(obj))
+        rv = self._objectCache.get("isCodeDescendant", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.find_ancestor(obj, self.isCode) is not None
-        self._isCodeDescendant[hash(obj)] = rv
+        self._objectCache.set("isCodeDescendant", obj, rv)
         return rv
 
     def isCode(self, obj):
@@ -3586,7 +3622,7 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return []
 
-        rv = self._descriptionListTerms.get(hash(obj))
+        rv = self._objectCache.get("descriptionListTerms", obj)
         if rv is not None:
             return rv
 
@@ -3594,14 +3630,14 @@ class Utilities(script_utilities.Utilities):
         if not self.inDocumentContent(obj):
             return rv
 
-        self._descriptionListTerms[hash(obj)] = rv
+        self._objectCache.set("descriptionListTerms", obj, rv)
         return rv
 
     def valuesForTerm(self, obj):
         if not obj:
             return []
 
-        rv = self._valuesForTerm.get(hash(obj))
+        rv = self._objectCache.get("valuesForTerm", obj)
         if rv is not None:
             return rv
 
@@ -3609,7 +3645,7 @@ class Utilities(script_utilities.Utilities):
         if not self.inDocumentContent(obj):
             return rv
 
-        self._valuesForTerm[hash(obj)] = rv
+        self._objectCache.set("valuesForTerm", obj, rv)
         return rv
 
     def getComboBoxValue(self, obj):
@@ -3620,7 +3656,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return super().isEditableComboBox(obj)
 
-        rv = self._isEditableComboBox.get(hash(obj))
+        rv = self._objectCache.get("isEditableComboBox", obj)
         if rv is not None:
             return rv
 
@@ -3628,7 +3664,7 @@ class Utilities(script_utilities.Utilities):
         if AXUtilities.is_combo_box(obj):
             rv = AXUtilities.is_editable(obj)
 
-        self._isEditableComboBox[hash(obj)] = rv
+        self._objectCache.set("isEditableComboBox", obj, rv)
         return rv
 
     def getEditableComboBoxForItem(self, item):
@@ -3778,12 +3814,12 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return super().isErrorMessage(obj)
 
-        rv = self._isErrorMessage.get(hash(obj))
+        rv = self._objectCache.get("isErrorMessage", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.has_relation(obj, Atspi.RelationType.ERROR_FOR)
-        self._isErrorMessage[hash(obj)] = rv
+        self._objectCache.set("isErrorMessage", obj, rv)
         return rv
 
     def isFakePlaceholderForEntry(self, obj):
@@ -3821,7 +3857,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isInlineListItem.get(hash(obj))
+        rv = self._objectCache.get("isInlineListItem", obj)
         if rv is not None:
             return rv
 
@@ -3831,7 +3867,7 @@ class Utilities(script_utilities.Utilities):
             displayStyle = self._getDisplayStyle(obj)
             rv = displayStyle and "inline" in displayStyle
 
-        self._isInlineListItem[hash(obj)] = rv
+        self._objectCache.set("isInlineListItem", obj, rv)
         return rv
 
     def isBlockListDescendant(self, obj):
@@ -3844,20 +3880,20 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isListDescendant.get(hash(obj))
+        rv = self._objectCache.get("isListDescendant", obj)
         if rv is not None:
             return rv
 
         ancestor = AXObject.find_ancestor(obj, AXUtilities.is_list)
         rv = ancestor is not None
-        self._isListDescendant[hash(obj)] = rv
+        self._objectCache.set("isListDescendant", obj, rv)
         return rv
 
     def isInlineListDescendant(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isInlineListDescendant.get(hash(obj))
+        rv = self._objectCache.get("isInlineListDescendant", obj)
         if rv is not None:
             return rv
 
@@ -3867,7 +3903,7 @@ class Utilities(script_utilities.Utilities):
             ancestor = AXObject.find_ancestor(obj, self.isInlineListItem)
             rv = ancestor is not None
 
-        self._isInlineListDescendant[hash(obj)] = rv
+        self._objectCache.set("isInlineListDescendant", obj, rv)
         return rv
 
     def listForInlineListDescendant(self, obj):
@@ -3895,7 +3931,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isLandmark.get(hash(obj))
+        rv = self._objectCache.get("isLandmark", obj)
         if rv is not None:
             return rv
 
@@ -3907,7 +3943,7 @@ class Utilities(script_utilities.Utilities):
             roles = self._getXMLRoles(obj)
             rv = bool(list(filter(lambda x: x in self.getLandmarkTypes(), roles)))
 
-        self._isLandmark[hash(obj)] = rv
+        self._objectCache.set("isLandmark", obj, rv)
         return rv
 
     def isLandmarkWithoutType(self, obj):
@@ -3949,7 +3985,7 @@ class Utilities(script_utilities.Utilities):
         if not obj:
             return False
 
-        rv = self._isLink.get(hash(obj))
+        rv = self._objectCache.get("isLink", obj)
         if rv is not None:
             return rv
 
@@ -3962,21 +3998,21 @@ class Utilities(script_utilities.Utilities):
         else:
             rv = False
 
-        self._isLink[hash(obj)] = rv
+        self._objectCache.set("isLink", obj, rv)
         return rv
 
     def isNonNavigablePopup(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isNonNavigablePopup.get(hash(obj))
+        rv = self._objectCache.get("isNonNavigablePopup", obj)
         if rv is not None:
             return rv
 
         rv = AXUtilities.is_tool_tip(obj) \
             and not AXUtilities.is_focusable(obj)
 
-        self._isNonNavigablePopup[hash(obj)] = rv
+        self._objectCache.set("isNonNavigablePopup", obj, rv)
         return rv
 
     def hasUselessCanvasDescendant(self, obj):
@@ -3995,7 +4031,7 @@ class Utilities(script_utilities.Utilities):
         return 'switch' in self._getXMLRoles(obj)
 
     def isNonNavigableEmbeddedDocument(self, obj):
-        rv = self._isNonNavigableEmbeddedDocument.get(hash(obj))
+        rv = self._objectCache.get("isNonNavigableEmbeddedDocument", obj)
         if rv is not None:
             return rv
 
@@ -4008,14 +4044,14 @@ class Utilities(script_utilities.Utilities):
             else:
                 rv = "doubleclick" in name
 
-        self._isNonNavigableEmbeddedDocument[hash(obj)] = rv
+        self._objectCache.set("isNonNavigableEmbeddedDocument", obj, rv)
         return rv
 
     def isRedundantSVG(self, obj):
         if not self.isSVG(obj) or AXObject.get_child_count(AXObject.get_parent(obj)) == 1:
             return False
 
-        rv = self._isRedundantSVG.get(hash(obj))
+        rv = self._objectCache.get("isRedundantSVG", obj)
         if rv is not None:
             return rv
 
@@ -4029,14 +4065,14 @@ class Utilities(script_utilities.Utilities):
                 largestExtents = self.getExtents(sortedChildren[-1], 0, -1)
                 rv = self.intersection(objExtents, largestExtents) == tuple(objExtents)
 
-        self._isRedundantSVG[hash(obj)] = rv
+        self._objectCache.set("isRedundantSVG", obj, rv)
         return rv
 
     def isCustomImage(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isCustomImage.get(hash(obj))
+        rv = self._objectCache.get("isCustomImage", obj)
         if rv is not None:
             return rv
 
@@ -4050,14 +4086,14 @@ class Utilities(script_utilities.Utilities):
             else:
                 rv = True
 
-        self._isCustomImage[hash(obj)] = rv
+        self._objectCache.set("isCustomImage", obj, rv)
         return rv
 
     def isUselessImage(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isUselessImage.get(hash(obj))
+        rv = self._objectCache.get("isUselessImage", obj)
         if rv is not None:
             return rv
 
@@ -4092,7 +4128,7 @@ class Utilities(script_utilities.Utilities):
                     rv = False
                     break
 
-        self._isUselessImage[hash(obj)] = rv
+        self._objectCache.set("isUselessImage", obj, rv)
         return rv
 
     def hasValidName(self, obj):
@@ -4120,7 +4156,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isUselessEmptyElement.get(hash(obj))
+        rv = self._objectCache.get("isUselessEmptyElement", obj)
         if rv is not None:
             return rv
 
@@ -4149,14 +4185,14 @@ class Utilities(script_utilities.Utilities):
         else:
             rv = True
 
-        self._isUselessEmptyElement[hash(obj)] = rv
+        self._objectCache.set("isUselessEmptyElement", obj, rv)
         return rv
 
     def isParentOfNullChild(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isParentOfNullChild.get(hash(obj))
+        rv = self._objectCache.get("isParentOfNullChild", obj)
         if rv is not None:
             return rv
 
@@ -4168,7 +4204,7 @@ class Utilities(script_utilities.Utilities):
             debug.println(debug.LEVEL_INFO, msg, True)
             rv = True
 
-        self._isParentOfNullChild[hash(obj)] = rv
+        self._objectCache.set("isParentOfNullChild", obj, rv)
         return rv
 
     def hasExplicitName(self, obj):
@@ -4182,12 +4218,12 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._hasLongDesc.get(hash(obj))
+        rv = self._objectCache.get("hasLongDesc", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.has_action(obj, "showlongdesc")
-        self._hasLongDesc[hash(obj)] = rv
+        self._objectCache.set("hasLongDesc", obj, rv)
         return rv
 
     def hasVisibleCaption(self, obj):
@@ -4197,7 +4233,7 @@ class Utilities(script_utilities.Utilities):
         if not (self.isFigure(obj) or AXObject.supports_table(obj)):
             return False
 
-        rv = self._hasVisibleCaption.get(hash(obj))
+        rv = self._objectCache.get("hasVisibleCaption", obj)
         if rv is not None:
             return rv
 
@@ -4207,20 +4243,20 @@ class Utilities(script_utilities.Utilities):
             return AXUtilities.is_caption(x) and self.isShowingAndVisible(x)
 
         rv = bool(list(filter(isVisibleCaption, labels)))
-        self._hasVisibleCaption[hash(obj)] = rv
+        self._objectCache.set("hasVisibleCaption", obj, rv)
         return rv
 
     def hasDetails(self, obj):
         if not (obj and self.inDocumentContent(obj)):
             return super().hasDetails(obj)
 
-        rv = self._hasDetails.get(hash(obj))
+        rv = self._objectCache.get("hasDetails", obj)
         if rv is not None:
             return rv
 
         relation = AXObject.get_relation(obj, Atspi.RelationType.DETAILS)
         rv = relation and relation.get_n_targets() > 0
-        self._hasDetails[hash(obj)] = rv
+        self._objectCache.set("hasDetails", obj, rv)
         return rv
 
     def detailsIn(self, obj):
@@ -4233,13 +4269,13 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return super().isDetails(obj)
 
-        rv = self._isDetails.get(hash(obj))
+        rv = self._objectCache.get("isDetails", obj)
         if rv is not None:
             return rv
 
         relation = AXObject.get_relation(obj, Atspi.RelationType.DETAILS_FOR)
         rv = relation and relation.get_n_targets() > 0
-        self._isDetails[hash(obj)] = rv
+        self._objectCache.set("isDetails", obj, rv)
         return rv
 
     def detailsFor(self, obj):
@@ -4259,19 +4295,19 @@ class Utilities(script_utilities.Utilities):
         if not self.shouldInferLabelFor(obj):
             return None, []
 
-        rv = self._inferredLabels.get(hash(obj))
+        rv = self._objectCache.get("inferredLabels", obj)
         if rv is not None:
             return rv
 
         rv = self._script.labelInference.infer(obj, False)
-        self._inferredLabels[hash(obj)] = rv
+        self._objectCache.set("inferredLabels", obj, rv)
         return rv
 
     def shouldInferLabelFor(self, obj):
         if not self.inDocumentContent() or self.isWebAppDescendant(obj):
             return False
 
-        rv = self._shouldInferLabelFor.get(hash(obj))
+        rv = self._objectCache.get("shouldInferLabelFor", obj)
         if rv and not self._script._lastCommandWasCaretNav:
             return not self._script.inSayAll()
         if rv is False:
@@ -4292,7 +4328,7 @@ class Utilities(script_utilities.Utilities):
                      Atspi.Role.RADIO_BUTTON]
             rv = role in roles and not self.displayedLabel(obj)
 
-        self._shouldInferLabelFor[hash(obj)] = rv
+        self._objectCache.set("shouldInferLabelFor", obj, rv)
 
         # TODO - JD: This is private.
         if self._script._lastCommandWasCaretNav \
@@ -4305,7 +4341,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return super().displayedLabel(obj)
 
-        rv = self._displayedLabelText.get(hash(obj))
+        rv = self._objectCache.get("displayedLabelText", obj)
         if rv is not None:
             return rv
 
@@ -4314,14 +4350,14 @@ class Utilities(script_utilities.Utilities):
                    or self.displayedText(label) for label in labels if label is not None]
         rv = " ".join(strings)
 
-        self._displayedLabelText[hash(obj)] = rv
+        self._objectCache.set("displayedLabelText", obj, rv)
         return rv
 
     def labelsForObject(self, obj):
         if not obj:
             return []
 
-        rv = self._labelsForObject.get(hash(obj))
+        rv = self._objectCache.get("labelsForObject", obj)
         if rv is not None:
             return rv
 
@@ -4329,7 +4365,7 @@ class Utilities(script_utilities.Utilities):
         if not self.inDocumentContent(obj):
             return rv
 
-        self._labelsForObject[hash(obj)] = rv
+        self._objectCache.set("labelsForObject", obj, rv)
         return rv
 
     def isSpinnerEntry(self, obj):
@@ -4610,7 +4646,7 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return False
 
-        rv = self._isContentEditableWithEmbeddedObjects.get(hash(obj))
+        rv = self._objectCache.get("isContentEditableWithEmbeddedObjects", obj)
         if rv is not None:
             return rv
 
@@ -4629,7 +4665,7 @@ class Utilities(script_utilities.Utilities):
             document = self.getDocumentForObject(obj)
             rv = self.isContentEditableWithEmbeddedObjects(document)
 
-        self._isContentEditableWithEmbeddedObjects[hash(obj)] = rv
+        self._objectCache.set("isContentEditableWithEmbeddedObjects", obj, rv)
         return rv
 
     def characterOffsetInParent(self, obj):
@@ -4698,12 +4734,12 @@ class Utilities(script_utilities.Utilities):
         if not (obj and self.inDocumentContent(obj)):
             return super().hasNoSize(obj)
 
-        rv = self._hasNoSize.get(hash(obj))
+        rv = self._objectCache.get("hasNoSize", obj)
         if rv is not None:
             return rv
 
         rv = super().hasNoSize(obj)
-        self._hasNoSize[hash(obj)] = rv
+        self._objectCache.set("hasNoSize", obj, rv)
         return rv
 
     def _canHaveCaretContext(self, obj):
@@ -5102,12 +5138,12 @@ class Utilities(script_utilities.Utilities):
         return None, -1
 
     def _getPath(self, obj):
-        rv = self._paths.get(hash(obj))
+        rv = self._objectCache.get("paths", obj)
         if rv is not None:
             return rv
 
         rv = AXObject.get_path(obj) or [-1]
-        self._paths[hash(obj)] = rv
+        self._objectCache.set("paths", obj, rv)
         return rv
 
     def setCaretContext(self, obj=None, offset=-1, documentFrame=None):
@@ -5485,7 +5521,7 @@ class Utilities(script_utilities.Utilities):
         if not self.inDocumentContent(obj):
             return super().preferDescriptionOverName(obj)
 
-        rv = self._preferDescriptionOverName.get(hash(obj))
+        rv = self._objectCache.get("preferDescriptionOverName", obj)
         if rv is not None:
             return rv
 
@@ -5499,7 +5535,7 @@ class Utilities(script_utilities.Utilities):
         else:
             rv = False
 
-        self._preferDescriptionOverName[hash(obj)] = rv
+        self._objectCache.set("preferDescriptionOverName", obj, rv)
         return rv
 
     def _getCtrlShiftSelectionsStrings(self):
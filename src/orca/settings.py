@@ -392,6 +392,27 @@ brailleBindingsMap      = {}
 timeoutTime             = 10   # a value of 0 means don't do hang checking
 timeoutCallback         = None # Set by orca.py:init to orca.timeout
 
+# The maximum time, in seconds, the event manager spends processing queued
+# events before giving control back to the main loop. Toolkit-specific values
+# can be given as {toolkitName: seconds}.
+eventProcessingTimeBudget = 0.008
+eventProcessingTimeBudgetByToolkit = {}
+
+# If True, frequently-requested properties (role, name, state set, child count,
+# and parent) are cached and updated in response to accessibility events.
+# Applications which fail to emit the corresponding events may be presented
+# with stale information.
+enableAccessiblePropertyCache = False
+
+# If set, the object events received by the event manager, along with snapshots
+# of the objects they refer to, are recorded to this file for offline replay.
+eventRecordingFile = None
+
+# If True, the script modules for applications which are already running are
+# imported while Orca is idle, rather than when each application first gets
+# focus.
+prewarmScripts = True
+
 structNavTriggersFocusMode = False
 caretNavTriggersFocusMode = False
 nativeNavTriggersFocusMode = True
@@ -28,6 +28,7 @@ __date__      = "$Date$"
 __copyright__ = "Copyright (c) 2010 Consorcio Fernando de los Rios."
 __license__   = "LGPL"
 
+import copy
 import importlib
 import os
 from gi.repository import Gio, GLib
@@ -126,6 +127,7 @@ class SettingsManager(object):
             or os.path.join(GLib.get_user_data_dir(), "orca")
 
         # Load the backend and the default values
+        self.flush()
         self._backend = self.backendModule.Backend(self._prefsDir)
         self._setDefaultGeneral()
         self._setDefaultPronunciations()
@@ -456,10 +458,11 @@ class SettingsManager(object):
         debug.println(debug.LEVEL_INFO, msg, True)
 
     def _setPronunciationsRuntime(self, pronunciationsDict):
-        pronunciation_dict.pronunciation_dict = {}
+        pronunciation_dict.clearPronunciations()
         for key, value in pronunciationsDict.values():
             if key and value:
                 pronunciation_dict.setPronunciation(key, value)
+        pronunciation_dict.setCacheKey((self.profile, self._activeApp))
 
     def getGeneralSettings(self, profile='default'):
         """Return the current general settings.
@@ -619,6 +622,12 @@ class SettingsManager(object):
 
         return scriptKeyBindings
 
+    def flush(self):
+        """Writes any settings changes which the backend has not written yet."""
+
+        if self._backend:
+            self._backend.flush()
+
     def isFirstStart(self):
         """Check if the firstStart key is True or false"""
         return self._backend.isFirstStart()
@@ -638,16 +647,15 @@ class SettingsManager(object):
         if not app:
             return None
 
-        appPrefs = self._backend.getAppSettings(AXObject.get_name(app))
-        profiles = appPrefs.get('profiles', {})
-        profilePrefs = profiles.get(self.profile, {})
-        general = profilePrefs.get('general', {})
-        appSetting = general.get(settingName)
+        # The backend only rereads the settings files when they change, so
+        # this is cheap enough to call from event handlers.
+        appGeneral, general = self._backend.getResolvedSettings(
+            self.profile, AXObject.get_name(app))
+        appSetting = appGeneral.get(settingName)
         if appSetting is None and fallbackOnDefault:
-            general = self._backend.getGeneral(self.profile)
             appSetting = general.get(settingName)
 
-        return appSetting
+        return copy.deepcopy(appSetting)
 
     def loadAppSettings(self, script):
         """Load the users application specific settings for an app.
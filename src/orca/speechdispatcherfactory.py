@@ -58,6 +58,7 @@ else:
 
 PUNCTUATION = re.compile(r'[^\w\s]', re.UNICODE)
 ELLIPSIS = re.compile('(\342\200\246|(?<!\\.)\\.{3,4}(?=(\\s|\\Z)))')
+SPACES = re.compile(r'(\s+)', re.UNICODE)
 
 class SpeechServer(speechserver.SpeechServer):
     # See the parent class for documentation.
@@ -113,6 +114,10 @@ class SpeechServer(speechserver.SpeechServer):
         self._id = serverId
         self._client = None
         self._current_voice_properties = {}
+        self._punctuationPattern = None
+        self._symbolReplacements = {}
+        self._outputModule = None
+        self._voiceCatalogs = {}
         self._acss_manipulators = (
             (ACSS.RATE, self._set_rate),
             (ACSS.AVERAGE_PITCH, self._set_pitch),
@@ -164,6 +169,9 @@ class SpeechServer(speechserver.SpeechServer):
         client.set_priority(speechd.Priority.MESSAGE)
         if self._id != self.DEFAULT_SERVER_ID:
             client.set_output_module(self._id)
+            self._outputModule = self._id
+        else:
+            self._outputModule = None
         self._current_voice_properties = {}
         mode = self._PUNCTUATION_MODE_MAP[settings.verbalizePunctuationStyle]
         client.set_punctuation(mode)
@@ -193,6 +201,8 @@ class SpeechServer(speechserver.SpeechServer):
         """ Punctuation level changed, inform this speechServer. """
         mode = self._PUNCTUATION_MODE_MAP[settings.verbalizePunctuationStyle]
         self._client.set_punctuation(mode)
+        self._punctuationPattern = None
+        self._symbolReplacements = {}
 
     def _send_command(self, command, *args, **kwargs):
         try:
@@ -326,91 +336,159 @@ class SpeechServer(speechserver.SpeechServer):
         if style == settings.PUNCTUATION_STYLE_NONE:
             return oldText
 
-        spokenEllipsis = messages.SPOKEN_ELLIPSIS + " "
-        newText = re.sub(ELLIPSIS, spokenEllipsis, oldText)
-        symbols = set(re.findall(PUNCTUATION, newText))
-        for symbol in symbols:
-            try:
-                level, action = punctuation_settings.getPunctuationInfo(symbol)
-            except Exception:
-                continue
+        if self._punctuationPattern is None:
+            self._punctuationPattern = self.__getPunctuationPattern()
 
-            if level != punctuation_settings.LEVEL_NONE:
-                # Speech Dispatcher should handle it.
-                #
-                continue
+        # Whether we are in math is only looked up if there is a symbol to
+        # name, and then only once for the whole text.
+        inMath = []
 
-            charName = f" {chnames.getCharacterName(symbol)} "
-            if action == punctuation_settings.PUNCTUATION_INSERT:
-                charName += symbol
-            newText = re.sub(symbol, charName, newText)
+        def _replace(match):
+            if match.group("ellipsis"):
+                return messages.SPOKEN_ELLIPSIS + " "
 
+            if not inMath:
+                inMath.append(bool(orca_state.activeScript)
+                              and orca_state.activeScript.utilities.isInMath())
+            return self.__getSymbolReplacement(match.group("symbol"), inMath[0])
+
+        newText = self._punctuationPattern.sub(_replace, oldText)
         if orca_state.activeScript:
             newText = orca_state.activeScript.utilities.adjustForDigits(newText)
 
         return newText
 
-    def _speak(self, text, acss, **kwargs):
-        if isinstance(text, ACSS):
-            text = ''
+    def __getPunctuationPattern(self):
+        """Returns the compiled pattern which matches, in a single pass, the
+        ellipses and the symbols which Orca rather than Speech Dispatcher
+        must verbalize."""
 
-        # Mark beginning of words with U+E000 (private use) and record the
-        # string offsets
-        # Note: we need to do this before disturbing the text offsets
-        # Note2: we assume that text mangling below leave U+E000 untouched
-        last_begin = None
-        is_numeric = None
-        marks_offsets = []
-        marks_endoffsets = []
-        marked_text = ""
-
-        for i in range(len(text)):
-            c = text[i]
-            if c == '\ue000':
-                # Original text already contains U+E000. But syntheses will not
-                # know what to do of it anyway, so discard it
+        # Speech Dispatcher handles the symbols of the other levels.
+        symbols = sorted(symbol for symbol, info in punctuation_settings.punctuation.items()
+                         if info[0] == punctuation_settings.LEVEL_NONE
+                         and PUNCTUATION.fullmatch(symbol))
+
+        pattern = f"(?P<ellipsis>{ELLIPSIS.pattern})"
+        if symbols:
+            pattern += f"|(?P<symbol>[{re.escape(''.join(symbols))}])"
+
+        msg = f"SPEECH DISPATCHER: Compiled punctuation pattern for {len(symbols)} symbols."
+        debug.println(debug.LEVEL_INFO, msg, True)
+        return re.compile(pattern, re.UNICODE)
+
+    def __getSymbolReplacement(self, symbol, inMath):
+        """Returns the text which replaces symbol, or which is inserted before
+        it, depending on the symbol's punctuation action."""
+
+        # Math names depend on the math symbols settings, so only the other
+        # replacements are kept.
+        replacement = None if inMath else self._symbolReplacements.get(symbol)
+        if replacement is not None:
+            return replacement
+
+        replacement = f" {chnames.getCharacterName(symbol, inMath)} "
+        level, action = punctuation_settings.getPunctuationInfo(symbol)
+        if action == punctuation_settings.PUNCTUATION_INSERT:
+            replacement += symbol
+        if not inMath:
+            self._symbolReplacements[symbol] = replacement
+
+        return replacement
+
+    def __markWords(self, text):
+        """Marks the beginning of each word in text with U+E000 (private use).
+
+        Wholly numeric words separated only by white space, e.g. "1 000 000",
+        are marked as a single word. U+E000 already in text is discarded,
+        since synthesizers would not know what to do with it anyway.
+
+        Arguments:
+        - text: the text whose words should be marked.
+
+        Returns the marked text and a list of the (start, end) offsets of the
+        marked words in the original text.
+        """
+
+        hasPrivateUse = '\ue000' in text
+
+        # The words are at the even indices, the white space between them at
+        # the odd ones.
+        parts = SPACES.split(text)
+        marks = []
+        offset = 0
+        wordStart = wordEnd = None
+        isNumeric = False
+        for i in range(0, len(parts), 2):
+            word = parts[i]
+            start = offset
+            end = offset = start + len(word)
+            if i + 1 < len(parts):
+                offset += len(parts[i + 1])
+            if not word:
                 continue
 
-            if not c.isspace() and last_begin is None:
-                # Word begin
-                marked_text += '\ue000'
-                last_begin = i
-                is_numeric = c.isnumeric()
-
-            elif c.isspace() and last_begin is not None:
-                # Word end
-                if is_numeric:
-                    # We had a wholy numeric word, possibly next word is as well.
-                    # Skip to next word
-                    for j in range(i+1, len(text)):
-                        if not text[j].isspace():
-                            break
-                    else:
-                        is_numeric = False
-                    # Check next word
-                    while is_numeric and j < len(text) and not text[j].isspace():
-                        if not text[j].isnumeric():
-                            is_numeric = False
-                        j += 1
+            if isNumeric and word.isnumeric():
+                wordEnd = end
+                continue
+
+            if wordStart is not None:
+                marks.append((wordStart, wordEnd))
+                wordStart = None
+                isNumeric = False
+
+            if hasPrivateUse:
+                rest = word.lstrip('\ue000')
+                if not rest:
+                    parts[i] = ''
+                    continue
+                start = end - len(rest)
+                word = rest.replace('\ue000', '')
 
-                if not is_numeric:
-                    # add a mark
-                    marks_offsets.append(last_begin)
-                    marks_endoffsets.append(i)
-                    last_begin = None
-                    is_numeric = None
+            wordStart, wordEnd = start, end
+            isNumeric = word.isnumeric()
+            parts[i] = '\ue000' + word
+
+        if wordStart is not None:
+            marks.append((wordStart, wordEnd))
+
+        return "".join(parts), marks
+
+    def __toSSML(self, text, marks):
+        """Transcribes text to SSML, translating each U+E000 into the mark
+        for the corresponding word.
+
+        Arguments:
+        - text: the text, with the word beginnings marked by __markWords.
+        - marks: the list of the (start, end) offsets of the words.
+
+        Returns the SSML string.
+        """
+
+        # Quotes are not escaped until speech dispatcher properly parses them
+        # (version 0.8.9 or later).
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        pieces = text.split('\ue000')
+        for i in range(len(marks), len(pieces) - 1):
+            # This is really not supposed to happen
+            msg = "%uth U+E000 does not have corresponding index" % i
+            debug.println(debug.LEVEL_WARNING, msg, True)
 
-            elif is_numeric and not c.isnumeric():
-                is_numeric = False
+        ssml = ["<speak>", pieces[0]]
+        for mark, piece in zip(marks, pieces[1:]):
+            ssml.append('<mark name="%u:%u"/>' % mark)
+            ssml.append(piece)
+        ssml.extend(pieces[len(marks) + 1:])
+        ssml.append("</speak>")
 
-            marked_text += c
+        return "".join(ssml)
 
-        if last_begin is not None:
-            # Finished with a word
-            marks_offsets.append(last_begin)
-            marks_endoffsets.append(i + 1)
+    def _speak(self, text, acss, **kwargs):
+        if isinstance(text, ACSS):
+            text = ''
 
-        text = marked_text
+        # Note: we need to mark the words before disturbing the text offsets.
+        # Note2: we assume that text mangling below leave U+E000 untouched
+        text, marks = self.__markWords(text)
 
         text = self.__addVerbalizedPunctuation(text)
         if orca_state.activeScript:
@@ -427,34 +505,9 @@ class SpeechServer(speechserver.SpeechServer):
         #
         text = text.replace('\n.', '\n')
 
-        # Transcribe to SSML, translating U+E000 into marks
         # Note: we need to do this after all mangling otherwise the ssml markup
         # would get mangled too
-        ssml = "<speak>"
-        i = 0
-        for c in text:
-            if c == '\ue000':
-                if i >= len(marks_offsets):
-                    # This is really not supposed to happen
-                    msg = "%uth U+E000 does not have corresponding index" % i
-                    debug.println(debug.LEVEL_WARNING, msg, True)
-                else:
-                    ssml += '<mark name="%u:%u"/>' % (marks_offsets[i], marks_endoffsets[i])
-                i += 1
-            # Disable for now, until speech dispatcher properly parses them (version 0.8.9 or later)
-            #elif c == '"':
-            #  ssml += '&quot;'
-            #elif c == "'":
-            #  ssml += '&apos;'
-            elif c == '<':
-              ssml += '&lt;'
-            elif c == '>':
-              ssml += '&gt;'
-            elif c == '&':
-              ssml += '&amp;'
-            else:
-              ssml += c
-        ssml += "</speak>"
+        ssml = self.__toSSML(text, marks)
 
         self._apply_acss(acss)
         self._debug_sd_values(f"Speaking '{ssml}' ")
@@ -545,17 +598,21 @@ class SpeechServer(speechserver.SpeechServer):
     def getInfo(self):
         return [self._SERVER_NAMES.get(self._id, self._id), self._id]
 
-    def getVoiceFamilies(self):
-        # Always offer the configured default voice with a language
-        # set according to the current locale.
-        from locale import getlocale, LC_MESSAGES
-        locale = getlocale(LC_MESSAGES)[0]
-        if locale is None or '_' not in locale:
-            locale_language = None
-        else:
-            locale_lang, locale_dialect = locale.split('_')
-            locale_language = locale_lang + '-' + locale_dialect
-        voices = ()
+    def _getVoiceCatalog(self):
+        """Returns the (voices, families, index) of the current output module,
+        listing its voices only the first time they are needed. The index maps
+        each normalized (language, dialect) to the positions of its voices."""
+
+        try:
+            module = self.getOutputModule()
+        except Exception:
+            module = None
+        catalog = self._voiceCatalogs.get(module)
+        if catalog is not None:
+            return catalog
+
+        # _send_command returns None if the command failed.
+        listed = None
         try:
             # This command is not available with older SD versions.
             list_synthesis_voices = self._client.list_synthesis_voices
@@ -563,10 +620,40 @@ class SpeechServer(speechserver.SpeechServer):
             pass
         else:
             try:
-                voices += self._send_command(list_synthesis_voices)
+                listed = self._send_command(list_synthesis_voices)
             except Exception:
                 pass
 
+        voices = tuple(listed or ())
+        index = {}
+        for i, voice in enumerate(voices):
+            key = self._normalizedLanguageAndDialect(voice[1])
+            index.setdefault(key, []).append(i)
+
+        catalog = voices, self._buildVoiceFamilies(voices), index
+        if listed is None:
+            # Don't keep the catalog, so that the voices are listed again
+            # the next time they are needed.
+            msg = f"SPEECH DISPATCHER: Could not list the voices in {module}."
+            debug.println(debug.LEVEL_INFO, msg, True)
+            return catalog
+
+        self._voiceCatalogs[module] = catalog
+        msg = f"SPEECH DISPATCHER: Found {len(voices)} voice(s) in {module}."
+        debug.println(debug.LEVEL_INFO, msg, True)
+        return catalog
+
+    def _buildVoiceFamilies(self, voices):
+        # Always offer the configured default voice with a language
+        # set according to the current locale.
+        from locale import getlocale, LC_MESSAGES
+        locale = getlocale(LC_MESSAGES)[0]
+        if locale is None or '_' not in locale:
+            locale_language = None
+        else:
+            locale_lang, locale_dialect = locale.split('_')
+            locale_language = locale_lang + '-' + locale_dialect
+
         default_lang = ""
         if locale_language:
             # Check whether how it appears in the server list
@@ -595,6 +682,15 @@ class SpeechServer(speechserver.SpeechServer):
 
         return families
 
+    def rescanVoices(self):
+        """Forgets the voices listed so far, so that they are listed again."""
+
+        self._outputModule = None
+        self._voiceCatalogs = {}
+
+    def getVoiceFamilies(self):
+        return list(self._getVoiceCatalog()[1])
+
     def speak(self, text=None, acss=None, interrupt=True):
         if not text:
             return
@@ -708,19 +804,13 @@ class SpeechServer(speechserver.SpeechServer):
         start = time.time()
         target_language, target_dialect = self._normalizedLanguageAndDialect(language, dialect)
 
-        result = []
-        voices = self._client.list_synthesis_voices()
+        voices, _families, index = self._getVoiceCatalog()
+        positions = index.get((target_language, target_dialect), [])
+        if target_dialect and target_dialect == target_language:
+            # A voice without a dialect matches e.g. fr-fr.
+            positions = sorted(positions + index.get((target_language, ""), []))
 
-        for voice in voices:
-            normalized_language, normalized_dialect = self._normalizedLanguageAndDialect(voice[1])
-            if normalized_language != target_language:
-                continue
-            if normalized_dialect == target_dialect:
-                result.append(voice)
-            elif not normalized_dialect and target_dialect == normalized_language:
-                result.append(voice)
-            if maximum is not None and len(result) >= maximum:
-                break
+        result = [voices[i] for i in positions[:maximum]]
 
         msg = (
             f"SPEECH DISPATCHER: Found {len(result)} match(es) for language='{language}' "
@@ -758,10 +848,14 @@ class SpeechServer(speechserver.SpeechServer):
         return True
 
     def getOutputModule(self):
-        return self._client.get_output_module()
+        if self._outputModule is None:
+            self._outputModule = self._client.get_output_module()
+        return self._outputModule
 
     def setOutputModule(self, module):
         self._client.set_output_module(module)
+        self._outputModule = module
+        self._voiceCatalogs.pop(module, None)
 
     def stop(self):
         self._cancel()
@@ -772,6 +866,7 @@ class SpeechServer(speechserver.SpeechServer):
 
     def reset(self, text=None, acss=None):
         self._client.close()
+        self.rescanVoices()
         self._init()
         
     def list_output_modules(self):
@@ -140,6 +140,11 @@ class SpeechServer(object):
         voice families known by the speech server."""
         pass
 
+    def rescanVoices(self):
+        """Forgets any voices the speech server has cached, so that they
+        are looked up again."""
+        pass
+
     def speakCharacter(self, character, acss=None):
         """Speaks a single character immediately.
 
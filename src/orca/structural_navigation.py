@@ -27,6 +27,9 @@ __copyright__ = "Copyright (c) 2005-2009 Sun Microsystems Inc." \
                 "Copyright (c) 2010-2013 The Orca Team"
 __license__   = "LGPL"
 
+import bisect
+import itertools
+
 import gi
 gi.require_version("Atspi", "2.0")
 from gi.repository import Atspi
@@ -38,7 +41,6 @@ from . import input_event
 from . import keybindings
 from . import messages
 from . import object_properties
-from . import orca_gui_navlist
 from . import orca_state
 from . import settings
 from . import settings_manager
@@ -325,6 +327,7 @@ class StructuralNavigationObject:
             index = 0
 
         rows = [[obj, -1] + rowData(obj) for obj in objects]
+        from . import orca_gui_navlist
         orca_gui_navlist.showUI(title, columnHeaders, rows, index)
 
     def goPreviousAtLevelFactory(self, level):
@@ -390,6 +393,7 @@ class StructuralNavigationObject:
                 index = 0
 
             rows = [[obj, -1] + rowData(obj) for obj in objects]
+            from . import orca_gui_navlist
             orca_gui_navlist.showUI(title, columnHeaders, rows, index)
 
         return showListAtLevel
@@ -588,14 +592,17 @@ class StructuralNavigation:
         self.lastTableCell = [-1, -1]
 
         self._objectCache = {}
+        self._indexCache = {}
 
         self._inModalDialog = False
 
     def clearCache(self, document=None):
         if document:
             self._objectCache[hash(document)] = {}
+            self._indexCache[hash(document)] = {}
         else:
             self._objectCache = {}
+            self._indexCache = {}
 
     def structuralNavigationObjectCreator(self, name):
         """This convenience method creates a StructuralNavigationObject
@@ -832,6 +839,34 @@ class StructuralNavigation:
         self._objectCache[hash(document)] = cache
         return rv
 
+    def _getIndex(self, structuralNavigationObject, arg=None):
+        """Returns a (matches, paths, positions) tuple for the instances of
+        structuralNavigationObject. matches and paths are sorted in document
+        order; positions maps the hash of each match to its index."""
+
+        matches = self._getAll(structuralNavigationObject, arg)
+        if not matches:
+            return [], [], {}
+
+        document = self._script.utilities.documentFrame()
+        cache = self._indexCache.setdefault(hash(document), {})
+        key = f"{structuralNavigationObject.objType}:{arg}"
+        index = cache.get(key)
+        if index is not None and len(index[0]) == len(matches):
+            return index
+
+        paths = [AXObject.get_path(match) for match in matches]
+        order = sorted(range(len(matches)), key=lambda i: paths[i])
+        matches = [matches[i] for i in order]
+        paths = [paths[i] for i in order]
+        positions = {hash(match): i for i, match in enumerate(matches)}
+        msg = f"STRUCTURAL NAVIGATION: Indexed {len(matches)} matches for {key}"
+        debug.println(debug.LEVEL_INFO, msg, True)
+
+        index = matches, paths, positions
+        cache[key] = index
+        return index
+
     def goEdge(self, structuralNavigationObject, isStart, container=None, arg=None):
         if container is None:
             obj, offset = self._script.utilities.getCaretContext()
@@ -879,14 +914,11 @@ class StructuralNavigation:
           is needed and passed in as arg.
         """
 
-        matches = self._getAll(structuralNavigationObject, arg)
+        matches, paths, positions = self._getIndex(structuralNavigationObject, arg)
         if not matches:
             structuralNavigationObject.present(None, arg)
             return
 
-        if not isNext:
-            matches.reverse()
-
         def _isValidMatch(obj):
             if self._script.utilities.isDead(obj):
                 return False
@@ -898,8 +930,9 @@ class StructuralNavigation:
 
         def _getMatchingObjAndIndex(obj):
             while obj:
-                if obj in matches:
-                    return obj, matches.index(obj)
+                index = positions.get(hash(obj))
+                if index is not None:
+                    return obj, index
                 obj = AXObject.get_parent(obj)
 
             return None, -1
@@ -909,22 +942,38 @@ class StructuralNavigation:
             obj, offset = self._script.utilities.getCaretContext()
         thisObj, index = _getMatchingObjAndIndex(obj)
         if thisObj:
-            matches = matches[index:]
             obj = thisObj
-
-        currentPath = AXObject.get_path(obj)
-        for i, match in enumerate(matches):
-            if not _isValidMatch(match):
-                continue
-
-            if AXObject.get_parent(match) == obj:
-                comparison = self._script.utilities.characterOffsetInParent(match) - offset
-            else:
-                path = AXObject.get_path(match)
-                comparison = self._script.utilities.pathComparison(path, currentPath)
-            if (comparison > 0 and isNext) or (comparison < 0 and not isNext):
-                structuralNavigationObject.present(match, arg)
-                return
+            currentPath = paths[index]
+        else:
+            currentPath = AXObject.get_path(obj)
+
+        def _isChild(i):
+            return len(paths[i]) == len(currentPath) + 1 and paths[i][:-1] == currentPath
+
+        def _compareChild(i):
+            return self._script.utilities.characterOffsetInParent(matches[i]) - offset
+
+        # Matches which are children of obj are compared by their offset in obj.
+        # Everything else is compared by its path, which the bisection does for us.
+        start = bisect.bisect_right(paths, currentPath)
+        if isNext:
+            for i in range(start, len(matches)):
+                if _isChild(i) and _compareChild(i) <= 0:
+                    continue
+                if _isValidMatch(matches[i]):
+                    structuralNavigationObject.present(matches[i], arg)
+                    return
+        else:
+            candidates = range(bisect.bisect_left(paths, currentPath) - 1, -1, -1)
+            if not thisObj:
+                end = bisect.bisect_left(paths, currentPath + [float("inf")])
+                children = (i for i in range(end - 1, start - 1, -1)
+                            if _isChild(i) and _compareChild(i) < 0)
+                candidates = itertools.chain(children, candidates)
+            for i in candidates:
+                if _isValidMatch(matches[i]):
+                    structuralNavigationObject.present(matches[i], arg)
+                    return
 
         if not settings.wrappedStructuralNavigation:
             structuralNavigationObject.present(None, arg)
@@ -935,9 +984,8 @@ class StructuralNavigation:
         else:
             self._script.presentMessage(messages.WRAPPING_TO_TOP)
 
-        matches = self._getAll(structuralNavigationObject, arg)
         if not isNext:
-            matches.reverse()
+            matches = matches[::-1]
 
         for match in matches:
             if _isValidMatch(match):
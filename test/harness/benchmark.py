@@ -0,0 +1,356 @@
+#!/usr/bin/python3
+
+"""Times some of Orca's most expensive operations against a large generated
+web page (see fake_tree.py), without a desktop.
+
+    benchmark.py [--seed N] [--size N] [--text-length N] [--repeat N]
+                 [--warm] [--output FILE] [--prefs-dir DIR]
+
+The operations are AXObject.find_all_descendants, StructuralNavigation._getAll
+for several object types, the construction of a flat_review.Context, the
+web script's getLineContentsAtOffset for every line of the first paragraphs,
+the speech and braille generators' generate for objects of each kind, and
+AXCollection.create_match_rule and get_first_match, each both with a new
+match rule for every call and with the rule reused from the cache.
+generate is also timed with the formatting strings evaluated the way they
+were before they were compiled (see evalLoopGenerate), and the results of
+the two are compared. generate and getLineContentsAtOffset are also timed
+with their debug messages built even when the debug level is disabled, as
+they were before debug.printLazy (see eagerDebug). Unless --warm is given, Orca's caches are cleared
+before each repetition. The report is JSON, giving the minimum, median, and
+maximum time of each operation.
+"""
+
+import argparse
+import contextlib
+import json
+import statistics
+import sys
+import time
+
+import headless
+import fake_atspi as Atspi
+import fake_tree
+
+from orca import debug
+from orca import flat_review
+from orca import orca
+from orca import orca_state
+from orca.ax_collection import AXCollection
+from orca.ax_object import AXObject
+from orca.ax_utilities import AXUtilities
+
+STRUCTURAL_NAVIGATION_TYPES = ["heading", "link", "paragraph", "listItem", "table", "formField"]
+LINE_CONTENTS_PARAGRAPHS = 20
+GENERATE_OBJECTS_OF_EACH_KIND = 50
+MATCH_RULE_CALLS = 200
+
+# Criteria like those of the queries of AXUtilitiesCollection and
+# structural navigation.
+MATCH_RULE_CRITERIA = [
+    {"roles": [Atspi.Role.HEADING]},
+    {"roles": [Atspi.Role.HEADING], "attributes": ["level:2"]},
+    {"roles": [Atspi.Role.LINK], "states": [Atspi.StateType.FOCUSABLE]},
+    {"roles": [Atspi.Role.PUSH_BUTTON], "states": [Atspi.StateType.IS_DEFAULT]},
+    {"states": [Atspi.StateType.FOCUSED]},
+    {"interfaces": ["Text"]},
+    {"roles": [Atspi.Role.CHECK_BOX, Atspi.Role.COMBO_BOX, Atspi.Role.ENTRY,
+               Atspi.Role.LIST_BOX, Atspi.Role.PUSH_BUTTON, Atspi.Role.RADIO_BUTTON],
+     "states": [Atspi.StateType.FOCUSABLE, Atspi.StateType.SENSITIVE]},
+]
+
+
+def clearCaches(script):
+    """Clears the caches which would otherwise make every repetition after
+    the first one cheaper."""
+
+    AXObject.PROPERTY_CACHE.clear()
+    script.structuralNavigation.clearCache()
+    for name in ["clearCachedObjects", "clearContentCache"]:
+        clear = getattr(script.utilities, name, None)
+        if clear is not None:
+            clear()
+
+
+def findAllDescendants(script, tree):
+    return len(AXObject.find_all_descendants(tree.document, AXUtilities.is_link))
+
+
+def structuralNavigationGetAll(script, tree):
+    structuralNavigation = script.structuralNavigation
+    count = 0
+    for objType in STRUCTURAL_NAVIGATION_TYPES:
+        structuralNavigationObject = structuralNavigation.enabledObjects.get(objType)
+        if structuralNavigationObject is not None:
+            count += len(structuralNavigation._getAll(structuralNavigationObject))
+    return count
+
+
+def flatReviewContext(script, tree):
+    context = flat_review.Context(script)
+    return len(context.lines)
+
+
+def lineContents(script, tree):
+    count = 0
+    for paragraph in tree.paragraphs[:LINE_CONTENTS_PARAGRAPHS]:
+        offset = 0
+        while offset < len(paragraph.text):
+            script.utilities.getLineContentsAtOffset(paragraph, offset)
+            line = Atspi.Text.get_string_at_offset(
+                paragraph, offset, Atspi.TextGranularity.LINE)
+            offset = max(offset + 1, line.end_offset)
+            count += 1
+    return count
+
+
+@contextlib.contextmanager
+def eagerDebug():
+    """Makes debug.printLazy build its message before checking the level, as
+    the messages were built before the callers were changed to use it."""
+
+    printLazy = debug.printLazy
+
+    def printEager(level, text, *args, timestamp=False):
+        if callable(text):
+            text = text()
+        elif args:
+            text = text % args
+        debug.println(level, text, timestamp)
+
+    debug.printLazy = printEager
+    try:
+        yield
+    finally:
+        debug.printLazy = printLazy
+
+
+def eagerDebugLineContents(script, tree):
+    with eagerDebug():
+        return lineContents(script, tree)
+
+
+def generateObjects(tree):
+    """Returns the objects of each kind to generate presentations for."""
+
+    kinds = [tree.headings, tree.paragraphs, tree.links, tree.lists, tree.tables,
+             tree.formFields]
+    return [obj for kind in kinds for obj in kind[:GENERATE_OBJECTS_OF_EACH_KIND]]
+
+
+def evalLoopGenerate(generator, obj, **args):
+    """Returns what generator.generate(obj, **args) returns, computed as it
+    was before the formatting strings were compiled: the whole string is
+    evaluated again after each NameError, once the missing name has been
+    given the result of its generator method."""
+
+    formatting = generator._script.formatting
+    globalsDict = {}
+    generator._addGlobals(globalsDict)
+    globalsDict["obj"] = obj
+    try:
+        globalsDict["role"] = args["role"] = args.get("role", AXObject.get_role(obj))
+        args["mode"] = generator._mode
+        if not args.get("formatType"):
+            args["formatType"] = "focused" if args.get("alreadyFocused") else "unfocused"
+
+        string = formatting.getFormat(**args)
+        if not args.get("recursing", False):
+            if args.get("includeContext", True):
+                prefix = formatting.getPrefix(**args)
+                suffix = formatting.getSuffix(**args)
+                string = f"{prefix} + {string} + {suffix}"
+            args["recursing"] = True
+
+        pointOfReference = generator._script.pointOfReference
+        for name in ["usedDescriptionForName", "usedDescriptionForUnrelatedLabels",
+                     "usedDescriptionForAlert"]:
+            pointOfReference[name] = False
+
+        while True:
+            try:
+                return eval(string, globalsDict)
+            except NameError as error:
+                if error.name not in generator._methodsDict:
+                    return []
+                globalsDict[error.name] = generator._methodsDict[error.name](obj, **args)
+    except Exception:
+        return []
+
+
+def _generate(script, tree, generate):
+    count = 0
+    for obj in generateObjects(tree):
+        for generator in [script.speechGenerator, script.brailleGenerator]:
+            generate(generator, obj)
+            count += 1
+    return count
+
+
+def compiledGenerate(script, tree):
+    return _generate(script, tree, lambda generator, obj: generator.generate(obj))
+
+
+def eagerDebugGenerate(script, tree):
+    with eagerDebug():
+        return compiledGenerate(script, tree)
+
+
+def evalLoopGenerateAll(script, tree):
+    return _generate(script, tree, evalLoopGenerate)
+
+
+def _comparable(result):
+    """Returns result with braille regions replaced by their text."""
+
+    if isinstance(result, (list, tuple)):
+        return [_comparable(x) for x in result]
+    return getattr(result, "string", result)
+
+
+def compareGenerate(script, tree):
+    """Returns the presentations for which generate and evalLoopGenerate
+    differ."""
+
+    differences = []
+    for obj in generateObjects(tree):
+        for generator in [script.speechGenerator, script.brailleGenerator]:
+            clearCaches(script)
+            result = _comparable(generator.generate(obj))
+            clearCaches(script)
+            expected = _comparable(evalLoopGenerate(generator, obj))
+            if result != expected:
+                differences.append({"object": str(obj), "mode": generator._mode,
+                                    "result": repr(result), "expected": repr(expected)})
+    return differences
+
+
+def _matchRules(reuse):
+    """Calls create_match_rule MATCH_RULE_CALLS times for each of the
+    MATCH_RULE_CRITERIA, and returns the rules of the last calls."""
+
+    rules = []
+    for _i in range(MATCH_RULE_CALLS):
+        rules = []
+        for criteria in MATCH_RULE_CRITERIA:
+            if not reuse:
+                AXCollection.MATCH_RULES.clear()
+            rules.append(AXCollection.create_match_rule(**criteria))
+    return rules
+
+
+def newMatchRules(script, tree):
+    _matchRules(False)
+    return MATCH_RULE_CALLS * len(MATCH_RULE_CRITERIA)
+
+
+def cachedMatchRules(script, tree):
+    _matchRules(True)
+    return MATCH_RULE_CALLS * len(MATCH_RULE_CRITERIA)
+
+
+def _firstMatches(tree, reuse):
+    count = 0
+    for criteria in MATCH_RULE_CRITERIA:
+        if not reuse:
+            AXCollection.MATCH_RULES.clear()
+        rule = AXCollection.create_match_rule(**criteria)
+        if AXCollection.get_first_match(tree.document, rule) is not None:
+            count += 1
+    return count
+
+
+def firstMatchesWithNewRules(script, tree):
+    return sum(_firstMatches(tree, False) for _i in range(MATCH_RULE_CALLS))
+
+
+def firstMatchesWithCachedRules(script, tree):
+    return sum(_firstMatches(tree, True) for _i in range(MATCH_RULE_CALLS))
+
+
+BENCHMARKS = [("AXObject.find_all_descendants", findAllDescendants),
+              ("StructuralNavigation._getAll", structuralNavigationGetAll),
+              ("flat_review.Context", flatReviewContext),
+              ("getLineContentsAtOffset", lineContents),
+              ("getLineContentsAtOffset (eager debug)", eagerDebugLineContents),
+              ("Generator.generate", compiledGenerate),
+              ("Generator.generate (eval loop)", evalLoopGenerateAll),
+              ("Generator.generate (eager debug)", eagerDebugGenerate),
+              ("AXCollection.create_match_rule (new)", newMatchRules),
+              ("AXCollection.create_match_rule (cached)", cachedMatchRules),
+              ("AXCollection.get_first_match (new rule)", firstMatchesWithNewRules),
+              ("AXCollection.get_first_match (cached rule)", firstMatchesWithCachedRules)]
+
+
+def run(script, tree, repeat, warm):
+    """Returns the timings of each benchmark."""
+
+    results = {}
+    for name, function in BENCHMARKS:
+        times = []
+        for _i in range(repeat):
+            if not warm:
+                clearCaches(script)
+            start = time.perf_counter()
+            count = function(script, tree)
+            times.append(time.perf_counter() - start)
+
+        results[name] = {
+            "count": count,
+            "min": min(times),
+            "median": statistics.median(times),
+            "max": max(times),
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Orca against a generated web page")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated page")
+    parser.add_argument("--size", type=int, default=10000,
+                        help="number of objects in the generated page")
+    parser.add_argument("--text-length", type=int, default=4000,
+                        help="maximum number of characters in a paragraph")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of times to run each benchmark")
+    parser.add_argument("--warm", action="store_true",
+                        help="keep Orca's caches between repetitions")
+    parser.add_argument("--output", help="file to write the report to (default: stdout)")
+    parser.add_argument("--prefs-dir", help="Orca settings directory (default: a new one)")
+    args = parser.parse_args()
+
+    headless.start(args.prefs_dir)
+    tree = fake_tree.generate(args.seed, args.size, args.text_length)
+    Atspi.get_desktop(0).appendChild(tree.app)
+
+    scriptManager = orca.getManager().getScriptManager()
+    script = scriptManager.getScript(tree.app, tree.document)
+    scriptManager.setActiveScript(script, "benchmark")
+    orca_state.activeWindow = tree.frame
+    orca_state.locusOfFocus = tree.paragraphs[0]
+
+    report = {
+        "seed": args.seed,
+        "size": tree.size,
+        "script": script.name,
+        "repeat": args.repeat,
+        "warm": args.warm,
+        "benchmarks": run(script, tree, args.repeat, args.warm),
+    }
+    differences = compareGenerate(script, tree)
+    report["generateDifferences"] = len(differences)
+    report["firstGenerateDifferences"] = differences[:10]
+    headless.stop()
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    json.dump(report, output, indent=1, sort_keys=True)
+    output.write("\n")
+    if args.output:
+        output.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
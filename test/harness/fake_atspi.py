@@ -0,0 +1,1875 @@
+"""An in-process stand-in for the Atspi typelib.
+
+This provides the subset of the Atspi API which Orca calls, backed by a
+tree of Python objects rather than by applications on the accessibility
+bus. It lets Orca's own code run unmodified, without a desktop, so that
+its processing cost can be measured.
+
+install() must be called before any orca module is imported:
+
+    import fake_atspi
+    fake_atspi.install()
+    from orca import orca
+
+Both the gi-style static calls (Atspi.Accessible.get_name(obj)) and the
+pyatspi-style interface wrappers (obj.queryText().getText(0, -1)) are
+supported.
+"""
+
+import bisect
+import re
+import sys
+import types
+
+EMBEDDED_OBJECT_CHARACTER = "\ufffc"
+
+# Text is laid out in a fixed-width font: each character is CHAR_WIDTH
+# pixels wide, and lines wrap at the object's width.
+CHAR_WIDTH = 8
+LINE_HEIGHT = 20
+
+
+class FakeError(Exception):
+    """Raised for operations on objects which no longer exist."""
+
+
+#####################################################################
+#                                                                   #
+# Enumerations                                                      #
+#                                                                   #
+#####################################################################
+
+class _EnumType(type):
+    """Enumerations whose members are created on first use, so that every
+    value Orca refers to exists without listing them all here."""
+
+    def __getattr__(cls, name):
+        if not re.fullmatch(r"[A-Z][A-Z0-9_]*", name):
+            raise AttributeError(name)
+        return cls._getMember(name)
+
+    def __call__(cls, value):
+        return cls._byValue[int(value)]
+
+    def __iter__(cls):
+        return iter(sorted(cls._byValue.values()))
+
+
+class _Enum(int, metaclass=_EnumType):
+
+    _prefix = ""
+    _members = {}
+    _byValue = {}
+
+    @classmethod
+    def _getMember(cls, name):
+        member = cls._members.get(name)
+        if member is None:
+            member = int.__new__(cls, len(cls._members))
+            member.value_name = f"{cls._prefix}{name}"
+            member.value_nick = name.lower().replace("_", "-")
+            cls._members[name] = member
+            cls._byValue[int(member)] = member
+        return member
+
+    @classmethod
+    def fromNick(cls, nick):
+        """Returns the member whose value_nick is nick."""
+
+        return cls._getMember(nick.upper().replace("-", "_"))
+
+    def __repr__(self):
+        return f"<enum {self.value_name} of type Atspi.{type(self).__name__}>"
+
+    __str__ = __repr__
+
+
+def _makeEnum(name, prefix, names=()):
+    enum = _EnumType(name, (_Enum,), {"_prefix": prefix, "_members": {}, "_byValue": {}})
+    for member in names:
+        enum._getMember(member)
+    return enum
+
+
+Role = _makeEnum("Role", "ATSPI_ROLE_", ["INVALID"])
+StateType = _makeEnum("StateType", "ATSPI_STATE_", ["INVALID"])
+RelationType = _makeEnum("RelationType", "ATSPI_RELATION_", ["NULL"])
+TextBoundaryType = _makeEnum(
+    "TextBoundaryType", "ATSPI_TEXT_BOUNDARY_",
+    ["CHAR", "WORD_START", "WORD_END", "SENTENCE_START", "SENTENCE_END",
+     "LINE_START", "LINE_END"])
+TextGranularity = _makeEnum(
+    "TextGranularity", "ATSPI_TEXT_GRANULARITY_",
+    ["CHAR", "WORD", "SENTENCE", "LINE", "PARAGRAPH"])
+CollectionMatchType = _makeEnum(
+    "CollectionMatchType", "ATSPI_Collection_MATCH_",
+    ["INVALID", "ALL", "ANY", "NONE", "EMPTY"])
+CollectionSortOrder = _makeEnum(
+    "CollectionSortOrder", "ATSPI_Collection_SORT_ORDER_",
+    ["INVALID", "CANONICAL", "FLOW", "TAB", "REVERSE_CANONICAL", "REVERSE_FLOW",
+     "REVERSE_TAB"])
+CoordType = _makeEnum("CoordType", "ATSPI_COORD_TYPE_", ["SCREEN", "WINDOW", "PARENT"])
+ScrollType = _makeEnum("ScrollType", "ATSPI_SCROLL_")
+ModifierType = _makeEnum("ModifierType", "ATSPI_MODIFIER_")
+KeySynthType = _makeEnum("KeySynthType", "ATSPI_KEY_")
+EventType = _makeEnum(
+    "EventType", "ATSPI_", ["KEY_PRESSED_EVENT", "KEY_RELEASED_EVENT"])
+LocaleType = _makeEnum("LocaleType", "ATSPI_LOCALE_TYPE_")
+TextClipType = _makeEnum("TextClipType", "ATSPI_TEXT_CLIP_")
+ComponentLayer = _makeEnum("ComponentLayer", "ATSPI_LAYER_")
+Cache = _makeEnum("Cache", "ATSPI_CACHE_")
+KeyListenerSyncType = _makeEnum("KeyListenerSyncType", "ATSPI_KEYLISTENER_")
+KeyEventType = _makeEnum("KeyEventType", "ATSPI_")
+
+
+def role_get_name(role):
+    return role.value_nick.replace("-", " ")
+
+
+#####################################################################
+#                                                                   #
+# Simple value types                                                #
+#                                                                   #
+#####################################################################
+
+class StateSet:
+
+    def __init__(self, states=()):
+        self._states = set(states)
+
+    @classmethod
+    def new(cls, states):
+        return cls(states)
+
+    def add(self, state):
+        self._states.add(state)
+
+    def remove(self, state):
+        self._states.discard(state)
+
+    def set_by_name(self, name, enabled):
+        state = StateType.fromNick(name)
+        if enabled:
+            self.add(state)
+        else:
+            self.remove(state)
+
+    def contains(self, state):
+        return state in self._states
+
+    def is_empty(self):
+        return not self._states
+
+    def equals(self, other):
+        return self._states == other._states
+
+    def get_states(self):
+        return sorted(self._states)
+
+    getStates = get_states
+
+    def __contains__(self, state):
+        return state in self._states
+
+
+class Relation:
+
+    def __init__(self, relationType, targets):
+        self._relationType = relationType
+        self._targets = list(targets)
+
+    def get_relation_type(self):
+        return self._relationType
+
+    def get_n_targets(self):
+        return len(self._targets)
+
+    def get_target(self, i):
+        return self._targets[i]
+
+    getRelationType = get_relation_type
+    getNTargets = get_n_targets
+    getTarget = get_target
+
+
+class Rect:
+
+    def __init__(self, x=0, y=0, width=0, height=0):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.width, self.height))
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.width, self.height)[index]
+
+    def __repr__(self):
+        return f"Rect({self.x}, {self.y}, {self.width}, {self.height})"
+
+
+class Point:
+
+    def __init__(self, x=0, y=0):
+        self.x, self.y = x, y
+
+
+class TextRange:
+
+    def __init__(self, content, startOffset, endOffset):
+        self.content = content
+        self.start_offset = startOffset
+        self.end_offset = endOffset
+
+
+class KeyDefinition:
+
+    def __init__(self):
+        self.keycode = 0
+        self.keysym = 0
+        self.keystring = None
+        self.modifiers = 0
+
+
+class DeviceEvent:
+
+    def __init__(self):
+        self.type = None
+        self.id = 0
+        self.hw_code = 0
+        self.modifiers = 0
+        self.timestamp = 0
+        self.event_string = ""
+        self.is_text = False
+
+
+class Event:
+    """An object event, as delivered to event listeners."""
+
+    def __init__(self, eventType, source, detail1=0, detail2=0, any_data=None):
+        self.type = eventType
+        self.source = source
+        self.detail1 = detail1
+        self.detail2 = detail2
+        self.any_data = any_data
+        self.sender = source.get_application() if source is not None else None
+
+    def __repr__(self):
+        return f"Event({self.type}, {self.source}, {self.detail1}, {self.detail2})"
+
+
+#####################################################################
+#                                                                   #
+# Accessible                                                        #
+#                                                                   #
+#####################################################################
+
+_nextId = 0
+
+
+def _newId():
+    global _nextId
+    _nextId += 1
+    return _nextId
+
+
+class Accessible:
+    """An accessible object. Interfaces are supported according to the
+    names in the interfaces argument, e.g. {"Text", "Component"}."""
+
+    def __init__(self, role=None, name="", description="", states=(), attributes=None,
+                 interfaces=(), text=None, extents=None, toolkitName="", toolkitVersion=""):
+        self.id = _newId()
+        self.role = role if role is not None else Role.UNKNOWN
+        self.name = name
+        self.description = description
+        self.states = StateSet(states)
+        self.attributes = dict(attributes or {})
+        self.interfaces = set(interfaces)
+        self.relations = {}
+        self.parent = None
+        self.children = []
+        self.app = None
+        self.toolkitName = toolkitName
+        self.toolkitVersion = toolkitVersion
+        self.pid = 0
+        self.dead = False
+        self.text = ""
+        self.caretOffset = 0
+        self.selections = []
+        self._ranges = {}
+        self._embeddedOffsets = None
+        self.uri = ""
+        self.tableRows = None
+        self.caption = None
+        self.summary = None
+        self.table = None
+        self.tablePosition = None
+        self.rowSpan = 1
+        self.columnSpan = 1
+        self.extents = Rect(*(extents or (0, 0, 0, 0)))
+        self.actions = []
+        self.currentValue = 0.0
+        self.minimumValue = 0.0
+        self.maximumValue = 100.0
+        if text is not None:
+            self.setText(text)
+
+    def __repr__(self):
+        return f"<FakeAccessible {self.id} {self.role.value_nick} '{self.name}'>"
+
+    def _check(self):
+        if self.dead:
+            raise FakeError(f"accessible/{self.id} does not exist")
+
+    #################################################################
+    # Tree construction                                             #
+    #################################################################
+
+    def appendChild(self, child):
+        """Adds child as the last child of this object and returns it."""
+
+        if child.parent is not None:
+            child.parent.children.remove(child)
+        child.parent = self
+        self.children.append(child)
+        child._setApplication(self if self.role == Role.APPLICATION else self.app)
+        return child
+
+    def insertChild(self, index, child):
+        if child.parent is not None:
+            child.parent.children.remove(child)
+        child.parent = self
+        self.children.insert(index, child)
+        child._setApplication(self if self.role == Role.APPLICATION else self.app)
+        return child
+
+    def removeChild(self, child):
+        self.children.remove(child)
+        child.parent = None
+
+    def _setApplication(self, app):
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            obj.app = app if obj.role != Role.APPLICATION else obj
+            stack.extend(obj.children)
+
+    def setText(self, text, caretOffset=None):
+        self.interfaces.add("Text")
+        self.text = text
+        self._ranges = {}
+        self._embeddedOffsets = None
+        if caretOffset is not None:
+            self.caretOffset = caretOffset
+        self.caretOffset = max(0, min(self.caretOffset, len(text)))
+
+    def setTable(self, rows, caption=None, summary=None):
+        """Makes this object a table whose cells are given, row by row, in
+        rows. The cells must already be in the tree; their row and column
+        spans are taken from their rowSpan and columnSpan."""
+
+        self.interfaces.add("Table")
+        self.tableRows = [list(row) for row in rows]
+        self.caption = caption
+        self.summary = summary
+        for r, row in enumerate(self.tableRows):
+            for c, cell in enumerate(row):
+                if cell.table is self:
+                    continue
+                cell.interfaces.add("TableCell")
+                cell.table = self
+                cell.tablePosition = r, c
+
+    def addRelation(self, relationType, targets):
+        self.relations[relationType] = list(targets)
+
+    def iterDescendants(self):
+        stack = list(reversed(self.children))
+        while stack:
+            obj = stack.pop()
+            yield obj
+            stack.extend(reversed(obj.children))
+
+    #################################################################
+    # Atspi.Accessible                                              #
+    #################################################################
+
+    def get_name(self):
+        self._check()
+        return self.name
+
+    def get_description(self):
+        self._check()
+        return self.description
+
+    def get_role(self):
+        self._check()
+        return self.role
+
+    def get_role_name(self):
+        self._check()
+        return role_get_name(self.role)
+
+    get_localized_role_name = get_role_name
+
+    def get_parent(self):
+        self._check()
+        return self.parent
+
+    def get_child_count(self):
+        self._check()
+        return len(self.children)
+
+    def get_child_at_index(self, index):
+        self._check()
+        if 0 <= index < len(self.children):
+            return self.children[index]
+        return None
+
+    def get_index_in_parent(self):
+        self._check()
+        if self.parent is None:
+            return -1
+        return self.parent.children.index(self)
+
+    def get_state_set(self):
+        if self.dead:
+            return StateSet([StateType.DEFUNCT])
+        return StateSet(self.states.get_states())
+
+    def get_relation_set(self):
+        self._check()
+        return [Relation(t, targets) for t, targets in self.relations.items()]
+
+    def get_attributes(self):
+        self._check()
+        return dict(self.attributes)
+
+    def get_attributes_as_array(self):
+        return [f"{key}:{value}" for key, value in self.get_attributes().items()]
+
+    def get_application(self):
+        self._check()
+        return self.app
+
+    def get_toolkit_name(self):
+        self._check()
+        return (self.app or self).toolkitName
+
+    def get_toolkit_version(self):
+        self._check()
+        return (self.app or self).toolkitVersion
+
+    def get_process_id(self):
+        self._check()
+        return (self.app or self).pid
+
+    def get_id(self):
+        return self.id
+
+    def get_object_locale(self):
+        return ""
+
+    def set_cache_mask(self, mask):
+        pass
+
+    def clear_cache(self):
+        pass
+
+    def clear_cache_single(self):
+        pass
+
+    def _getInterface(self, name):
+        self._check()
+        return self if name in self.interfaces else None
+
+    def get_action_iface(self):
+        return self._getInterface("Action")
+
+    def get_collection_iface(self):
+        return self._getInterface("Collection")
+
+    def get_component_iface(self):
+        return self._getInterface("Component")
+
+    def get_document_iface(self):
+        return self._getInterface("Document")
+
+    def get_editable_text_iface(self):
+        return self._getInterface("EditableText")
+
+    def get_hyperlink(self):
+        if self._getInterface("Hyperlink") is None:
+            return None
+        return Hyperlink(self)
+
+    def get_hypertext_iface(self):
+        return self._getInterface("Hypertext")
+
+    def get_image_iface(self):
+        return self._getInterface("Image")
+
+    def get_selection_iface(self):
+        return self._getInterface("Selection")
+
+    def get_table_iface(self):
+        return self._getInterface("Table")
+
+    def get_table_cell(self):
+        return self._getInterface("TableCell")
+
+    def get_text_iface(self):
+        return self._getInterface("Text")
+
+    def get_value_iface(self):
+        return self._getInterface("Value")
+
+    #################################################################
+    # pyatspi-style interface wrappers                              #
+    #################################################################
+
+    def _query(self, name, wrapper):
+        self._check()
+        if name not in self.interfaces:
+            raise NotImplementedError(f"{self} does not implement {name}")
+        return wrapper(self)
+
+    def queryText(self):
+        return self._query("Text", _TextWrapper)
+
+    def queryEditableText(self):
+        return self._query("EditableText", _TextWrapper)
+
+    def queryComponent(self):
+        return self._query("Component", _ComponentWrapper)
+
+    def queryAction(self):
+        return self._query("Action", _ActionWrapper)
+
+    def queryDocument(self):
+        return self._query("Document", _DocumentWrapper)
+
+    def queryValue(self):
+        return self._query("Value", _ValueWrapper)
+
+    def queryImage(self):
+        return self._query("Image", _ImageWrapper)
+
+    def queryHypertext(self):
+        return self._query("Hypertext", _HypertextWrapper)
+
+    def queryHyperlink(self):
+        return self._query("Hyperlink", _HyperlinkWrapper)
+
+    def queryTable(self):
+        return self._query("Table", _TableWrapper)
+
+    def queryTableCell(self):
+        return self._query("TableCell", _TableCellWrapper)
+
+    def querySelection(self):
+        return self._query("Selection", _SelectionWrapper)
+
+
+#####################################################################
+#                                                                   #
+# Interfaces, as static functions on the Accessible                 #
+#                                                                   #
+#####################################################################
+
+def _asBoundaryType(boundary):
+    """Returns boundary, a TextBoundaryType or a TextGranularity, as the
+    equivalent TextBoundaryType."""
+
+    # The members of different enumerations compare equal to each other
+    # if their values are equal, so the type needs to be checked first.
+    if not isinstance(boundary, TextGranularity):
+        return boundary
+
+    return {TextGranularity.CHAR: TextBoundaryType.CHAR,
+            TextGranularity.WORD: TextBoundaryType.WORD_START,
+            TextGranularity.SENTENCE: TextBoundaryType.SENTENCE_START,
+            TextGranularity.LINE: TextBoundaryType.LINE_START,
+            TextGranularity.PARAGRAPH: TextBoundaryType.LINE_START}[boundary]
+
+
+def _wrap(text, start, end, columns):
+    """Returns the (start, end) ranges of the lines into which the line of
+    text from start to end wraps when at most columns characters fit."""
+
+    ranges = []
+    while end - start > columns:
+        brk = text.rfind(" ", start, start + columns)
+        if brk <= start:
+            brk = start + columns - 1
+        ranges.append((start, brk + 1))
+        start = brk + 1
+    ranges.append((start, end))
+    return ranges
+
+
+def _boundaryRanges(text, boundary, columns=0):
+    """Returns the (start, end) ranges into which boundary divides text.
+    Lines also wrap at columns characters, if columns is non-zero."""
+
+    if boundary == TextBoundaryType.CHAR:
+        return [(i, i + 1) for i in range(len(text))]
+    if boundary in (TextBoundaryType.LINE_START, TextBoundaryType.LINE_END):
+        pattern = r"[^\n]*\n?"
+    elif boundary == TextBoundaryType.WORD_START:
+        pattern = r"\s*\S+\s*" if text[:1].isspace() else r"\S+\s*"
+    elif boundary == TextBoundaryType.WORD_END:
+        pattern = r"\s*\S+"
+    elif boundary == TextBoundaryType.SENTENCE_END:
+        pattern = r"\s*[^.!?]+[.!?]*"
+    else:
+        pattern = r"[^.!?]+[.!?]*\s*"
+
+    ranges = [m.span() for m in re.finditer(pattern, text) if m.end() > m.start()]
+    if columns and boundary in (TextBoundaryType.LINE_START, TextBoundaryType.LINE_END):
+        ranges = [line for start, end in ranges for line in _wrap(text, start, end, columns)]
+    return ranges or [(0, len(text))]
+
+
+def _columns(obj):
+    """Returns the number of characters which fit on a line of obj, or 0
+    if obj has no width."""
+
+    return obj.extents.width // CHAR_WIDTH
+
+
+def _ranges(obj, boundary):
+    """Returns the ranges into which boundary divides the text of obj, along
+    with their start offsets. These are cached until the text changes."""
+
+    boundary = _asBoundaryType(boundary)
+    columns = 0
+    if boundary in (TextBoundaryType.LINE_START, TextBoundaryType.LINE_END):
+        columns = _columns(obj)
+
+    key = boundary, columns
+    result = obj._ranges.get(key)
+    if result is None:
+        ranges = _boundaryRanges(obj.text, boundary, columns)
+        result = obj._ranges[key] = ranges, [start for start, _end in ranges]
+    return result
+
+
+def _rangeAtOffset(obj, offset, boundary):
+    text = obj.text
+    ranges, starts = _ranges(obj, boundary)
+    if offset >= len(text):
+        if _asBoundaryType(boundary) == TextBoundaryType.CHAR or not text:
+            return len(text), len(text)
+        return ranges[-1]
+
+    i = bisect.bisect_right(starts, offset) - 1
+    if i >= 0 and ranges[i][0] <= offset < ranges[i][1]:
+        return ranges[i]
+    return offset, offset
+
+
+def _lineAtOffset(obj, offset):
+    """Returns the index and start offset of the line containing offset."""
+
+    _lines, starts = _ranges(obj, TextBoundaryType.LINE_START)
+    i = max(0, bisect.bisect_right(starts, offset) - 1)
+    return i, starts[i]
+
+
+class Text:
+
+    @staticmethod
+    def get_character_count(obj):
+        obj._check()
+        return len(obj.text)
+
+    @staticmethod
+    def get_text(obj, start, end):
+        obj._check()
+        if end == -1:
+            end = len(obj.text)
+        return obj.text[start:end]
+
+    @staticmethod
+    def get_caret_offset(obj):
+        obj._check()
+        return obj.caretOffset
+
+    @staticmethod
+    def set_caret_offset(obj, offset):
+        obj._check()
+        obj.caretOffset = max(0, min(offset, len(obj.text)))
+        return True
+
+    @staticmethod
+    def get_character_at_offset(obj, offset):
+        obj._check()
+        if 0 <= offset < len(obj.text):
+            return ord(obj.text[offset])
+        return 0
+
+    @staticmethod
+    def get_string_at_offset(obj, offset, granularity):
+        obj._check()
+        start, end = _rangeAtOffset(obj, offset, granularity)
+        return TextRange(obj.text[start:end], start, end)
+
+    @staticmethod
+    def get_text_at_offset(obj, offset, boundary):
+        return Text.get_string_at_offset(obj, offset, boundary)
+
+    @staticmethod
+    def get_text_before_offset(obj, offset, boundary):
+        obj._check()
+        start, _end = _rangeAtOffset(obj, offset, boundary)
+        if start == 0:
+            return TextRange("", 0, 0)
+        return Text.get_string_at_offset(obj, start - 1, boundary)
+
+    @staticmethod
+    def get_text_after_offset(obj, offset, boundary):
+        obj._check()
+        _start, end = _rangeAtOffset(obj, offset, boundary)
+        if end >= len(obj.text):
+            return TextRange("", len(obj.text), len(obj.text))
+        return Text.get_string_at_offset(obj, end, boundary)
+
+    @staticmethod
+    def get_n_selections(obj):
+        obj._check()
+        return len(obj.selections)
+
+    @staticmethod
+    def get_selection(obj, selectionNum):
+        obj._check()
+        start, end = obj.selections[selectionNum]
+        return Range(start, end)
+
+    @staticmethod
+    def add_selection(obj, start, end):
+        obj._check()
+        obj.selections.append((start, end))
+        return True
+
+    @staticmethod
+    def set_selection(obj, selectionNum, start, end):
+        obj._check()
+        obj.selections[selectionNum] = (start, end)
+        return True
+
+    @staticmethod
+    def remove_selection(obj, selectionNum):
+        obj._check()
+        del obj.selections[selectionNum]
+        return True
+
+    @staticmethod
+    def get_attribute_run(obj, offset, includeDefaults=True):
+        obj._check()
+        return {}, 0, len(obj.text)
+
+    @staticmethod
+    def get_text_attributes(obj, offset):
+        return Text.get_attribute_run(obj, offset, False)
+
+    @staticmethod
+    def get_default_attributes(obj):
+        obj._check()
+        return {}
+
+    @staticmethod
+    def get_character_extents(obj, offset, coordType):
+        obj._check()
+        rect = obj.extents
+        line, start = _lineAtOffset(obj, offset)
+        return Rect(rect.x + (offset - start) * CHAR_WIDTH, rect.y + line * LINE_HEIGHT,
+                    CHAR_WIDTH, LINE_HEIGHT)
+
+    @staticmethod
+    def get_range_extents(obj, start, end, coordType):
+        first = Text.get_character_extents(obj, start, coordType)
+        last = Text.get_character_extents(obj, max(start, end - 1), coordType)
+        if first.y != last.y:
+            return Rect(obj.extents.x, first.y, obj.extents.width, last.y + last.height - first.y)
+        return Rect(first.x, first.y, last.x + last.width - first.x, first.height)
+
+    @staticmethod
+    def get_offset_at_point(obj, x, y, coordType):
+        obj._check()
+        rect = obj.extents
+        if not obj.text or not Component.contains(obj, x, y, coordType):
+            return -1
+        ranges, _starts = _ranges(obj, TextBoundaryType.LINE_START)
+        start, end = ranges[min(len(ranges) - 1, (y - rect.y) // LINE_HEIGHT)]
+        return min(max(start, end - 1), start + (x - rect.x) // CHAR_WIDTH)
+
+    @staticmethod
+    def scroll_substring_to(obj, start, end, scrollType):
+        return True
+
+    @staticmethod
+    def scroll_substring_to_point(obj, start, end, coordType, x, y):
+        return True
+
+
+class Range:
+
+    def __init__(self, startOffset, endOffset):
+        self.start_offset = startOffset
+        self.end_offset = endOffset
+
+
+class EditableText:
+
+    @staticmethod
+    def insert_text(obj, position, text, length):
+        obj.setText(obj.text[:position] + text[:length] + obj.text[position:])
+        return True
+
+    @staticmethod
+    def delete_text(obj, start, end):
+        obj.setText(obj.text[:start] + obj.text[end:])
+        return True
+
+
+class Component:
+
+    @staticmethod
+    def get_extents(obj, coordType):
+        obj._check()
+        rect = obj.extents
+        return Rect(rect.x, rect.y, rect.width, rect.height)
+
+    @staticmethod
+    def get_position(obj, coordType):
+        rect = Component.get_extents(obj, coordType)
+        return Point(rect.x, rect.y)
+
+    @staticmethod
+    def get_size(obj):
+        rect = Component.get_extents(obj, CoordType.WINDOW)
+        return Point(rect.width, rect.height)
+
+    @staticmethod
+    def contains(obj, x, y, coordType):
+        rect = Component.get_extents(obj, coordType)
+        return rect.x <= x < rect.x + rect.width and rect.y <= y < rect.y + rect.height
+
+    @staticmethod
+    def get_accessible_at_point(obj, x, y, coordType):
+        for child in reversed(obj.children):
+            if "Component" in child.interfaces and Component.contains(child, x, y, coordType):
+                return child
+        return None
+
+    @staticmethod
+    def grab_focus(obj):
+        obj._check()
+        return True
+
+    @staticmethod
+    def scroll_to(obj, scrollType):
+        return True
+
+    @staticmethod
+    def scroll_to_point(obj, coordType, x, y):
+        return True
+
+
+class Action:
+
+    @staticmethod
+    def get_n_actions(obj):
+        obj._check()
+        return len(obj.actions)
+
+    @staticmethod
+    def get_action_name(obj, i):
+        obj._check()
+        return obj.actions[i]
+
+    get_localized_name = get_action_name
+
+    @staticmethod
+    def get_action_description(obj, i):
+        return ""
+
+    @staticmethod
+    def get_key_binding(obj, i):
+        return ""
+
+    @staticmethod
+    def do_action(obj, i):
+        obj._check()
+        return True
+
+
+class Document:
+
+    @staticmethod
+    def get_document_attributes(obj):
+        obj._check()
+        return dict(obj.attributes)
+
+    @staticmethod
+    def get_document_attribute_value(obj, name):
+        return obj.attributes.get(name)
+
+    @staticmethod
+    def get_locale(obj):
+        return ""
+
+
+class Value:
+
+    @staticmethod
+    def get_current_value(obj):
+        obj._check()
+        return obj.currentValue
+
+    @staticmethod
+    def get_minimum_value(obj):
+        return obj.minimumValue
+
+    @staticmethod
+    def get_maximum_value(obj):
+        return obj.maximumValue
+
+    @staticmethod
+    def get_minimum_increment(obj):
+        return 1.0
+
+    @staticmethod
+    def get_text(obj):
+        return ""
+
+    @staticmethod
+    def set_current_value(obj, value):
+        obj.currentValue = value
+        return True
+
+
+class Image:
+
+    @staticmethod
+    def get_image_description(obj):
+        return obj.description
+
+    @staticmethod
+    def get_image_size(obj):
+        return Point(obj.extents.width, obj.extents.height)
+
+    @staticmethod
+    def get_image_extents(obj, coordType):
+        return Component.get_extents(obj, coordType)
+
+
+def _embeddedOffsets(obj):
+    """Returns the offsets of the embedded object characters in the text of
+    obj. The nth of these is the nth child of obj."""
+
+    if obj._embeddedOffsets is None:
+        obj._embeddedOffsets = [m.start() for m in
+                                re.finditer(EMBEDDED_OBJECT_CHARACTER, obj.text)]
+    return obj._embeddedOffsets
+
+
+class Hypertext:
+
+    @staticmethod
+    def get_n_links(obj):
+        obj._check()
+        return min(len(_embeddedOffsets(obj)), len(obj.children))
+
+    @staticmethod
+    def get_link(obj, i):
+        if not 0 <= i < Hypertext.get_n_links(obj):
+            return None
+        return obj.children[i].get_hyperlink()
+
+    @staticmethod
+    def get_link_index(obj, offset):
+        obj._check()
+        offsets = _embeddedOffsets(obj)
+        i = bisect.bisect_left(offsets, offset)
+        if i < min(len(offsets), len(obj.children)) and offsets[i] == offset:
+            return i
+        return -1
+
+
+class Hyperlink:
+    """The hyperlink of an object embedded in its parent's text. As with
+    the real Atspi.Hyperlink, this is a different object from obj."""
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def _offset(self):
+        obj = self._obj
+        obj._check()
+        parent = obj.parent
+        if parent is None:
+            return -1
+        offsets = _embeddedOffsets(parent)
+        index = parent.children.index(obj)
+        if index < len(offsets):
+            return offsets[index]
+        return -1
+
+    def get_start_index(self):
+        return self._offset()
+
+    def get_end_index(self):
+        offset = self._offset()
+        return offset + 1 if offset >= 0 else -1
+
+    def get_n_anchors(self):
+        return 1
+
+    def get_object(self, i):
+        self._obj._check()
+        return self._obj
+
+    def get_uri(self, i):
+        self._obj._check()
+        return self._obj.uri
+
+    def is_valid(self):
+        return not self._obj.dead
+
+
+def _cellAt(obj, row, column):
+    obj._check()
+    rows = obj.tableRows or []
+    if 0 <= row < len(rows) and 0 <= column < len(rows[row]):
+        return rows[row][column]
+    return None
+
+
+class Table:
+
+    @staticmethod
+    def get_n_rows(obj):
+        obj._check()
+        return len(obj.tableRows or [])
+
+    @staticmethod
+    def get_n_columns(obj):
+        obj._check()
+        return max((len(row) for row in obj.tableRows or []), default=0)
+
+    @staticmethod
+    def get_caption(obj):
+        obj._check()
+        return obj.caption
+
+    @staticmethod
+    def get_summary(obj):
+        obj._check()
+        return obj.summary
+
+    @staticmethod
+    def get_accessible_at(obj, row, column):
+        return _cellAt(obj, row, column)
+
+    @staticmethod
+    def get_index_at(obj, row, column):
+        return row * Table.get_n_columns(obj) + column
+
+    @staticmethod
+    def get_row_at_index(obj, index):
+        columns = Table.get_n_columns(obj)
+        return index // columns if columns else -1
+
+    @staticmethod
+    def get_column_at_index(obj, index):
+        columns = Table.get_n_columns(obj)
+        return index % columns if columns else -1
+
+    @staticmethod
+    def get_row_extent_at(obj, row, column):
+        cell = _cellAt(obj, row, column)
+        return cell.rowSpan if cell else 0
+
+    @staticmethod
+    def get_column_extent_at(obj, row, column):
+        cell = _cellAt(obj, row, column)
+        return cell.columnSpan if cell else 0
+
+    @staticmethod
+    def get_row_header(obj, row):
+        cell = _cellAt(obj, row, 0)
+        if cell is not None and cell.role == Role.ROW_HEADER:
+            return cell
+        return None
+
+    @staticmethod
+    def get_column_header(obj, column):
+        cell = _cellAt(obj, 0, column)
+        if cell is not None and cell.role == Role.COLUMN_HEADER:
+            return cell
+        return None
+
+    @staticmethod
+    def get_row_description(obj, row):
+        header = Table.get_row_header(obj, row)
+        return header.name if header else ""
+
+    @staticmethod
+    def get_column_description(obj, column):
+        header = Table.get_column_header(obj, column)
+        return header.name if header else ""
+
+    @staticmethod
+    def is_selected(obj, row, column):
+        cell = _cellAt(obj, row, column)
+        return cell is not None and StateType.SELECTED in cell.states
+
+    @staticmethod
+    def is_row_selected(obj, row):
+        if not 0 <= row < Table.get_n_rows(obj):
+            return False
+        cells = obj.tableRows[row]
+        return bool(cells) and all(StateType.SELECTED in cell.states for cell in cells)
+
+    @staticmethod
+    def is_column_selected(obj, column):
+        cells = [row[column] for row in obj.tableRows or [] if column < len(row)]
+        return bool(cells) and all(StateType.SELECTED in cell.states for cell in cells)
+
+    @staticmethod
+    def get_selected_rows(obj):
+        return [r for r in range(Table.get_n_rows(obj)) if Table.is_row_selected(obj, r)]
+
+    @staticmethod
+    def get_selected_columns(obj):
+        return [c for c in range(Table.get_n_columns(obj)) if Table.is_column_selected(obj, c)]
+
+    @staticmethod
+    def get_n_selected_rows(obj):
+        return len(Table.get_selected_rows(obj))
+
+    @staticmethod
+    def get_n_selected_columns(obj):
+        return len(Table.get_selected_columns(obj))
+
+
+class TableCell:
+
+    @staticmethod
+    def get_table(obj):
+        obj._check()
+        return obj.table
+
+    @staticmethod
+    def get_position(obj):
+        obj._check()
+        if obj.tablePosition is None:
+            return False, -1, -1
+        return True, *obj.tablePosition
+
+    @staticmethod
+    def get_row_span(obj):
+        obj._check()
+        return obj.rowSpan
+
+    @staticmethod
+    def get_column_span(obj):
+        obj._check()
+        return obj.columnSpan
+
+    @staticmethod
+    def get_row_column_span(obj):
+        _success, row, column = TableCell.get_position(obj)
+        return True, row, column, obj.rowSpan, obj.columnSpan
+
+    @staticmethod
+    def get_row_header_cells(obj):
+        _success, row, _column = TableCell.get_position(obj)
+        header = Table.get_row_header(obj.table, row) if obj.table else None
+        return [header] if header not in (None, obj) else []
+
+    @staticmethod
+    def get_column_header_cells(obj):
+        _success, _row, column = TableCell.get_position(obj)
+        header = Table.get_column_header(obj.table, column) if obj.table else None
+        return [header] if header not in (None, obj) else []
+
+
+def _selectableChildren(obj):
+    """Returns the children of obj which can be selected. For tables, these
+    are the cells."""
+
+    obj._check()
+    if obj.tableRows is None:
+        return obj.children
+
+    # A cell which spans several rows or columns is in the grid repeatedly.
+    cells, seen = [], set()
+    for row in obj.tableRows:
+        for cell in row:
+            if cell not in seen:
+                seen.add(cell)
+                cells.append(cell)
+    return cells
+
+
+class Selection:
+
+    @staticmethod
+    def get_n_selected_children(obj):
+        return len(Selection._getSelected(obj))
+
+    @staticmethod
+    def get_selected_child(obj, i):
+        selected = Selection._getSelected(obj)
+        return selected[i] if 0 <= i < len(selected) else None
+
+    @staticmethod
+    def is_child_selected(obj, i):
+        children = _selectableChildren(obj)
+        return 0 <= i < len(children) and StateType.SELECTED in children[i].states
+
+    @staticmethod
+    def select_child(obj, i):
+        children = _selectableChildren(obj)
+        if not 0 <= i < len(children):
+            return False
+        children[i].states.add(StateType.SELECTED)
+        return True
+
+    @staticmethod
+    def deselect_child(obj, i):
+        children = _selectableChildren(obj)
+        if not 0 <= i < len(children):
+            return False
+        children[i].states.remove(StateType.SELECTED)
+        return True
+
+    @staticmethod
+    def deselect_selected_child(obj, i):
+        child = Selection.get_selected_child(obj, i)
+        if child is None:
+            return False
+        child.states.remove(StateType.SELECTED)
+        return True
+
+    @staticmethod
+    def select_all(obj):
+        for child in _selectableChildren(obj):
+            child.states.add(StateType.SELECTED)
+        return True
+
+    @staticmethod
+    def clear_selection(obj):
+        for child in _selectableChildren(obj):
+            child.states.remove(StateType.SELECTED)
+        return True
+
+    @staticmethod
+    def _getSelected(obj):
+        return [x for x in _selectableChildren(obj) if StateType.SELECTED in x.states]
+
+
+class MatchRule:
+    """The criteria for Collection.get_matches(). See Atspi.MatchRule.new."""
+
+    def __init__(self, states, stateMatchType, attributes, attributeMatchType,
+                 roles, roleMatchType, interfaces, interfaceMatchType, invert):
+        self.states = set(states.get_states()) if states is not None else set()
+        self.stateMatchType = stateMatchType
+        self.attributes = self._parseAttributes(attributes or {})
+        self.attributeMatchType = attributeMatchType
+        self.roles = set(roles or [])
+        self.roleMatchType = roleMatchType
+        self.interfaces = {x.lower() for x in interfaces or []}
+        self.interfaceMatchType = interfaceMatchType
+        self.invert = invert
+
+    @classmethod
+    def new(cls, states, stateMatchType, attributes, attributeMatchType,
+            roles, roleMatchType, interfaces, interfaceMatchType, invert):
+        return cls(states, stateMatchType, attributes, attributeMatchType,
+                   roles, roleMatchType, interfaces, interfaceMatchType, invert)
+
+    @staticmethod
+    def _parseAttributes(attributes):
+        """Returns a set of (name, value) pairs. A value of "a:b" matches
+        either "a" or "b"; an escaped colon is part of the value."""
+
+        pairs = set()
+        for name, values in attributes.items():
+            for value in re.split(r"(?<!\\):", values):
+                pairs.add((name, value.replace("\\:", ":")))
+        return pairs
+
+    @staticmethod
+    def _matches(criteria, values, matchType):
+        if not criteria:
+            return True
+        if matchType == CollectionMatchType.ALL:
+            return criteria <= values
+        if matchType == CollectionMatchType.ANY:
+            return bool(criteria & values)
+        if matchType == CollectionMatchType.NONE:
+            return not criteria & values
+        if matchType == CollectionMatchType.EMPTY:
+            return not values
+        return False
+
+    def matches(self, obj):
+        """Returns True if obj matches this rule."""
+
+        result = self._matches(self.roles, {obj.role}, self.roleMatchType) \
+            and self._matches(self.states, set(obj.states.get_states()), self.stateMatchType) \
+            and self._matches(self.interfaces, {x.lower() for x in obj.interfaces},
+                              self.interfaceMatchType) \
+            and self._matches(self.attributes, set(obj.attributes.items()),
+                              self.attributeMatchType)
+        return result != self.invert
+
+
+class Collection:
+
+    @staticmethod
+    def get_matches(obj, rule, sortOrder, count, traverse):
+        """Returns up to count (or all, if count is 0) descendants of obj
+        which match rule, in document order."""
+
+        obj._check()
+        reverse = sortOrder in (CollectionSortOrder.REVERSE_CANONICAL,
+                                CollectionSortOrder.REVERSE_FLOW,
+                                CollectionSortOrder.REVERSE_TAB)
+        descendants = obj.iterDescendants()
+        if reverse:
+            descendants = reversed(list(descendants))
+
+        matches = []
+        for descendant in descendants:
+            if rule.matches(descendant):
+                matches.append(descendant)
+                if len(matches) == count:
+                    break
+        return matches
+
+
+#####################################################################
+#                                                                   #
+# pyatspi-style wrappers                                            #
+#                                                                   #
+#####################################################################
+
+class _Wrapper:
+
+    def __init__(self, obj):
+        self._obj = obj
+
+
+class _TextWrapper(_Wrapper):
+
+    @property
+    def characterCount(self):
+        return Text.get_character_count(self._obj)
+
+    @property
+    def caretOffset(self):
+        return Text.get_caret_offset(self._obj)
+
+    def setCaretOffset(self, offset):
+        return Text.set_caret_offset(self._obj, offset)
+
+    def getText(self, start, end):
+        return Text.get_text(self._obj, start, end)
+
+    def _asTuple(self, textRange):
+        return textRange.content, textRange.start_offset, textRange.end_offset
+
+    def getTextAtOffset(self, offset, boundary):
+        return self._asTuple(Text.get_text_at_offset(self._obj, offset, boundary))
+
+    def getTextBeforeOffset(self, offset, boundary):
+        return self._asTuple(Text.get_text_before_offset(self._obj, offset, boundary))
+
+    def getTextAfterOffset(self, offset, boundary):
+        return self._asTuple(Text.get_text_after_offset(self._obj, offset, boundary))
+
+    def getCharacterAtOffset(self, offset):
+        return Text.get_character_at_offset(self._obj, offset)
+
+    def getNSelections(self):
+        return Text.get_n_selections(self._obj)
+
+    def getSelection(self, selectionNum):
+        selection = Text.get_selection(self._obj, selectionNum)
+        return selection.start_offset, selection.end_offset
+
+    def addSelection(self, start, end):
+        return Text.add_selection(self._obj, start, end)
+
+    def setSelection(self, selectionNum, start, end):
+        return Text.set_selection(self._obj, selectionNum, start, end)
+
+    def removeSelection(self, selectionNum):
+        return Text.remove_selection(self._obj, selectionNum)
+
+    @staticmethod
+    def _attributesAsString(attributes):
+        return "; ".join(f"{key}:{value}" for key, value in attributes.items())
+
+    def getAttributes(self, offset):
+        attributes, start, end = Text.get_text_attributes(self._obj, offset)
+        return self._attributesAsString(attributes), start, end
+
+    def getAttributeRun(self, offset, includeDefaults=True):
+        attributes, start, end = Text.get_attribute_run(self._obj, offset, includeDefaults)
+        return [f"{key}:{value}" for key, value in attributes.items()], start, end
+
+    def getAttributeValue(self, offset, name):
+        attributes, start, end = Text.get_text_attributes(self._obj, offset)
+        return attributes.get(name, ""), start, end, name in attributes
+
+    def getDefaultAttributes(self):
+        return self._attributesAsString(Text.get_default_attributes(self._obj))
+
+    def getDefaultAttributeSet(self):
+        return [f"{key}:{value}" for key, value in
+                Text.get_default_attributes(self._obj).items()]
+
+    def getCharacterExtents(self, offset, coordType):
+        return tuple(Text.get_character_extents(self._obj, offset, coordType))
+
+    def getRangeExtents(self, start, end, coordType):
+        return tuple(Text.get_range_extents(self._obj, start, end, coordType))
+
+    def getOffsetAtPoint(self, x, y, coordType):
+        return Text.get_offset_at_point(self._obj, x, y, coordType)
+
+    def scrollSubstringTo(self, start, end, scrollType):
+        return Text.scroll_substring_to(self._obj, start, end, scrollType)
+
+    def scrollSubstringToPoint(self, start, end, coordType, x, y):
+        return Text.scroll_substring_to_point(self._obj, start, end, coordType, x, y)
+
+    def insertText(self, position, text, length):
+        return EditableText.insert_text(self._obj, position, text, length)
+
+    def deleteText(self, start, end):
+        return EditableText.delete_text(self._obj, start, end)
+
+
+class _ComponentWrapper(_Wrapper):
+
+    def getExtents(self, coordType):
+        return Component.get_extents(self._obj, coordType)
+
+    def getPosition(self, coordType):
+        point = Component.get_position(self._obj, coordType)
+        return point.x, point.y
+
+    def getSize(self):
+        point = Component.get_size(self._obj)
+        return point.x, point.y
+
+    def contains(self, x, y, coordType):
+        return Component.contains(self._obj, x, y, coordType)
+
+    def getAccessibleAtPoint(self, x, y, coordType):
+        return Component.get_accessible_at_point(self._obj, x, y, coordType)
+
+    def grabFocus(self):
+        return Component.grab_focus(self._obj)
+
+
+class _ActionWrapper(_Wrapper):
+
+    @property
+    def nActions(self):
+        return Action.get_n_actions(self._obj)
+
+    def getName(self, i):
+        return Action.get_action_name(self._obj, i)
+
+    def doAction(self, i):
+        return Action.do_action(self._obj, i)
+
+
+class _DocumentWrapper(_Wrapper):
+
+    def getAttributes(self):
+        return [f"{key}:{value}" for key, value in
+                Document.get_document_attributes(self._obj).items()]
+
+    def getAttributeValue(self, name):
+        return Document.get_document_attribute_value(self._obj, name)
+
+    def getLocale(self):
+        return Document.get_locale(self._obj)
+
+
+class _ValueWrapper(_Wrapper):
+
+    @property
+    def currentValue(self):
+        return Value.get_current_value(self._obj)
+
+    @property
+    def minimumValue(self):
+        return Value.get_minimum_value(self._obj)
+
+    @property
+    def maximumValue(self):
+        return Value.get_maximum_value(self._obj)
+
+    @property
+    def minimumIncrement(self):
+        return Value.get_minimum_increment(self._obj)
+
+
+class _ImageWrapper(_Wrapper):
+
+    @property
+    def imageDescription(self):
+        return Image.get_image_description(self._obj)
+
+    def getImageSize(self):
+        point = Image.get_image_size(self._obj)
+        return point.x, point.y
+
+    def getImageExtents(self, coordType):
+        return tuple(Image.get_image_extents(self._obj, coordType))
+
+
+class _HypertextWrapper(_Wrapper):
+
+    def getNLinks(self):
+        return Hypertext.get_n_links(self._obj)
+
+    def getLink(self, i):
+        if not 0 <= i < Hypertext.get_n_links(self._obj):
+            return None
+        return _HyperlinkWrapper(self._obj.children[i])
+
+    def getLinkIndex(self, offset):
+        return Hypertext.get_link_index(self._obj, offset)
+
+
+class _HyperlinkWrapper(_Wrapper):
+
+    @property
+    def startIndex(self):
+        return Hyperlink(self._obj).get_start_index()
+
+    @property
+    def endIndex(self):
+        return Hyperlink(self._obj).get_end_index()
+
+    @property
+    def nAnchors(self):
+        return Hyperlink(self._obj).get_n_anchors()
+
+    def getObject(self, i):
+        return Hyperlink(self._obj).get_object(i)
+
+    def getURI(self, i):
+        return Hyperlink(self._obj).get_uri(i)
+
+
+class _TableWrapper(_Wrapper):
+
+    @property
+    def nRows(self):
+        return Table.get_n_rows(self._obj)
+
+    @property
+    def nColumns(self):
+        return Table.get_n_columns(self._obj)
+
+    @property
+    def caption(self):
+        return Table.get_caption(self._obj)
+
+    @property
+    def summary(self):
+        return Table.get_summary(self._obj)
+
+    @property
+    def nSelectedRows(self):
+        return Table.get_n_selected_rows(self._obj)
+
+    @property
+    def nSelectedColumns(self):
+        return Table.get_n_selected_columns(self._obj)
+
+    def getAccessibleAt(self, row, column):
+        return Table.get_accessible_at(self._obj, row, column)
+
+    def getIndexAt(self, row, column):
+        return Table.get_index_at(self._obj, row, column)
+
+    def getRowAtIndex(self, index):
+        return Table.get_row_at_index(self._obj, index)
+
+    def getColumnAtIndex(self, index):
+        return Table.get_column_at_index(self._obj, index)
+
+    def getRowExtentAt(self, row, column):
+        return Table.get_row_extent_at(self._obj, row, column)
+
+    def getColumnExtentAt(self, row, column):
+        return Table.get_column_extent_at(self._obj, row, column)
+
+    def getRowHeader(self, row):
+        return Table.get_row_header(self._obj, row)
+
+    def getColumnHeader(self, column):
+        return Table.get_column_header(self._obj, column)
+
+    def getRowDescription(self, row):
+        return Table.get_row_description(self._obj, row)
+
+    def getColumnDescription(self, column):
+        return Table.get_column_description(self._obj, column)
+
+    def getSelectedRows(self):
+        return Table.get_selected_rows(self._obj)
+
+    def getSelectedColumns(self):
+        return Table.get_selected_columns(self._obj)
+
+    def isRowSelected(self, row):
+        return Table.is_row_selected(self._obj, row)
+
+    def isColumnSelected(self, column):
+        return Table.is_column_selected(self._obj, column)
+
+    def isSelected(self, row, column):
+        return Table.is_selected(self._obj, row, column)
+
+
+class _TableCellWrapper(_Wrapper):
+
+    @property
+    def table(self):
+        return TableCell.get_table(self._obj)
+
+    @property
+    def position(self):
+        return TableCell.get_position(self._obj)
+
+    @property
+    def rowSpan(self):
+        return TableCell.get_row_span(self._obj)
+
+    @property
+    def columnSpan(self):
+        return TableCell.get_column_span(self._obj)
+
+    @property
+    def rowHeaderCells(self):
+        return TableCell.get_row_header_cells(self._obj)
+
+    @property
+    def columnHeaderCells(self):
+        return TableCell.get_column_header_cells(self._obj)
+
+    def getRowColumnSpan(self):
+        return TableCell.get_row_column_span(self._obj)
+
+
+class _SelectionWrapper(_Wrapper):
+
+    @property
+    def nSelectedChildren(self):
+        return Selection.get_n_selected_children(self._obj)
+
+    def getSelectedChild(self, i):
+        return Selection.get_selected_child(self._obj, i)
+
+    def isChildSelected(self, i):
+        return Selection.is_child_selected(self._obj, i)
+
+    def selectChild(self, i):
+        return Selection.select_child(self._obj, i)
+
+    def deselectChild(self, i):
+        return Selection.deselect_child(self._obj, i)
+
+    def deselectSelectedChild(self, i):
+        return Selection.deselect_selected_child(self._obj, i)
+
+    def selectAll(self):
+        return Selection.select_all(self._obj)
+
+    def clearSelection(self):
+        return Selection.clear_selection(self._obj)
+
+
+#####################################################################
+#                                                                   #
+# Events, devices, and the desktop                                  #
+#                                                                   #
+#####################################################################
+
+class EventListener:
+    """Records which event types are registered. Events are delivered
+    by calling deliver()."""
+
+    listeners = []
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.eventTypes = {}
+
+    @classmethod
+    def new(cls, callback):
+        listener = cls(callback)
+        cls.listeners.append(listener)
+        return listener
+
+    def register(self, eventType):
+        self.eventTypes[eventType] = self.eventTypes.get(eventType, 0) + 1
+        return True
+
+    def deregister(self, eventType):
+        count = self.eventTypes.get(eventType, 0) - 1
+        if count > 0:
+            self.eventTypes[eventType] = count
+        else:
+            self.eventTypes.pop(eventType, None)
+        return True
+
+    def wants(self, eventType):
+        return any(eventType.startswith(x) for x in self.eventTypes)
+
+
+def deliver(event):
+    """Delivers event to each listener registered for its type."""
+
+    for listener in EventListener.listeners:
+        if listener.wants(event.type):
+            listener.callback(event)
+
+
+class Device:
+
+    def __init__(self):
+        self._watchers = {}
+        self._grabs = {}
+        self._nextId = 0
+
+    @classmethod
+    def new(cls):
+        return cls()
+
+    def _newId(self):
+        self._nextId += 1
+        return self._nextId
+
+    def add_key_watcher(self, callback):
+        watcherId = self._newId()
+        self._watchers[watcherId] = callback
+        return watcherId
+
+    def remove_key_watcher(self, watcherId):
+        self._watchers.pop(watcherId, None)
+
+    def add_key_grab(self, keyDefinition, callback=None):
+        grabId = self._newId()
+        self._grabs[grabId] = keyDefinition
+        return grabId
+
+    def remove_key_grab(self, grabId):
+        self._grabs.pop(grabId, None)
+
+    def get_grab_by_id(self, grabId):
+        return self._grabs.get(grabId)
+
+    def map_modifier(self, keycode):
+        return 1 << (8 + keycode % 8)
+
+    def unmap_modifier(self, keycode):
+        pass
+
+    def get_modifier(self, keycode):
+        return 0
+
+    def get_locked_modifiers(self):
+        return 0
+
+    def grab_keyboard(self):
+        return True
+
+    def ungrab_keyboard(self):
+        pass
+
+    def set_app_id(self, appId):
+        pass
+
+    def get_source(self):
+        return None
+
+
+_desktop = Accessible(role=Role.DESKTOP_FRAME, name="main", interfaces={"Component"})
+
+
+def get_desktop(i):
+    return _desktop
+
+
+def get_desktop_count():
+    return 1
+
+
+def set_desktop(desktop):
+    """Replaces the desktop returned by get_desktop()."""
+
+    global _desktop
+    _desktop = desktop
+
+
+def init():
+    return 0
+
+
+def event_main():
+    pass
+
+
+def event_quit():
+    pass
+
+
+def generate_keyboard_event(keyval, keystring, synthType):
+    return True
+
+
+def generate_mouse_event(x, y, name):
+    return True
+
+
+def get_version():
+    return 2, 50, 0
+
+
+#####################################################################
+#                                                                   #
+# Installation                                                      #
+#                                                                   #
+#####################################################################
+
+def install():
+    """Makes `from gi.repository import Atspi` return this module. GLib and
+    the other typelibs still come from gi, which must be installed."""
+
+    import gi
+    import gi.repository
+
+    module = sys.modules[__name__]
+    sys.modules["gi.repository.Atspi"] = module
+    gi.repository.Atspi = module
+
+    # The scripts still use some of the pyatspi interface wrappers, which
+    # pyatspi adds to the real Atspi.Accessible. Those are provided above.
+    sys.modules.setdefault("pyatspi", types.ModuleType("pyatspi"))
+    return module
@@ -0,0 +1,159 @@
+"""An in-process stand-in for the speechd (Speech Dispatcher) Python module.
+
+Its SSIPClient records what Orca sends to it instead of talking to a
+speech-dispatcher daemon, so that orca.speechdispatcherfactory can be
+measured and tested without one.
+
+install() must be called before orca.speechdispatcherfactory is imported:
+
+    import fake_speechd
+    fake_speechd.install()
+    from orca import speechdispatcherfactory
+"""
+
+import sys
+
+
+class PunctuationMode:
+    ALL = "all"
+    MOST = "most"
+    SOME = "some"
+    NONE = "none"
+
+
+class CallbackType:
+    BEGIN = "begin"
+    CANCEL = "cancel"
+    END = "end"
+    INDEX_MARK = "index_mark"
+
+
+class Priority:
+    IMPORTANT = "important"
+    MESSAGE = "message"
+    TEXT = "text"
+    NOTIFICATION = "notification"
+    PROGRESS = "progress"
+
+
+class DataMode:
+    TEXT = "text"
+    SSML = "ssml"
+
+
+class SSIPCommunicationError(Exception):
+    pass
+
+
+class SSIPCommandError(Exception):
+    pass
+
+
+# The voices of each output module, as (name, language, variant) tuples.
+VOICES = {
+    "espeak-ng": [("english", "en", "none"),
+                  ("english-us", "en-US", "none"),
+                  ("german", "de", "none"),
+                  ("french", "fr-FR", "none"),
+                  ("spanish", "es", "none")],
+    "dummy": [("dummy", "en", "none")],
+}
+
+
+class SSIPClient:
+    """Records the text and settings Orca sends, and counts the requests."""
+
+    def __init__(self, name, component=None, **kwargs):
+        self.name = name
+        self.component = component
+        self.outputModule = "espeak-ng"
+        self.language = "en"
+        self.rate = self.pitch = self.volume = 0
+        self.spoken = []
+        self.requests = {}
+
+    def _count(self, request):
+        self.requests[request] = self.requests.get(request, 0) + 1
+
+    def speak(self, text, callback=None, event_types=None):
+        self._count("speak")
+        self.spoken.append(text)
+
+    def char(self, character):
+        self._count("char")
+        self.spoken.append(character)
+
+    def key(self, key):
+        self._count("key")
+        self.spoken.append(key)
+
+    def cancel(self):
+        self._count("cancel")
+
+    def close(self):
+        self._count("close")
+
+    def list_output_modules(self):
+        self._count("list_output_modules")
+        return tuple(VOICES)
+
+    def get_output_module(self):
+        self._count("get_output_module")
+        return self.outputModule
+
+    def set_output_module(self, name):
+        self._count("set_output_module")
+        self.outputModule = name
+
+    def list_synthesis_voices(self, language=None, variant=None):
+        self._count("list_synthesis_voices")
+        return tuple(VOICES.get(self.outputModule, ()))
+
+    def set_synthesis_voice(self, name):
+        self._count("set_synthesis_voice")
+
+    def get_language(self):
+        self._count("get_language")
+        return self.language
+
+    def set_language(self, language):
+        self._count("set_language")
+        self.language = language
+
+    def get_rate(self):
+        return self.rate
+
+    def set_rate(self, rate):
+        self.rate = rate
+
+    def get_pitch(self):
+        return self.pitch
+
+    def set_pitch(self, pitch):
+        self.pitch = pitch
+
+    def get_volume(self):
+        return self.volume
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def set_priority(self, priority):
+        pass
+
+    def set_punctuation(self, mode):
+        self._count("set_punctuation")
+
+    def set_cap_let_recogn(self, style):
+        pass
+
+    def set_data_mode(self, mode):
+        pass
+
+
+def install():
+    """Makes `import speechd` return this module."""
+
+    module = sys.modules[__name__]
+    sys.modules["speechd"] = module
+    return module
@@ -0,0 +1,243 @@
+"""Generates large accessible trees, shaped like a web page in Firefox, from
+the objects in fake_atspi.py. The same seed always produces the same tree.
+
+    import fake_atspi as Atspi
+    import fake_tree
+
+    tree = fake_tree.generate(seed=1, size=10000)
+    Atspi.get_desktop(0).appendChild(tree.app)
+"""
+
+import random
+
+import fake_atspi as Atspi
+
+EOC = Atspi.EMBEDDED_OBJECT_CHARACTER
+
+PAGE_WIDTH = 1280
+TOOLBAR_HEIGHT = 100
+
+COMMON_STATES = [Atspi.StateType.ENABLED,
+                 Atspi.StateType.SENSITIVE,
+                 Atspi.StateType.SHOWING,
+                 Atspi.StateType.VISIBLE]
+
+
+class GeneratedTree:
+    """The objects of a generated tree, grouped by kind."""
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.size = 0
+        self.app = None
+        self.frame = None
+        self.document = None
+        self.headings = []
+        self.paragraphs = []
+        self.links = []
+        self.lists = []
+        self.tables = []
+        self.formFields = []
+
+    def __repr__(self):
+        return (f"<GeneratedTree seed={self.seed} size={self.size} "
+                f"headings={len(self.headings)} paragraphs={len(self.paragraphs)} "
+                f"links={len(self.links)} tables={len(self.tables)}>")
+
+
+class TreeGenerator:
+    """Builds a GeneratedTree. Each block is laid out below the previous one,
+    and the frame is as tall as the document, so every object is on screen."""
+
+    def __init__(self, seed=0, size=10000, textLength=4000):
+        self._random = random.Random(seed)
+        self._size = size
+        self._textLength = textLength
+        self._tree = GeneratedTree(seed)
+        self._words = [self._newWord() for _i in range(2000)]
+        self._y = TOOLBAR_HEIGHT
+
+    def _newWord(self):
+        length = self._random.randint(2, 10)
+        return "".join(self._random.choice("abcdefghijklmnopqrstuvwxyz") for _i in range(length))
+
+    def _phrase(self, count):
+        return " ".join(self._random.choice(self._words) for _i in range(count))
+
+    def _sentence(self):
+        words = self._phrase(self._random.randint(5, 20))
+        return f"{words[0].upper()}{words[1:]}."
+
+    def _new(self, role, name="", states=(), interfaces=(), attributes=None):
+        self._tree.size += 1
+        return Atspi.Accessible(role=role, name=name,
+                                states=COMMON_STATES + list(states),
+                                interfaces={"Component", *interfaces},
+                                attributes=attributes)
+
+    def _layOutText(self, obj, x, width):
+        """Places obj, whose text has been set, at the current position and
+        moves the position below it."""
+
+        obj.extents = Atspi.Rect(x, self._y, width, 0)
+        last = Atspi.Text.get_character_extents(obj, max(0, len(obj.text) - 1),
+                                                Atspi.CoordType.WINDOW)
+        obj.extents.height = last.y + last.height - self._y
+        self._y += obj.extents.height
+
+    def _layOutContainer(self, obj, x, y, width):
+        """Places obj around the children laid out since y."""
+
+        obj.extents = Atspi.Rect(x, y, width, self._y - y)
+
+    def _textBlock(self, parent, role, text, attributes=None):
+        block = parent.appendChild(self._new(role, interfaces={"Text", "Hypertext"},
+                                             attributes=attributes))
+        block.setText(text)
+        self._layOutText(block, parent.extents.x, parent.extents.width)
+        return block
+
+    def _heading(self, parent):
+        level = self._random.randint(1, 6)
+        text = self._phrase(self._random.randint(2, 8))
+        heading = self._textBlock(parent, Atspi.Role.HEADING, text,
+                                  attributes={"level": str(level), "tag": f"h{level}"})
+        self._tree.headings.append(heading)
+
+    def _paragraph(self, parent):
+        length = self._random.randint(self._textLength // 10, self._textLength)
+        pieces, linkTexts = [], []
+        while sum(len(x) for x in pieces) < length:
+            pieces.append(self._sentence())
+            if self._random.random() < 0.3:
+                linkTexts.append(self._phrase(self._random.randint(1, 4)))
+                pieces.append(EOC)
+
+        paragraph = self._textBlock(parent, Atspi.Role.PARAGRAPH, " ".join(pieces))
+        self._tree.paragraphs.append(paragraph)
+
+        offsets = [i for i, char in enumerate(paragraph.text) if char == EOC]
+        for offset, text in zip(offsets, linkTexts):
+            link = paragraph.appendChild(self._new(
+                Atspi.Role.LINK, states=[Atspi.StateType.FOCUSABLE, Atspi.StateType.LINKED],
+                interfaces={"Text", "Hypertext", "Hyperlink", "Action"}))
+            link.setText(text)
+            link.uri = f"https://example.com/{text.replace(' ', '/')}"
+            link.actions = ["jump"]
+            rect = Atspi.Text.get_character_extents(paragraph, offset, Atspi.CoordType.WINDOW)
+            link.extents = Atspi.Rect(rect.x, rect.y, len(text) * Atspi.CHAR_WIDTH, rect.height)
+            self._tree.links.append(link)
+
+    def _list(self, parent):
+        x, y, width = parent.extents.x, self._y, parent.extents.width
+        items = self._random.randint(3, 20)
+        listObj = parent.appendChild(self._new(Atspi.Role.LIST, interfaces={"Text", "Hypertext"},
+                                               attributes={"tag": "ul"}))
+        listObj.extents = Atspi.Rect(x, y, width, 0)
+        listObj.setText(EOC * items)
+        for _i in range(items):
+            self._textBlock(listObj, Atspi.Role.LIST_ITEM, self._sentence())
+        self._layOutContainer(listObj, x, y, width)
+        self._tree.lists.append(listObj)
+
+    def _table(self, parent):
+        x, y, width = parent.extents.x, self._y, parent.extents.width
+        rows, columns = self._random.randint(2, 30), self._random.randint(2, 8)
+        cellWidth = width // columns
+        table = parent.appendChild(self._new(Atspi.Role.TABLE, interfaces={"Selection"},
+                                             attributes={"tag": "table"}))
+        table.extents = Atspi.Rect(x, y, width, 0)
+        grid = []
+        for r in range(rows):
+            row = table.appendChild(self._new(Atspi.Role.TABLE_ROW, attributes={"tag": "tr"}))
+            row.extents = Atspi.Rect(x, self._y, width, Atspi.LINE_HEIGHT)
+            role = Atspi.Role.COLUMN_HEADER if r == 0 else Atspi.Role.TABLE_CELL
+            cells = []
+            for c in range(columns):
+                cell = row.appendChild(self._new(role, interfaces={"Text", "Hypertext"}))
+                cell.setText(self._phrase(self._random.randint(1, 3)))
+                cell.extents = Atspi.Rect(x + c * cellWidth, self._y, cellWidth, Atspi.LINE_HEIGHT)
+                cells.append(cell)
+            grid.append(cells)
+            self._y += Atspi.LINE_HEIGHT
+
+        table.setTable(grid, summary=self._sentence())
+        self._layOutContainer(table, x, y, width)
+        self._tree.tables.append(table)
+
+    def _form(self, parent):
+        x, width = parent.extents.x, parent.extents.width
+        entry = parent.appendChild(self._new(
+            Atspi.Role.ENTRY, name=self._phrase(2),
+            states=[Atspi.StateType.FOCUSABLE, Atspi.StateType.EDITABLE,
+                    Atspi.StateType.SINGLE_LINE],
+            interfaces={"Text", "EditableText", "Hypertext"}))
+        entry.setText(self._phrase(self._random.randint(0, 5)))
+        entry.extents = Atspi.Rect(x, self._y, width // 2, Atspi.LINE_HEIGHT)
+
+        button = parent.appendChild(self._new(
+            Atspi.Role.PUSH_BUTTON, name=self._phrase(1),
+            states=[Atspi.StateType.FOCUSABLE], interfaces={"Action"}))
+        button.actions = ["press"]
+        button.extents = Atspi.Rect(x + width // 2, self._y, width // 4, Atspi.LINE_HEIGHT)
+        self._y += Atspi.LINE_HEIGHT
+        self._tree.formFields.extend([entry, button])
+
+    def _section(self, parent):
+        x, y, width = parent.extents.x, self._y, parent.extents.width
+        section = parent.appendChild(self._new(Atspi.Role.SECTION, interfaces={"Text", "Hypertext"},
+                                               attributes={"tag": "div"}))
+        section.extents = Atspi.Rect(x, y, width, 0)
+        self._heading(section)
+        for _i in range(self._random.randint(1, 6)):
+            choice = self._random.random()
+            if choice < 0.6:
+                self._paragraph(section)
+            elif choice < 0.75:
+                self._list(section)
+            elif choice < 0.9:
+                self._table(section)
+            else:
+                self._form(section)
+
+        section.setText(EOC * len(section.children))
+        self._layOutContainer(section, x, y, width)
+
+    def generate(self):
+        """Returns the new GeneratedTree."""
+
+        tree = self._tree
+        tree.app = self._new(Atspi.Role.APPLICATION, name="Firefox")
+        tree.app.toolkitName = "Gecko"
+        tree.app.toolkitVersion = "115.0"
+        tree.app.pid = 10000 + tree.seed
+
+        tree.frame = tree.app.appendChild(self._new(
+            Atspi.Role.FRAME, name=f"{self._phrase(3)} - Mozilla Firefox",
+            states=[Atspi.StateType.ACTIVE, Atspi.StateType.RESIZABLE]))
+
+        tree.document = tree.frame.appendChild(self._new(
+            Atspi.Role.DOCUMENT_WEB, name=self._phrase(3),
+            states=[Atspi.StateType.FOCUSABLE, Atspi.StateType.READ_ONLY],
+            interfaces={"Text", "Hypertext", "Collection", "Document"},
+            attributes={"DocURL": f"https://example.com/{tree.seed}",
+                        "MimeType": "text/html", "tag": "body"}))
+        tree.document.extents = Atspi.Rect(0, TOOLBAR_HEIGHT, PAGE_WIDTH, 0)
+        tree.frame.addRelation(Atspi.RelationType.EMBEDS, [tree.document])
+        tree.document.addRelation(Atspi.RelationType.EMBEDDED_BY, [tree.frame])
+
+        while tree.size < self._size:
+            self._section(tree.document)
+
+        tree.document.setText(EOC * len(tree.document.children))
+        self._layOutContainer(tree.document, 0, TOOLBAR_HEIGHT, PAGE_WIDTH)
+        tree.frame.extents = Atspi.Rect(0, 0, PAGE_WIDTH, self._y)
+        tree.app.extents = Atspi.Rect(0, 0, PAGE_WIDTH, self._y)
+        return tree
+
+
+def generate(seed=0, size=10000, textLength=4000):
+    """Returns a GeneratedTree with at least size objects. Paragraphs have
+    up to textLength characters."""
+
+    return TreeGenerator(seed, size, textLength).generate()
@@ -0,0 +1,72 @@
+"""Runs Orca in-process against the fake Atspi tree in fake_atspi.py, with
+speech going to a null speech server and no braille display connected, so
+that Orca's own processing can be measured without a desktop.
+
+Import this module before anything from orca, then call start().
+"""
+
+import tempfile
+import time
+
+import fake_atspi
+
+fake_atspi.install()
+
+from orca import orca
+from orca import speech
+from orca import speechserver
+
+
+class NullSpeechServer(speechserver.SpeechServer):
+    """A speech server which only counts what it is asked to say, and
+    notes when (in time.perf_counter seconds) it was first asked."""
+
+    def __init__(self):
+        speechserver.SpeechServer.__init__(self)
+        self.utterances = 0
+        self.firstUtteranceTime = None
+
+    def _count(self):
+        self.utterances += 1
+        if self.firstUtteranceTime is None:
+            self.firstUtteranceTime = time.perf_counter()
+
+    def getInfo(self):
+        return ["Null Speech Server", "null"]
+
+    def speak(self, text=None, acss=None, interrupt=True):
+        self._count()
+
+    def speakCharacter(self, character, acss=None):
+        self._count()
+
+    def speakKeyEvent(self, event, acss=None):
+        self._count()
+
+
+def start(prefsDir=None):
+    """Activates the settings, script, and event managers in-process and
+    returns the event manager. Events are processed synchronously. The
+    user's own settings are not used unless prefsDir points to them."""
+
+    if prefsDir is None:
+        prefsDir = tempfile.mkdtemp(prefix="orca-headless-")
+
+    orca.getSettingsManager().activate(prefsDir)
+    speech._speechserver = NullSpeechServer()
+
+    eventManager = orca.getManager().getEventManager()
+    eventManager._asyncMode = False
+    eventManager.activate()
+    orca.getManager().getScriptManager().activate()
+    return eventManager
+
+
+def stop():
+    orca.getManager().getEventManager().deactivate()
+    orca.getManager().getScriptManager().deactivate()
+    speech._speechserver = None
+
+
+def getSpeechServer():
+    return speech._speechserver
@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+
+"""Replays a recording made by orca.event_recorder (see the
+eventRecordingFile setting) against an in-process fake Atspi tree and
+reports how quickly Orca processed the events.
+
+    replay.py [--repeat N] [--output FILE] [--prefs-dir DIR] recording
+
+The report is JSON. It contains the number of events replayed, the time
+taken, events per second, and the event manager's statistics: counts,
+queue-wait and processing-time histograms per event type (and thus per
+handler) and per script.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import headless
+import fake_atspi as Atspi
+
+
+class ReplayTree:
+    """The fake accessible objects described by the snapshots in a recording."""
+
+    def __init__(self):
+        self._objects = {}
+        self._desktop = Atspi.get_desktop(0)
+
+    def get(self, objectId):
+        """Returns the object with objectId, creating a placeholder if the
+        object has not been described yet."""
+
+        if objectId is None:
+            return None
+
+        obj = self._objects.get(objectId)
+        if obj is None:
+            obj = self._objects[objectId] = Atspi.Accessible()
+        return obj
+
+    def update(self, node):
+        """Updates the object described by node, a snapshot from the recording."""
+
+        obj = self.get(node["id"])
+        obj.role = Atspi.Role.fromNick(node["role"])
+        obj.name = node.get("name") or ""
+        obj.description = node.get("description") or ""
+        obj.states = Atspi.StateSet([Atspi.StateType.fromNick(x) for x in node["states"]])
+        obj.attributes = dict(node.get("attributes") or {})
+        obj.interfaces = set(filter(None, node.get("interfaces", [])))
+        obj.relations = {Atspi.RelationType.fromNick(name): [self.get(x) for x in targets]
+                         for name, targets in node.get("relations", {}).items()}
+        if "extents" in node:
+            obj.extents = Atspi.Rect(*node["extents"])
+        if "text" in node:
+            obj.setText(node["text"], node.get("caret"))
+        if "toolkit" in node:
+            obj.toolkitName = node["toolkit"]
+
+        if obj.role == Atspi.Role.APPLICATION:
+            obj.app = obj
+            if obj not in self._desktop.children:
+                self._desktop.appendChild(obj)
+        else:
+            obj.app = self.get(node.get("app"))
+
+        parent = self.get(node.get("parent"))
+        if parent is not None and obj.parent is not parent:
+            if obj.parent is not None:
+                obj.parent.removeChild(obj)
+            obj.parent = parent
+            if obj not in parent.children:
+                index = node.get("index", -1)
+                if 0 <= index <= len(parent.children):
+                    parent.children.insert(index, obj)
+                else:
+                    parent.children.append(obj)
+
+        if "children" in node:
+            children = [self.get(x) for x in node["children"]]
+            for child in obj.children:
+                if child not in children:
+                    child.parent = None
+            for child in children:
+                child.parent = obj
+                if child.app is None:
+                    child.app = obj.app
+            obj.children = children
+
+    def createEvent(self, record):
+        anyData = record.get("any_data") or {}
+        if "object" in anyData:
+            anyData = self.get(anyData["object"])
+        else:
+            anyData = anyData.get("value")
+
+        return Atspi.Event(record["type"], self.get(record["source"]),
+                           record.get("detail1", 0), record.get("detail2", 0), anyData)
+
+
+def loadRecording(filename):
+    """Returns the list of event records in filename."""
+
+    with open(filename, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != "orca-event-recording":
+            raise ValueError(f"{filename} is not an Orca event recording")
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def replay(records, tree, eventManager):
+    """Replays records against tree, returning the number of seconds spent
+    in Orca."""
+
+    elapsed = 0.0
+    for record in records:
+        for node in record["nodes"]:
+            tree.update(node)
+
+        event = tree.createEvent(record)
+        start = time.perf_counter()
+        Atspi.deliver(event)
+        while not eventManager._eventQueue.empty():
+            eventManager._dequeue()
+        elapsed += time.perf_counter() - start
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recording of AT-SPI events")
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of times to replay the recording")
+    parser.add_argument("--output", help="file to write the report to (default: stdout)")
+    parser.add_argument("--prefs-dir", help="Orca settings directory (default: a new one)")
+    args = parser.parse_args()
+
+    records = loadRecording(args.recording)
+    eventManager = headless.start(args.prefs_dir)
+
+    # Repeated replays reuse the same objects, as would happen if the same
+    # actions were repeated in the same application.
+    tree = ReplayTree()
+    elapsed = 0.0
+    for _i in range(args.repeat):
+        elapsed += replay(records, tree, eventManager)
+
+    count = len(records) * args.repeat
+    report = {
+        "recording": args.recording,
+        "events": count,
+        "seconds": elapsed,
+        "eventsPerSecond": count / elapsed if elapsed else None,
+        "utterances": headless.getSpeechServer().utterances,
+        "statistics": eventManager.getStatistics(),
+    }
+    headless.stop()
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    json.dump(report, output, indent=1, sort_keys=True)
+    output.write("\n")
+    if args.output:
+        output.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
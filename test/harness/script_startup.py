@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+
+"""Times how long Orca takes to start, and to present the first focus in an
+application it has not seen before, without a desktop.
+
+    script_startup.py [--repeat N] [--prewarm] [--output FILE] [--prefs-dir DIR]
+
+Startup is the activation of the settings, event, and script managers (see
+headless.py). Then, for each kind of application, a new application is
+created (see fake_tree.py) and the following are timed separately:
+
+  createScript: ScriptManager._createScript for the application
+  activate: ScriptManager.setActiveScript for the new script
+  firstFocus: setting the locus of focus to an object in the application
+
+The first repetition also includes the cost of importing the script's
+modules, so it is reported on its own. With --prewarm, one application of
+each kind is running at startup and the script manager's prewarming (see
+ScriptManager.prewarmScripts) is done, and timed, before the first
+repetition. The report is JSON.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import fake_atspi as Atspi
+import fake_tree
+
+APPLICATIONS = [("Firefox", "Gecko"), ("gedit", "GTK"), ("unknown", "")]
+TREE_SIZE = 200
+
+
+def newApplication(seed, name, toolkitName):
+    """Returns a new application called name, and an object in it to focus."""
+
+    tree = fake_tree.generate(seed, TREE_SIZE, 400)
+    tree.app.name = name
+    tree.app.toolkitName = toolkitName
+    tree.app.pid = 20000 + seed
+    Atspi.get_desktop(0).appendChild(tree.app)
+    focus = tree.formFields[0] if tree.formFields else tree.document
+    return tree.app, focus
+
+
+def timeApplication(seed, name, toolkitName):
+    """Returns the timings of the first focus in a new application."""
+
+    from orca import orca
+    from orca import orca_state
+
+    scriptManager = orca.getManager().getScriptManager()
+    app, focus = newApplication(seed, name, toolkitName)
+    times = {}
+
+    start = time.perf_counter()
+    script = scriptManager._createScript(app, focus)
+    times["createScript"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scriptManager.setActiveScript(script, "benchmark")
+    times["activate"] = time.perf_counter() - start
+
+    orca_state.activeWindow = app.children[0]
+    start = time.perf_counter()
+    orca.setLocusOfFocus(None, focus)
+    times["firstFocus"] = time.perf_counter() - start
+
+    scriptManager.setActiveScript(None, "benchmark")
+    orca_state.locusOfFocus = None
+    Atspi.get_desktop(0).removeChild(app)
+    return script.name, times
+
+
+def prewarm():
+    """Prewarms the scripts for one application of each kind, as would be
+    done while idle at startup, and returns the time taken."""
+
+    from orca import orca
+
+    scriptManager = orca.getManager().getScriptManager()
+    apps = [newApplication(-1 - i, name, toolkitName)[0]
+            for i, (name, toolkitName) in enumerate(APPLICATIONS)]
+
+    start = time.perf_counter()
+    scriptManager.prewarmScripts()
+    while scriptManager._prewarmNext():
+        pass
+    elapsed = time.perf_counter() - start
+
+    for app in apps:
+        Atspi.get_desktop(0).removeChild(app)
+    return elapsed
+
+
+def summarize(times):
+    return {"min": min(times), "median": statistics.median(times), "max": max(times)}
+
+
+def run(repeat):
+    """Returns the timings for each kind of application."""
+
+    results = {}
+    for index, (name, toolkitName) in enumerate(APPLICATIONS):
+        first = None
+        later = {}
+        for i in range(repeat):
+            scriptName, times = timeApplication(index * repeat + i, name, toolkitName)
+            if first is None:
+                first = times
+                continue
+            for step, value in times.items():
+                later.setdefault(step, []).append(value)
+
+        results[name] = {
+            "script": scriptName,
+            "first": first,
+            "later": {step: summarize(values) for step, values in later.items()},
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Orca's startup and first focus")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="number of new applications of each kind")
+    parser.add_argument("--prewarm", action="store_true",
+                        help="prewarm the scripts before the first repetition")
+    parser.add_argument("--output", help="file to write the report to (default: stdout)")
+    parser.add_argument("--prefs-dir", help="Orca settings directory (default: a new one)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    import headless
+    imported = time.perf_counter()
+    headless.start(args.prefs_dir)
+    started = time.perf_counter()
+
+    report = {
+        "repeat": args.repeat,
+        "startup": {"import": imported - start, "activate": started - imported},
+    }
+    if args.prewarm:
+        report["startup"]["prewarm"] = prewarm()
+    report["applications"] = run(max(1, args.repeat))
+    headless.stop()
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    json.dump(report, output, indent=1, sort_keys=True)
+    output.write("\n")
+    if args.output:
+        output.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+
+"""Times how fast the Speech Dispatcher backend turns text into what it
+sends to speech-dispatcher, without a desktop or a speech-dispatcher daemon.
+
+    speech_benchmark.py [--seed N] [--lines N] [--repeat N]
+                        [--record FILE | --compare FILE]
+                        [--output FILE] [--prefs-dir DIR]
+
+The text is generated from a seed, after some fixed edge cases, and is
+punctuation-heavy: source code, log lines, bulleted lists, ellipses,
+arrows, fractions, and superscript and subscript numbers. Each line is an
+utterance, as in Say All. For each punctuation style, the verbalization of
+the punctuation and the whole of SpeechServer._speak (which also marks the
+words and builds the SSML) are timed, and so is _speak for the same text in
+utterances of about 4000 characters, as for a pasted paragraph. The client
+is the one in fake_speechd.py. The report is JSON, giving the minimum,
+median, and maximum time of each and the characters per second for the
+median.
+
+With --record, the SSML sent for every utterance in every style is written
+to FILE. With --compare, it is compared with a FILE recorded earlier, e.g.
+by another version of Orca, and the utterances which differ are reported.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+import fake_speechd
+
+fake_speechd.install()
+
+import headless
+
+from orca import orca
+from orca import settings
+from orca import speechdispatcherfactory
+
+STYLES = [("none", settings.PUNCTUATION_STYLE_NONE),
+          ("some", settings.PUNCTUATION_STYLE_SOME),
+          ("most", settings.PUNCTUATION_STYLE_MOST),
+          ("all", settings.PUNCTUATION_STYLE_ALL)]
+
+WORDS = ["value", "index", "result", "buffer", "name", "count", "error", "offset",
+         "token", "node", "parent", "child", "state", "queue", "self", "text"]
+
+SYMBOLS = ["•", "◦", "■", "→", "←", "·", "✓",
+           "½", "¼", "⁺", "₋"]
+
+# Lines which the generated ones might not cover: numbers split by spaces,
+# which are marked as one word, markup characters, U+E000 (which is used
+# for the word marks), and leading, trailing, and repeated white space.
+EDGE_CASES = ["1 000 000 people, 2 3 4x 5 6",
+              "  12   34\t56\n78 ",
+              "a < b && c > d; <tag attr=\"&amp;\">",
+              "\ue000word wo\ue000rd \ue000 1\ue0002 3 \ue000",
+              "½ ¼ 3/4 x² H₂O 10⁻³ 4…",
+              "\u00a0non\u00a0breaking\u00a0 \n. \n.line",
+              "trailing space ",
+              "x",
+              " "]
+
+PARAGRAPH_LENGTH = 4000
+
+SUPERSCRIPTS = "⁰¹²³⁴⁵⁶⁷⁸⁹"
+SUBSCRIPTS = "₀₁₂₃₄₅₆₇₈₉"
+
+
+def codeLine(rng):
+    a, b, c, d = (rng.choice(WORDS) for _i in range(4))
+    return rng.choice([
+        f"if ({a}[{rng.randint(0, 99)}] <= {b}->{c} && {d} != \"{a}\") {{",
+        f"    return {a}.{b}({c}, {d}) + {rng.randint(0, 999)}; // {b}'s {c}...",
+        f"{a}_{b} = {{'{c}': [{d}, {rng.random():.3f}], \"{b}\": None}}  # {c}",
+        f"    for ({a} = 0; {a} < {b}.length; {a}++) {c} |= ~{d} ^ 0x{rng.randint(0, 65535):x};",
+        f"}} /* {a} & {b} < {c} > {d} */",
+    ])
+
+
+def logLine(rng):
+    a, b, c = (rng.choice(WORDS) for _i in range(3))
+    return (f"2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+            f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d},"
+            f"{rng.randint(0, 999):03d} [{rng.choice(['INFO', 'WARN', 'ERROR'])}] "
+            f"{a}.{b}: {c} → {rng.randint(0, 100)}% (pid={rng.randint(1, 32767)}) "
+            f"<{a}@{b}.org>…")
+
+
+def proseLine(rng):
+    words = [rng.choice(WORDS) for _i in range(rng.randint(4, 12))]
+    for i in range(len(words)):
+        roll = rng.random()
+        if roll < 0.1:
+            words[i] += rng.choice(SUPERSCRIPTS) + rng.choice(SUPERSCRIPTS)
+        elif roll < 0.2:
+            words[i] += rng.choice(SUBSCRIPTS)
+        elif roll < 0.35:
+            words[i] = rng.choice(SYMBOLS) + " " + words[i]
+        elif roll < 0.45:
+            words[i] += rng.choice([",", ";", ":", "!", "?", "...", " —"])
+    return f"{rng.choice(SYMBOLS)} {' '.join(words)}. {rng.randint(1, 9)}⁄{rng.randint(2, 9)}\n."
+
+
+def generateLines(seed, count):
+    """Returns the edge cases and count lines of text generated from seed."""
+
+    rng = random.Random(seed)
+    kinds = [codeLine, logLine, proseLine]
+    return EDGE_CASES + [rng.choice(kinds)(rng) for _i in range(count)]
+
+
+def paragraphs(lines):
+    """Returns the lines joined into utterances of about PARAGRAPH_LENGTH."""
+
+    result = [""]
+    for line in lines:
+        if len(result[-1]) >= PARAGRAPH_LENGTH:
+            result.append("")
+        result[-1] += line + " "
+    return result
+
+
+def setStyle(server, style):
+    orca.getSettingsManager().setSetting("verbalizePunctuationStyle", style)
+    server.updatePunctuationLevel()
+
+
+def summarize(times, characters):
+    median = statistics.median(times)
+    return {"min": min(times), "median": median, "max": max(times),
+            "charactersPerSecond": characters / median if median else None}
+
+
+def run(server, lines, repeat):
+    """Returns the timings for each punctuation style, and the SSML sent."""
+
+    characters = sum(len(line) for line in lines)
+    longUtterances = paragraphs(lines)
+    addVerbalizedPunctuation = server._SpeechServer__addVerbalizedPunctuation
+    results = {}
+    spoken = {}
+    for name, style in STYLES:
+        setStyle(server, style)
+        punctuationTimes = []
+        speakTimes = []
+        paragraphTimes = []
+        for _i in range(repeat):
+            start = time.perf_counter()
+            for line in lines:
+                addVerbalizedPunctuation(line)
+            punctuationTimes.append(time.perf_counter() - start)
+
+            server._client.spoken = []
+            start = time.perf_counter()
+            for line in lines:
+                server._speak(line, None)
+            speakTimes.append(time.perf_counter() - start)
+            spoken[name] = server._client.spoken
+
+            start = time.perf_counter()
+            for paragraph in longUtterances:
+                server._speak(paragraph, None)
+            paragraphTimes.append(time.perf_counter() - start)
+
+        results[name] = {"punctuation": summarize(punctuationTimes, characters),
+                         "speak": summarize(speakTimes, characters),
+                         "speakParagraphs": summarize(paragraphTimes, characters)}
+
+    return results, spoken
+
+
+def compare(spoken, expected, lines):
+    """Returns the utterances whose SSML differs from the expected SSML."""
+
+    differences = []
+    for name, _style in STYLES:
+        for i, ssml in enumerate(spoken.get(name, [])):
+            expectedSsml = expected.get(name, [])
+            if i >= len(expectedSsml) or expectedSsml[i] != ssml:
+                differences.append({"style": name, "line": i, "text": lines[i], "ssml": ssml,
+                                    "expected": expectedSsml[i] if i < len(expectedSsml) else None})
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the Speech Dispatcher backend")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated text")
+    parser.add_argument("--lines", type=int, default=2000,
+                        help="number of lines (utterances) of text")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of times to speak the text in each style")
+    parser.add_argument("--record", help="file to write the SSML sent to")
+    parser.add_argument("--compare", help="file of SSML recorded earlier to compare with")
+    parser.add_argument("--output", help="file to write the report to (default: stdout)")
+    parser.add_argument("--prefs-dir", help="Orca settings directory (default: a new one)")
+    args = parser.parse_args()
+
+    headless.start(args.prefs_dir)
+    scriptManager = orca.getManager().getScriptManager()
+    scriptManager.setActiveScript(scriptManager.getDefaultScript(), "benchmark")
+    server = speechdispatcherfactory.SpeechServer(
+        speechdispatcherfactory.SpeechServer.DEFAULT_SERVER_ID)
+
+    lines = generateLines(args.seed, args.lines)
+    results, spoken = run(server, lines, max(1, args.repeat))
+    report = {
+        "seed": args.seed,
+        "lines": len(lines),
+        "characters": sum(len(line) for line in lines),
+        "repeat": args.repeat,
+        "styles": results,
+    }
+
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as f:
+            json.dump(spoken, f, indent=0)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            differences = compare(spoken, json.load(f), lines)
+        report["differences"] = len(differences)
+        report["firstDifferences"] = differences[:10]
+
+    server.shutdown()
+    headless.stop()
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    json.dump(report, output, indent=1, sort_keys=True)
+    output.write("\n")
+    if args.output:
+        output.close()
+
+    return 0 if not report.get("differences") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
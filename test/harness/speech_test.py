@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+
+"""Checks what the Speech Dispatcher backend sends to speech-dispatcher,
+without a desktop or a speech-dispatcher daemon. The client is the one in
+fake_speechd.py. speech_ssml.json holds the SSML which Orca sent, before the
+word marks and SSML were built word by word, for a set of utterances in each
+punctuation style.
+
+    python3 speech_test.py [-v]
+"""
+
+import json
+import os
+import re
+import sys
+import unittest
+
+import fake_speechd
+
+fake_speechd.install()
+
+import headless
+
+from orca import orca
+from orca import pronunciation_dict
+from orca import settings
+from orca import speechdispatcherfactory
+
+MARK = re.compile(r'<mark name="(\d+):(\d+)"/>')
+
+SSML_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "speech_ssml.json")
+
+STYLES = [("none", settings.PUNCTUATION_STYLE_NONE),
+          ("some", settings.PUNCTUATION_STYLE_SOME),
+          ("most", settings.PUNCTUATION_STYLE_MOST),
+          ("all", settings.PUNCTUATION_STYLE_ALL)]
+
+
+class SpeechTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        headless.start()
+        scriptManager = orca.getManager().getScriptManager()
+        scriptManager.setActiveScript(scriptManager.getDefaultScript(), "test")
+
+    @classmethod
+    def tearDownClass(cls):
+        headless.stop()
+
+    def setUp(self):
+        self.server = speechdispatcherfactory.SpeechServer(
+            speechdispatcherfactory.SpeechServer.DEFAULT_SERVER_ID)
+        self.server._client.spoken = []
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def speak(self, text):
+        """Returns the text sent for text without the SSML markup, and the
+        words of text which the marks in the SSML are for."""
+
+        self.server._speak(text, None)
+        ssml = self.server._client.spoken[-1]
+        words = [text[int(start):int(end)] for start, end in MARK.findall(ssml)]
+        return MARK.sub("", ssml)[len("<speak>"):-len("</speak>")], words
+
+
+class SSMLTest(SpeechTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with open(SSML_FILE, encoding="utf-8") as f:
+            cls.expected = json.load(f)
+
+    def tearDown(self):
+        orca.getSettingsManager().setSetting(
+            "verbalizePunctuationStyle", settings.PUNCTUATION_STYLE_MOST)
+        super().tearDown()
+
+    def testRecordedSSML(self):
+        utterances = self.expected["utterances"]
+        for name, style in STYLES:
+            orca.getSettingsManager().setSetting("verbalizePunctuationStyle", style)
+            self.server.updatePunctuationLevel()
+            self.server._client.spoken = []
+            for text in utterances:
+                self.server._speak(text, None)
+            self.assertEqual(len(self.server._client.spoken), len(utterances))
+            for text, ssml, expected in zip(utterances, self.server._client.spoken,
+                                            self.expected[name]):
+                with self.subTest(style=name, text=text):
+                    self.assertEqual(ssml, expected)
+
+
+class PronunciationTest(SpeechTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.saved = list(pronunciation_dict.pronunciation_dict.values())
+        pronunciation_dict.clearPronunciations()
+        pronunciation_dict.setPronunciation("new", "knew")
+        pronunciation_dict.setPronunciation("New York", "Nu Yawk")
+        pronunciation_dict.setPronunciation("#tag", "hashtag")
+        pronunciation_dict.setPronunciation("C++", "see plus plus")
+
+    def tearDown(self):
+        pronunciation_dict.clearPronunciations()
+        for word, replacement in self.saved:
+            pronunciation_dict.setPronunciation(word, replacement)
+        super().tearDown()
+
+    def testPhrase(self):
+        text = "I love New York and new things"
+        spoken, words = self.speak(text)
+        self.assertEqual(spoken, "I love Nu Yawk and knew things")
+        self.assertEqual(words, text.split())
+
+    def testPhraseAcrossWhiteSpace(self):
+        text = "new york  new\tYORK"
+        spoken, words = self.speak(text)
+        self.assertEqual(spoken, "Nu Yawk  Nu Yawk")
+        self.assertEqual(words, text.split())
+
+    def testEntryBeginningWithPunctuation(self):
+        text = "see #tag here"
+        spoken, words = self.speak(text)
+        self.assertEqual(spoken, "see hashtag here")
+        self.assertEqual(words, text.split())
+
+    def testEntryEndingWithPunctuation(self):
+        self.assertEqual(self.speak("I use C++.")[0], "I use see plus plus.")
+        self.assertEqual(self.speak("(C++) and C++ code")[0],
+                         "(see plus plus) and see plus plus code")
+
+    def testEntryWithinWord(self):
+        for text in ["C++x", "a#tag", "renew", "newer"]:
+            self.assertEqual(self.speak(text)[0], text)
+
+    def testUnmarkedLine(self):
+        self.assertEqual(pronunciation_dict.adjustLine("New York, new"), "Nu Yawk, knew")
+
+    def testClearedEntries(self):
+        self.assertEqual(pronunciation_dict.adjustLine("new"), "knew")
+        pronunciation_dict.clearPronunciations()
+        pronunciation_dict.setPronunciation("York", "Yawk")
+        self.assertEqual(pronunciation_dict.adjustLine("New York"), "New Yawk")
+
+
+class VoiceCatalogTest(SpeechTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.server._voiceCatalogs = {}
+        self.client = self.server._client
+
+    def failingListSynthesisVoices(self, language=None, variant=None):
+        self.client._count("list_synthesis_voices")
+        raise fake_speechd.SSIPCommandError("failed")
+
+    def testCatalogIsKept(self):
+        voices = self.server._getVoiceCatalog()[0]
+        self.assertTrue(voices)
+        self.assertIs(self.server._getVoiceCatalog()[0], voices)
+        self.assertEqual(self.client.requests["list_synthesis_voices"], 1)
+
+    def testFailedListingIsNotKept(self):
+        self.client.list_synthesis_voices = self.failingListSynthesisVoices
+        self.assertEqual(self.server._getVoiceCatalog()[0], ())
+        del self.client.list_synthesis_voices
+        self.assertTrue(self.server._getVoiceCatalog()[0])
+        self.assertEqual(self.client.requests["list_synthesis_voices"], 2)
+
+    def testMissingListingIsNotKept(self):
+        client = type(self.client)
+        listSynthesisVoices = client.list_synthesis_voices
+        del client.list_synthesis_voices
+        try:
+            self.assertEqual(self.server._getVoiceCatalog()[0], ())
+        finally:
+            client.list_synthesis_voices = listSynthesisVoices
+        self.assertTrue(self.server._getVoiceCatalog()[0])
+
+
+if __name__ == "__main__":
+    sys.exit(unittest.main())
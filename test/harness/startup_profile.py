@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+
+"""Profiles Orca's startup without a desktop: how long each module takes to
+import, and how long it takes until Orca first speaks.
+
+    startup_profile.py [--top N] [--output FILE] [--prefs-dir DIR]
+
+Orca is started in a new Python process, run with -X importtime so that the
+import time of every module is known. In that process, a generated
+application (see fake_tree.py) is running when Orca starts, and, as
+orca.main() does, the window which is active at startup is presented. The
+report is JSON. Its phases are the seconds from the start of the process
+until orca was imported, until the managers were activated (see
+headless.py), and until the first utterance. Its modules are the N modules
+with the largest import time of their own, each with the import time of
+the module and of everything it imported.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+START = time.perf_counter()
+
+
+def child(resultFile, prefsDir):
+    """Starts Orca and writes the times of the startup phases to resultFile."""
+
+    import headless
+    import fake_atspi as Atspi
+    import fake_tree
+    imported = time.perf_counter()
+
+    tree = fake_tree.generate(0, 200, 400)
+    Atspi.get_desktop(0).appendChild(tree.app)
+
+    headless.start(prefsDir)
+    started = time.perf_counter()
+
+    from orca import orca
+    orca.setActiveWindow(tree.frame, tree.app, alsoSetLocusOfFocus=True, notifyScript=True)
+    firstUtterance = headless.getSpeechServer().firstUtteranceTime
+    headless.stop()
+
+    phases = {"import": imported - START, "activate": started - START}
+    if firstUtterance is not None:
+        phases["firstUtterance"] = firstUtterance - START
+
+    with open(resultFile, "w", encoding="utf-8") as f:
+        json.dump(phases, f)
+
+
+def parseImportTimes(lines):
+    """Returns a list of (module, self, cumulative) from -X importtime output,
+    with the times in seconds."""
+
+    modules = []
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        selfTime, cumulative, name = line[len("import time:"):].split("|")
+        try:
+            modules.append((name.strip(), int(selfTime) / 1e6, int(cumulative) / 1e6))
+        except ValueError:
+            continue
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile Orca's startup")
+    parser.add_argument("--top", type=int, default=50,
+                        help="number of modules to report (0 for all)")
+    parser.add_argument("--output", help="file to write the report to (default: stdout)")
+    parser.add_argument("--prefs-dir", help="Orca settings directory (default: a new one)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.prefs_dir)
+        return 0
+
+    fd, resultFile = tempfile.mkstemp(prefix="orca-startup-", suffix=".json")
+    os.close(fd)
+    command = [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child", resultFile]
+    if args.prefs_dir:
+        command += ["--prefs-dir", args.prefs_dir]
+
+    try:
+        process = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                 text=True, check=False)
+        with open(resultFile, encoding="utf-8") as f:
+            phases = json.load(f)
+    except ValueError:
+        sys.stderr.write(process.stderr)
+        return 1
+    finally:
+        os.remove(resultFile)
+
+    modules = sorted(parseImportTimes(process.stderr.splitlines()), key=lambda x: -x[1])
+    orcaModules = [x for x in modules if x[0] == "orca" or x[0].startswith("orca.")]
+    report = {
+        "phases": phases,
+        "orcaModules": len(orcaModules),
+        "orcaImportSelf": sum(x[1] for x in orcaModules),
+        "modules": [{"module": name, "self": selfTime, "cumulative": cumulative}
+                    for name, selfTime, cumulative in modules[:args.top or None]],
+    }
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    json.dump(report, output, indent=1, sort_keys=True)
+    output.write("\n")
+    if args.output:
+        output.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())